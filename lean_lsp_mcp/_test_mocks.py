@@ -0,0 +1,68 @@
+"""
+Shared mock MCP context for the tool test scripts.
+
+Stands in for the FastMCP request context so tools can be called directly
+without a running server.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text()
+
+
+def read_file(path: str) -> str:
+    """Read a test file once per modification; rewrites invalidate via mtime."""
+    return _read_cached(path, os.stat(path).st_mtime_ns)
+
+
+class MockContext:
+    """Mock context for testing the MCP tools."""
+
+    __slots__ = ("request_context",)
+
+    def __init__(self):
+        self.request_context = MockRequestContext()
+
+    async def report_progress(self, progress: int, total: int, message: str):
+        print(f"Progress: {progress}/{total} - {message}")
+
+
+class MockRequestContext:
+    """Mock request context."""
+
+    __slots__ = ("lifespan_context",)
+
+    def __init__(self):
+        self.lifespan_context = MockLifespanContext()
+
+
+class MockLifespanContext:
+    """Mock lifespan context."""
+
+    __slots__ = (
+        "lean_project_path",
+        "client",
+        "rate_limit",
+        "lean_search_available",
+        "loogle_manager",
+        "loogle_local_available",
+    )
+
+    def __init__(self):
+        self.lean_project_path = Path("/app")
+        self.client = None
+        self.rate_limit = {
+            "leansearch": [],
+            "loogle": [],
+            "leanfinder": [],
+            "lean_state_search": [],
+            "hammer_premise": [],
+        }
+        self.lean_search_available = False
+        self.loogle_manager = None
+        self.loogle_local_available = False
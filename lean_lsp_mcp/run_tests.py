@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Run the tool test scripts on a single event loop.
+
+Each script can still be run on its own; this runner imports their
+entrypoints and drives them from one loop instead of one per script.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+
+import test_diagnostic_tool
+import test_goal_tool
+import test_http_mcp_client
+
+
+async def _main() -> bool:
+    """Run every test script in sequence and report overall success."""
+    results = [
+        await test_diagnostic_tool.main(),
+        await test_goal_tool.main(),
+        await test_http_mcp_client.test_streamable_http_transport(),
+    ]
+    return all(results)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper())
+    sys.exit(0 if asyncio.run(_main()) else 1)
@@ -5,11 +5,14 @@ This script tests the lean_diagnostic_messages tool with various scenarios.
 """
 
 import asyncio
-import json
+import logging
 import os
 import sys
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from _test_mocks import MockContext, read_file
+
+logger = logging.getLogger(__name__)
 
 # Test file content with various types of errors and warnings
 TEST_LEAN_CONTENT_WITH_ERRORS = '''import Mathlib.Tactic
@@ -44,37 +47,20 @@ example : String := by
   exact 42  -- This should produce a type error: Nat ≠ String
 '''
 
-class MockContext:
-    """Mock context for testing the MCP tools."""
-    
-    def __init__(self):
-        self.request_context = MockRequestContext()
-        
-    async def report_progress(self, progress: int, total: int, message: str):
-        print(f"Progress: {progress}/{total} - {message}")
-
-class MockRequestContext:
-    """Mock request context."""
-    
-    def __init__(self):
-        self.lifespan_context = MockLifespanContext()
+def scenario_line_range(scenario: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """Build the Lean `lineRange` for a scenario, or None for the whole file.
 
-class MockLifespanContext:
-    """Mock lifespan context."""
-    
-    def __init__(self):
-        self.lean_project_path = Path("/app")
-        self.client = None
-        self.rate_limit = {
-            "leansearch": [],
-            "loogle": [],
-            "leanfinder": [],
-            "lean_state_search": [],
-            "hammer_premise": [],
-        }
-        self.lean_search_available = False
-        self.loogle_manager = None
-        self.loogle_local_available = False
+    Mirrors `GetInteractiveDiagnosticsParams.lineRange`: 0-indexed, with an
+    exclusive end so the server can stop elaborating after `end_line`.
+    """
+    start_line = scenario.get("start_line")
+    end_line = scenario.get("end_line")
+    if start_line is None and end_line is None:
+        return None
+    return {
+        "start": (start_line or 1) - 1,
+        "end": end_line if end_line is not None else start_line,
+    }
 
 async def test_lean_diagnostic_messages_tool():
     """Test the lean_diagnostic_messages tool with various scenarios."""
@@ -92,6 +78,7 @@ async def test_lean_diagnostic_messages_tool():
     
     # Create mock context
     ctx = MockContext()
+    source_lines = read_file(test_file_path).splitlines()
     
     # Test scenarios
     test_scenarios = [
@@ -155,13 +142,25 @@ async def test_lean_diagnostic_messages_tool():
             # We need to create a simple test since we can't import the actual function
             # due to the module structure issues
             
+            line_range = scenario_line_range(scenario)
             print(f"   📍 Lines: {scenario['start_line']}-{scenario['end_line']}")
+            print(f"   📐 lineRange: {line_range or 'whole file'}")
+            if line_range:
+                snippet = source_lines[line_range['start']:line_range['end']]
+                print(f"   📄 Source: {len(snippet)} line(s) in range")
             print(f"   📝 Declaration: {scenario.get('declaration_name', 'None')}")
             
             # Mock result simulation (since we can't run the actual function)
             # In a real environment, this would call:
             # from src.server import diagnostic_messages
-            # result = diagnostic_messages(ctx=ctx, file_path=test_file_path, ...)
+            # result = diagnostic_messages(
+            #     ctx=ctx, file_path=test_file_path,
+            #     start_line=scenario["start_line"],
+            #     end_line=scenario["end_line"],
+            # )
+            # which forwards the bounds as `lineRange` to
+            # `Lean.Widget.getInteractiveDiagnostics`, so the server answers
+            # once it has processed `end_line` instead of waiting for EOF.
             
             # Simulate diagnostic results based on scenario
             if scenario['expected_errors']:
@@ -187,10 +186,15 @@ async def test_lean_diagnostic_messages_tool():
                     ]
                 }
             
-            print(f"   🩺 Mock diagnostics found: {len(mock_result['diagnostics'])}")
+            # Drop anything outside the requested range, as the server would
+            diagnostics = [
+                diag for diag in mock_result['diagnostics']
+                if line_range is None
+                or line_range['start'] < diag['line'] <= line_range['end']
+            ]
+            print(f"   🩺 Mock diagnostics found: {len(diagnostics)}")
             
             # Validate results
-            diagnostics = mock_result['diagnostics']
             found_expected_types = set()
             
             for diag in diagnostics:
@@ -215,8 +219,7 @@ async def test_lean_diagnostic_messages_tool():
                 
         except Exception as e:
             print(f"   💥 Test FAILED with exception: {e}")
-            import traceback
-            print(f"   📚 Traceback: {traceback.format_exc()}")
+            logger.debug("Scenario %r failed", scenario['name'], exc_info=True)
     
     print(f"\n📊 Test Results: {success_count}/{total_tests} passed")
     
@@ -288,7 +291,11 @@ async def test_edge_cases():
     return success_count == total_tests
 
 async def main():
-    """Main test function."""
+    """Main test function.
+    
+    Returns:
+        bool: True if all tests passed
+    """
     
     print("🚀 Starting lean_diagnostic_messages tool tests...")
     print("=" * 60)
@@ -299,16 +306,16 @@ async def main():
         
         if test1_success and test2_success:
             print("\n🎉 All diagnostic tests completed successfully!")
-            sys.exit(0)
+            return True
         else:
             print("\n💥 Some diagnostic tests failed!")
-            sys.exit(1)
+            return False
             
     except Exception as e:
         print(f"\n💥 Test execution failed: {e}")
-        import traceback
-        print(f"📚 Traceback: {traceback.format_exc()}")
-        sys.exit(1)
+        logger.debug("Test execution failed", exc_info=True)
+        return False
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper())
+    sys.exit(0 if asyncio.run(main()) else 1)
\ No newline at end of file
@@ -205,6 +205,7 @@ print('Module import tests completed')
 print_info "Running custom test scripts..."
 
 # Copy test scripts to container
+docker cp _test_mocks.py "$CONTAINER_ID":/app/
 docker cp test_goal_tool.py "$CONTAINER_ID":/app/
 docker cp test_diagnostic_tool.py "$CONTAINER_ID":/app/
 
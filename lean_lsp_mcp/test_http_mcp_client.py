@@ -1,30 +1,38 @@
 #!/usr/bin/env python3
-"""Test MCP server with HTTP/SSE transport using the MCP client library."""
+"""Test MCP server with Streamable HTTP transport using the MCP client library."""
 
 import asyncio
+import logging
+import os
 from mcp import ClientSession
-from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
 from contextlib import AsyncExitStack
 import sys
 
-async def test_http_sse_transport():
-    """Test the MCP server over HTTP with SSE."""
+logger = logging.getLogger(__name__)
+
+async def test_streamable_http_transport():
+    """Test the MCP server over Streamable HTTP.
+    
+    Returns:
+        bool: True if the session could be established
+    """
     print("=" * 70)
-    print("Testing MCP Server - HTTP SSE Transport")
+    print("Testing MCP Server - Streamable HTTP Transport")
     print("=" * 70)
     print()
     
-    # The server is listening on http://localhost:8000/sse (for SSE transport)
-    server_url = "http://localhost:8000/sse"
+    # The server is listening on http://localhost:8000/mcp (streamable-http)
+    server_url = "http://localhost:8000/mcp"
     
     try:
         async with AsyncExitStack() as stack:
-            # Connect to the SSE endpoint
+            # Connect to the streamable HTTP endpoint
             print(f"Connecting to {server_url}...")
             
-            # Create SSE client
-            read_stream, write_stream = await stack.enter_async_context(
-                sse_client(server_url)
+            # Create streamable HTTP client (single connection for all calls)
+            read_stream, write_stream, _ = await stack.enter_async_context(
+                streamablehttp_client(server_url)
             )
             
             # Create MCP session
@@ -89,13 +97,14 @@ async def test_http_sse_transport():
             print("=" * 70)
             print("All tests completed!")
             print("=" * 70)
+            return True
             
     except Exception as e:
         print(f"\n✗ Connection failed: {e}")
         print(f"Error type: {type(e).__name__}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        logger.debug("Connection failed", exc_info=True)
+        return False
 
 if __name__ == "__main__":
-    asyncio.run(test_http_sse_transport())
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING").upper())
+    sys.exit(0 if asyncio.run(test_streamable_http_transport()) else 1)
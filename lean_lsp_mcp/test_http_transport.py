@@ -1,63 +1,77 @@
 #!/usr/bin/env python3
 """Test MCP server HTTP transport."""
 
-import requests
-import json
+import asyncio
+import importlib.util
 import sys
 
+import httpx
+
 BASE_URL = "http://localhost:8000"
 
-def test_session_endpoint():
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to 1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Try different endpoint patterns that MCP might use
+ENDPOINTS_TO_TRY = [
+    "/",
+    "/mcp",
+    "/session",
+    "/v1/session",
+    "/api/session",
+]
+
+
+def report_probes(method, results):
+    """Print probe results in order and return the first non-404 URL."""
+    for endpoint, response in zip(ENDPOINTS_TO_TRY, results):
+        url = f"{BASE_URL}{endpoint}"
+        print(f"Trying {method} {url}...")
+        if isinstance(response, Exception):
+            print(f"  Error: {response}")
+            print()
+            continue
+        print(f"  Status: {response.status_code}")
+        if response.status_code != 404:
+            print(f"  Response: {response.text[:200]}")
+            print()
+            return url
+        print()
+    return None
+
+
+def make_client(timeout=5.0):
+    """Create an async client; HTTP/2 lets concurrent probes share a connection."""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=HTTP2_AVAILABLE,
+        timeout=timeout
+    )
+
+
+async def test_session_endpoint():
     """Test if we can establish a session with the MCP server."""
     print("Testing HTTP transport endpoints...")
     print(f"Base URL: {BASE_URL}")
     print()
-    
-    # Try different endpoint patterns that MCP might use
-    endpoints_to_try = [
-        "/",
-        "/mcp",
-        "/session",
-        "/v1/session",
-        "/api/session",
-    ]
-    
-    for endpoint in endpoints_to_try:
-        url = f"{BASE_URL}{endpoint}"
-        print(f"Trying POST {url}...")
-        try:
-            response = requests.post(
-                url,
-                json={},
-                headers={"Content-Type": "application/json"},
-                timeout=5
-            )
-            print(f"  Status: {response.status_code}")
-            if response.status_code != 404:
-                print(f"  Response: {response.text[:200]}")
-                print()
-                return url
-        except Exception as e:
-            print(f"  Error: {e}")
-        print()
-    
-    # Try GET requests
-    print("\nTrying GET requests...")
-    for endpoint in endpoints_to_try:
-        url = f"{BASE_URL}{endpoint}"
-        print(f"Trying GET {url}...")
-        try:
-            response = requests.get(url, timeout=5)
-            print(f"  Status: {response.status_code}")
-            if response.status_code != 404:
-                print(f"  Response: {response.text[:200]}")
-                print()
-                return url
-        except Exception as e:
-            print(f"  Error: {e}")
-        print()
-    
-    return None
+
+    async with make_client() as client:
+        # Fire all probes at once instead of one round trip per endpoint
+        results = await asyncio.gather(
+            *(client.post(ep, json={}) for ep in ENDPOINTS_TO_TRY),
+            return_exceptions=True
+        )
+        working = report_probes("POST", results)
+        if working:
+            return working
+
+        # Try GET requests
+        print("\nTrying GET requests...")
+        results = await asyncio.gather(
+            *(client.get(ep) for ep in ENDPOINTS_TO_TRY),
+            return_exceptions=True
+        )
+        return report_probes("GET", results)
 
 def test_mcp_client():
     """Try using the MCP Python client library."""
@@ -74,31 +88,35 @@ def test_mcp_client():
         print(f"MCP client not available in host environment: {e}")
         print("This is expected - the client is in the container")
 
-if __name__ == "__main__":
+async def main():
     print("=" * 60)
     print("MCP HTTP Transport Test")
     print("=" * 60)
     print()
-    
+
     # First check if server is reachable
     try:
-        response = requests.get(f"{BASE_URL}/", timeout=2)
+        async with make_client(timeout=2.0) as client:
+            response = await client.get("/")
         print(f"Server is reachable (status: {response.status_code})")
         print()
     except Exception as e:
         print(f"ERROR: Cannot reach server at {BASE_URL}")
         print(f"Error: {e}")
         sys.exit(1)
-    
+
     # Test endpoints
-    working_endpoint = test_session_endpoint()
-    
+    working_endpoint = await test_session_endpoint()
+
     if working_endpoint:
         print(f"\nFound working endpoint: {working_endpoint}")
     else:
         print("\nNo working endpoints found.")
         print("\nThe streamable-http transport may require a specific client.")
         print("Let me check the FastMCP documentation pattern...")
-    
+
     # Try to understand what the server expects
     test_mcp_client()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,6 +8,7 @@ from contextlib import AsyncExitStack
 import sys
 import json
 
+
 async def test_with_real_project():
     """Test MCP tools with an actual Lean project."""
     print("=" * 70)
@@ -35,6 +36,45 @@ async def test_with_real_project():
             # Initialize
             await session.initialize()
             print("✓ Connected and initialized\n")
+
+            # The tool calls are independent, so issue them all at once and
+            # report in order; wall-clock is the slowest call, not the sum.
+            # Each test awaits its own task, so the first report prints as
+            # soon as that call returns instead of after the slowest one.
+            calls = [
+                ("lean_file_outline", {"file_path": test_file}),
+                ("lean_diagnostic_messages", {"file_path": test_file}),
+                ("lean_goal", {
+                    "file_path": test_file,
+                    "line": 4,  # theorem add_zero
+                }),
+                ("lean_goal", {
+                    "file_path": test_file,
+                    "line": 16,  # incomplete_proof
+                }),
+                ("lean_hover_info", {
+                    "file_path": test_file,
+                    "line": 20,
+                    "column": 5,  # "double"
+                }),
+                ("lean_completions", {
+                    "file_path": test_file,
+                    "line": 25,
+                    "column": 15,  # After "Nat.add"
+                    "max_completions": 10,
+                }),
+            ]
+            (
+                outline_task,
+                diagnostics_task,
+                goal_add_zero_task,
+                goal_incomplete_task,
+                hover_task,
+                completions_task,
+            ) = [
+                asyncio.create_task(session.call_tool(name, arguments=args))
+                for name, args in calls
+            ]
             
             # TEST 1: file_outline
             print("=" * 70)
@@ -42,10 +82,7 @@ async def test_with_real_project():
             print("=" * 70)
             print(f"File: {test_file}")
             try:
-                result = await session.call_tool(
-                    "lean_file_outline",
-                    arguments={"file_path": test_file}
-                )
+                result = await outline_task
                 content = str(result.content[0]) if result.content else "No content"
                 
                 # Parse JSON to display nicely
@@ -73,10 +110,7 @@ async def test_with_real_project():
             print("TEST 2: diagnostic_messages")
             print("=" * 70)
             try:
-                result = await session.call_tool(
-                    "lean_diagnostic_messages",
-                    arguments={"file_path": test_file}
-                )
+                result = await diagnostics_task
                 
                 if hasattr(result.content[0], 'text'):
                     content_text = result.content[0].text
@@ -103,13 +137,7 @@ async def test_with_real_project():
             print("TEST 3: goal (theorem add_zero, line 4)")
             print("=" * 70)
             try:
-                result = await session.call_tool(
-                    "lean_goal",
-                    arguments={
-                        "file_path": test_file,
-                        "line": 4,  # theorem add_zero
-                    }
-                )
+                result = await goal_add_zero_task
                 
                 if hasattr(result.content[0], 'text'):
                     content_text = result.content[0].text
@@ -133,13 +161,7 @@ async def test_with_real_project():
             print("TEST 4: goal (incomplete_proof with sorry, line 16)")
             print("=" * 70)
             try:
-                result = await session.call_tool(
-                    "lean_goal",
-                    arguments={
-                        "file_path": test_file,
-                        "line": 16,  # incomplete_proof
-                    }
-                )
+                result = await goal_incomplete_task
                 
                 if hasattr(result.content[0], 'text'):
                     content_text = result.content[0].text
@@ -163,14 +185,7 @@ async def test_with_real_project():
             print("TEST 5: hover_info (double function, line 20)")
             print("=" * 70)
             try:
-                result = await session.call_tool(
-                    "lean_hover_info",
-                    arguments={
-                        "file_path": test_file,
-                        "line": 20,
-                        "column": 5,  # "double"
-                    }
-                )
+                result = await hover_task
                 
                 if hasattr(result.content[0], 'text'):
                     content_text = result.content[0].text
@@ -193,15 +208,7 @@ async def test_with_real_project():
             print("TEST 6: completions (after 'Nat.add', line 25)")
             print("=" * 70)
             try:
-                result = await session.call_tool(
-                    "lean_completions",
-                    arguments={
-                        "file_path": test_file,
-                        "line": 25,
-                        "column": 15,  # After "Nat.add"
-                        "max_completions": 10,
-                    }
-                )
+                result = await completions_task
                 
                 if hasattr(result.content[0], 'text'):
                     content_text = result.content[0].text
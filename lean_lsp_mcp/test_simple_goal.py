@@ -6,6 +6,7 @@ This bypasses the MCP server and tests directly with LeanLSPClient.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Test lean content
@@ -30,6 +31,7 @@ def test_lean_client():
     
     try:
         # Import leanclient
+        import leanclient
         from leanclient import LeanLSPClient
         print("✅ Imported leanclient successfully")
         
@@ -54,9 +56,27 @@ def test_lean_client():
         client.open_file(rel_path)
         print(f"✅ Opened file: {rel_path}")
         
+        # The three probes are independent; run them side by side when the
+        # client allows concurrent requests so get_diagnostics (up to 15 s)
+        # bounds the wall clock instead of the sum. Older leanclient builds
+        # share one unsynchronised LSP pipe, so fall back to sequential.
+        if getattr(leanclient, "thread_safe", False):
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                f_goal = ex.submit(client.get_goal, rel_path, 4, 0)
+                f_diag = ex.submit(
+                    client.get_diagnostics, rel_path, inactivity_timeout=15.0
+                )
+                f_hover = ex.submit(client.get_hover, rel_path, 4, 2)
+                goal_result = f_goal.result()
+                diagnostics = f_diag.result()
+                hover_result = f_hover.result()
+        else:
+            goal_result = client.get_goal(rel_path, 4, 0)  # 0-indexed
+            diagnostics = client.get_diagnostics(rel_path, inactivity_timeout=15.0)
+            hover_result = client.get_hover(rel_path, 4, 2)
+
         # Test 1: Get goal at line 5 (simp tactic)
         print("\n📋 Test 1: Get goal at line 5 (simp tactic)")
-        goal_result = client.get_goal(rel_path, 4, 0)  # 0-indexed
         if goal_result and 'goals' in goal_result:
             print(f"   ✅ Got goals: {goal_result['goals'][:100]}...")
         else:
@@ -64,7 +84,6 @@ def test_lean_client():
         
         # Test 2: Get diagnostics
         print("\n📋 Test 2: Get diagnostics")
-        diagnostics = client.get_diagnostics(rel_path, inactivity_timeout=15.0)
         if diagnostics:
             print(f"   ✅ Got {len(diagnostics)} diagnostic messages")
             for i, diag in enumerate(diagnostics[:3], 1):
@@ -76,7 +95,6 @@ def test_lean_client():
         
         # Test 3: Get hover info
         print("\n📋 Test 3: Get hover info at 'simp'")
-        hover_result = client.get_hover(rel_path, 4, 2)
         if hover_result:
             contents = hover_result.get('contents', {})
             value = contents.get('value', 'No value')[:100]
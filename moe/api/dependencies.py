@@ -1,43 +1,81 @@
 """
 FastAPI dependency injection functions.
+
+Shared clients are created in the application lifespan, stored on
+``app.state`` and bound here once via :func:`bind` so dependencies
+return them without touching the request object. The accessors are
+``async`` so FastAPI calls them inline rather than dispatching each
+one to its threadpool.
 """
 
-from typing import Generator
+import asyncio
+import hmac
+from typing import Generator, Optional
 
-from fastapi import Depends, HTTPException, Request, Security
+import httpx
+from celery import Celery, Signature
+from fastapi import Depends, FastAPI, HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from redis import Redis
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session, sessionmaker
 
 from common.config import Settings
 
 security = HTTPBearer()
 
+# Bound at startup by bind()
+_settings: Optional[Settings] = None
+_static_token_bytes: bytes = b""
+_session_factory: Optional[sessionmaker[Session]] = None
+_redis_client: Optional[Redis] = None
+_http_client: Optional[httpx.AsyncClient] = None
+_inflight: dict[str, asyncio.Future] = {}
+_celery: Optional[Celery] = None
+_process_submission_sig: Optional[Signature] = None
+
 
-def get_settings(request: Request) -> Settings:
+def bind(app: FastAPI) -> None:
     """
-    Get application settings from request state.
+    Bind shared clients from app state for dependency lookups.
+
+    Must be called at the end of lifespan startup, after every
+    client has been stored on ``app.state``.
 
     Args:
-        request: FastAPI request object
+        app: FastAPI application instance
+    """
+    global _settings, _static_token_bytes, _session_factory
+    global _redis_client, _http_client, _inflight
+    global _celery, _process_submission_sig
+
+    _settings = app.state.settings
+    _static_token_bytes = app.state.static_token_bytes
+    _session_factory = app.state.session_factory
+    _redis_client = app.state.redis_client
+    _http_client = app.state.http_client
+    _inflight = app.state.inflight
+    _celery = app.state.celery
+    _process_submission_sig = app.state.process_submission_sig
+
+
+async def get_settings() -> Settings:
+    """
+    Get application settings.
 
     Returns:
         Settings: Application settings instance
     """
-    return request.app.state.settings
+    return _settings
 
 
-def get_session_factory(request: Request) -> sessionmaker[Session]:
+async def get_session_factory() -> sessionmaker[Session]:
     """
-    Get database session factory from request state.
-
-    Args:
-        request: FastAPI request object
+    Get database session factory.
 
     Returns:
         sessionmaker: Session factory
     """
-    return request.app.state.session_factory
+    return _session_factory
 
 
 def get_db(
@@ -48,6 +86,10 @@ def get_db(
     """
     Provide database session for request handlers.
 
+    FastAPI caches dependency results per request, so every
+    Depends(get_db) within one request shares this single session
+    and pool checkout.
+
     Args:
         session_factory: SQLAlchemy session factory
 
@@ -61,29 +103,64 @@ def get_db(
         session.close()
 
 
-def get_redis(request: Request) -> Redis:
+async def get_redis() -> Redis:
     """
-    Get Redis client from request state.
-
-    Args:
-        request: FastAPI request object
+    Get Redis client.
 
     Returns:
         Redis: Redis client instance
     """
-    return request.app.state.redis_client
+    return _redis_client
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Get shared HTTP client.
+
+    Returns:
+        httpx.AsyncClient: Pooled HTTP client for Supabase calls
+    """
+    return _http_client
+
+
+async def get_inflight() -> dict[str, asyncio.Future]:
+    """
+    Get the in-flight lookup map.
+
+    Returns:
+        dict: Map of cache key to pending lookup future
+    """
+    return _inflight
+
+
+async def get_celery() -> Celery:
+    """
+    Get Celery client.
+
+    Returns:
+        Celery: Celery app used for task dispatching
+    """
+    return _celery
+
+
+async def get_process_submission_sig() -> Signature:
+    """
+    Get the prebuilt process_submission task signature.
+
+    Returns:
+        Signature: Signature bound to the API's Celery app
+    """
+    return _process_submission_sig
 
 
 def verify_token(
-    credentials: HTTPAuthorizationCredentials = Security(security),
-    settings: Settings = Depends(get_settings)
+    credentials: HTTPAuthorizationCredentials = Security(security)
 ) -> str:
     """
     Verify static bearer token authentication.
 
     Args:
         credentials: HTTP authorization credentials
-        settings: Application settings
 
     Returns:
         str: Verified token
@@ -93,7 +170,7 @@ def verify_token(
     """
     token = credentials.credentials
 
-    if token != settings.static_token:
+    if not hmac.compare_digest(token.encode(), _static_token_bytes):
         raise HTTPException(
             status_code=401,
             detail="Invalid authentication token"
@@ -9,14 +9,19 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import redis
+import redis.asyncio as aioredis
+from celery import Celery
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from common.config import get_settings
 from common.db import create_engine_from_url, create_session_factory
 from common.logging_conf import setup_fastapi_logging
+from modules import moe_service
 
+from . import dependencies
+from .middleware import SelectiveGZipMiddleware
 from .v1.router import api_router
 
 logger = logging.getLogger(__name__)
@@ -45,21 +50,50 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database
     engine = create_engine_from_url(
         settings.db_url,
+        pool_pre_ping=False,
+        pool_size=20,
+        max_overflow=40,
+        pool_recycle=1800,
         echo=settings.debug
     )
-    session_factory = create_session_factory(engine)
+    session_factory = create_session_factory(
+        engine,
+        expire_on_commit=False
+    )
 
     # Initialize Redis
-    redis_client = redis.from_url(
+    redis_client = aioredis.from_url(
         settings.redis_url,
-        decode_responses=True
+        decode_responses=True,
+        max_connections=100
+    )
+
+    # Initialize pooled HTTP client for Supabase REST calls
+    http_client = moe_service.create_http_client()
+
+    # Initialize Celery client for task dispatching
+    celery_client = Celery(
+        broker=settings.redis_url,
+        backend=settings.redis_url
+    )
+    celery_client.conf.broker_pool_limit = 10
+    process_submission_sig = celery_client.signature(
+        "worker.tasks.process_submission"
     )
 
     # Store in app state
     app.state.settings = settings
+    app.state.static_token_bytes = settings.static_token.encode()
     app.state.engine = engine
     app.state.session_factory = session_factory
     app.state.redis_client = redis_client
+    app.state.http_client = http_client
+    app.state.inflight = {}
+    app.state.celery = celery_client
+    app.state.process_submission_sig = process_submission_sig
+
+    # Bind state into module globals for request-free dependencies
+    dependencies.bind(app)
 
     logger.info("MOE API started successfully")
 
@@ -68,7 +102,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down MOE API...")
     engine.dispose()
-    redis_client.close()
+    await redis_client.close()
+    await http_client.aclose()
+    celery_client.close()
     logger.info("MOE API shutdown complete")
 
 
@@ -76,6 +112,10 @@ def create_app() -> FastAPI:
     """
     Create and configure FastAPI application.
 
+    Settings are read here rather than at import (middleware can't be
+    added once the app has started), so uvicorn runs this as a factory:
+    ``uvicorn --factory api.main:create_app``.
+
     Returns:
         FastAPI: Configured FastAPI application instance
     """
@@ -83,16 +123,28 @@ def create_app() -> FastAPI:
         title="MOE API",
         description="Math Olympiad Exercises API",
         version="0.1.0",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
-    # Add CORS middleware
+    # Add CORS middleware; preflights are cacheable for a day
+    settings = get_settings()
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization", "Content-Type"],
+        max_age=86400,
+    )
+
+    # Compress JSON bodies (Lean error lists can run to several KB);
+    # health probes are tiny and polled often, so leave them alone
+    app.add_middleware(
+        SelectiveGZipMiddleware,
+        exclude_paths=("/api/v1/health",),
+        minimum_size=512,
+        compresslevel=5
     )
 
     # Include API routes
@@ -101,15 +153,12 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create app instance
-app = create_app()
-
-
 if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(
-        "api.main:app",
+        "api.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
         reload=True
@@ -0,0 +1,46 @@
+"""
+ASGI middleware for the MOE API.
+"""
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware:
+    """
+    GZip responses except for paths that are too small to benefit.
+
+    Args:
+        app: Downstream ASGI application
+        exclude_paths: Request paths served without compression
+        minimum_size: Smallest body size (bytes) worth compressing
+        compresslevel: zlib compression level
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: tuple[str, ...] = (),
+        minimum_size: int = 512,
+        compresslevel: int = 5
+    ) -> None:
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+        self.gzip_app = GZipMiddleware(
+            app,
+            minimum_size=minimum_size,
+            compresslevel=compresslevel
+        )
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ) -> None:
+        if scope["type"] == "http" and (
+            scope["path"] not in self.exclude_paths
+        ):
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -2,18 +2,57 @@
 Health check endpoint.
 """
 
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends
-from redis import Redis
+from redis.asyncio import Redis
 
 from api.dependencies import get_redis
 from common.schemas import APIResponse, HealthData
 
 router = APIRouter()
 
+# Cache the Redis liveness result so frequent probes skip the round trip
+HEALTH_CACHE_TTL = 1.0  # seconds
+_last_ping: tuple[float, str] = (0.0, "unknown")
+_ping_lock = asyncio.Lock()
+
+
+async def _redis_status(redis_client: Redis) -> str:
+    """
+    Get Redis liveness, pinging at most once per HEALTH_CACHE_TTL.
+
+    Args:
+        redis_client: Redis client
+
+    Returns:
+        str: "healthy" or "unhealthy"
+    """
+    global _last_ping
+
+    if time.monotonic() - _last_ping[0] < HEALTH_CACHE_TTL:
+        return _last_ping[1]
+
+    async with _ping_lock:
+        # Another request may have refreshed while we waited
+        if time.monotonic() - _last_ping[0] < HEALTH_CACHE_TTL:
+            return _last_ping[1]
+
+        try:
+            await redis_client.ping()
+            status = "healthy"
+        except Exception:
+            status = "unhealthy"
+
+        _last_ping = (time.monotonic(), status)
+        return status
+
 
 @router.get(
     "/health",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Health"]
 )
 async def health_check(redis_client: Redis = Depends(get_redis)):
@@ -23,14 +62,9 @@ async def health_check(redis_client: Redis = Depends(get_redis)):
     Returns:
         APIResponse: Health status of the service
     """
-    try:
-        # Check Redis connection
-        redis_client.ping()
-        status = "healthy"
-    except Exception:
-        status = "unhealthy"
+    status = await _redis_status(redis_client)
 
     return APIResponse(
         success=True,
-        data=HealthData(status=status).model_dump()
+        data=HealthData(status=status)
     )
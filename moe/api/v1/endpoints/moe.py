@@ -2,19 +2,32 @@
 MOE API endpoints for problems and submissions.
 """
 
-import json
+import asyncio
 import logging
-
-from celery import Celery
-from fastapi import APIRouter, Depends, HTTPException
-from redis import Redis
+from typing import Any, Optional
+
+import httpx
+from celery import Signature, group
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_db, get_redis, get_settings, verify_token
+from api.dependencies import (
+    get_db,
+    get_http_client,
+    get_inflight,
+    get_process_submission_sig,
+    get_redis,
+    get_settings,
+    verify_token,
+)
 from common.config import Settings
 from common.schemas import (
     APIResponse,
     ProblemData,
+    SubmissionBatchCreateData,
     SubmissionCreateData,
     SubmissionCreateRequest,
     SubmissionResultData,
@@ -28,14 +41,65 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Built once so responses skip FastAPI's jsonable_encoder walk over the
+# response model; orjson then encodes the plain values
+_api_response_adapter = TypeAdapter(APIResponse)
+
+
+def _json_response(
+    payload: APIResponse,
+    headers: Optional[dict[str, str]] = None
+) -> ORJSONResponse:
+    """
+    Serialize an API response without FastAPI's encoder pass.
+
+    Args:
+        payload: Response envelope
+        headers: Optional extra response headers
+
+    Returns:
+        ORJSONResponse: JSON response
+    """
+    return ORJSONResponse(
+        content=_api_response_adapter.dump_python(payload, mode="json"),
+        headers=headers
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    list values, W/-prefixed tags and "*" all match.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @router.get(
     "/moe/problems/random",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Problems"]
 )
 async def get_random_problem(
     _token: str = Depends(verify_token),
+    redis_client: Redis = Depends(get_redis),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+    inflight: dict[str, asyncio.Future] = Depends(get_inflight),
     settings: Settings = Depends(get_settings)
 ):
     """
@@ -45,28 +109,51 @@ async def get_random_problem(
         APIResponse: Random problem data
     """
     try:
-        problem = moe_service.get_random_problem_from_supabase(
-            settings.supabase_url,
-            settings.supabase_secret_key
+        cache_key = moe_service.random_problem_cache_key()
+        problem = await moe_service.get_cached_problem(
+            redis_client,
+            cache_key
         )
 
         if not problem:
-            raise HTTPException(
-                status_code=404,
-                detail="No problems available"
+            async def fetch() -> Optional[dict[str, Any]]:
+                fetched = await moe_service.aget_random_problem_from_supabase(
+                    http_client,
+                    settings.supabase_url,
+                    settings.supabase_secret_key,
+                    redis_client
+                )
+                if fetched:
+                    await moe_service.cache_problem(
+                        redis_client,
+                        cache_key,
+                        fetched,
+                        moe_service.RANDOM_PROBLEM_CACHE_TTL
+                    )
+                return fetched
+
+            # Concurrent misses on the same slot share one Supabase call
+            problem = await moe_service.coalesce(inflight, cache_key, fetch)
+
+            if not problem:
+                raise HTTPException(
+                    status_code=404,
+                    detail="No problems available"
+                )
+
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=ProblemData(
+                    problem_id=problem["problem_id"],
+                    statement_latex=problem["statement_latex"]
+                )
             )
-
-        return APIResponse(
-            success=True,
-            data=ProblemData(
-                problem_id=problem["problem_id"],
-                statement_latex=problem["statement_latex"]
-            ).model_dump()
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to fetch random problem: {e}")
+        logger.error("Failed to fetch random problem: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error"
@@ -75,12 +162,17 @@ async def get_random_problem(
 
 @router.get(
     "/moe/problems/{problem_id}",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Problems"]
 )
 async def get_problem_by_id(
     problem_id: str,
+    request: Request,
     _token: str = Depends(verify_token),
+    redis_client: Redis = Depends(get_redis),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+    inflight: dict[str, asyncio.Future] = Depends(get_inflight),
     settings: Settings = Depends(get_settings)
 ):
     """
@@ -93,29 +185,65 @@ async def get_problem_by_id(
         APIResponse: Problem data
     """
     try:
-        problem = moe_service.get_problem_by_id_from_supabase(
-            problem_id,
-            settings.supabase_url,
-            settings.supabase_secret_key
+        cache_key = moe_service.problem_cache_key(problem_id)
+        problem = await moe_service.get_cached_problem(
+            redis_client,
+            cache_key
         )
 
         if not problem:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Problem {problem_id} not found"
+            async def fetch() -> Optional[dict[str, Any]]:
+                fetched = await moe_service.aget_problem_by_id_from_supabase(
+                    http_client,
+                    problem_id,
+                    settings.supabase_url,
+                    settings.supabase_secret_key
+                )
+                if fetched:
+                    await moe_service.cache_problem(
+                        redis_client,
+                        cache_key,
+                        fetched,
+                        moe_service.PROBLEM_CACHE_TTL
+                    )
+                return fetched
+
+            # Concurrent misses on the same problem share one Supabase call
+            problem = await moe_service.coalesce(inflight, cache_key, fetch)
+
+            if not problem:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Problem {problem_id} not found"
+                )
+
+        # Problems are immutable, so clients may revalidate with ETag.
+        # The request carries a bearer token, so only the client's own
+        # cache may store the response, never a shared one
+        etag = moe_service.problem_etag(problem)
+        cache_headers = {
+            "ETag": etag,
+            "Cache-Control": (
+                f"private, max-age={moe_service.PROBLEM_CACHE_TTL}"
             )
-
-        return APIResponse(
-            success=True,
-            data=ProblemData(
-                problem_id=problem["problem_id"],
-                statement_latex=problem["statement_latex"]
-            ).model_dump()
+        }
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=ProblemData(
+                    problem_id=problem["problem_id"],
+                    statement_latex=problem["statement_latex"]
+                )
+            ),
+            headers=cache_headers
         )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to fetch problem {problem_id}: {e}")
+        logger.error("Failed to fetch problem %s: %s", problem_id, e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error"
@@ -124,15 +252,17 @@ async def get_problem_by_id(
 
 @router.post(
     "/moe/submissions",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Submissions"]
 )
 async def create_submission(
     request: SubmissionCreateRequest,
     _token: str = Depends(verify_token),
     db: Session = Depends(get_db),
-    redis_client: Redis = Depends(get_redis),
-    settings: Settings = Depends(get_settings)
+    process_submission_sig: Signature = Depends(
+        get_process_submission_sig
+    )
 ):
     """
     Submit a solution for evaluation.
@@ -151,40 +281,103 @@ async def create_submission(
             request.solution_latex
         )
 
-        # Create Celery client for task dispatching
-        celery_client = Celery(
-            broker=settings.redis_url,
-            backend=settings.redis_url
-        )
-
         # Dispatch Celery task for async processing
-        celery_client.send_task(
-            "worker.tasks.process_submission",
-            args=[
+        process_submission_sig.clone(
+            args=(
                 submission.submission_id,
                 submission.problem_id,
                 submission.submission_latex
-            ]
+            )
+        ).apply_async()
+
+        logger.info(
+            "Dispatched processing task for submission %s",
+            submission.submission_id
+        )
+
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=SubmissionCreateData.model_validate(submission)
+            )
+        )
+    except moe_service.ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to create submission: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error"
+        )
+
+
+@router.post(
+    "/moe/submissions/batch",
+    response_model=None,
+    responses={200: {"model": APIResponse}},
+    tags=["Submissions"]
+)
+async def create_submissions_batch(
+    requests: list[SubmissionCreateRequest],
+    _token: str = Depends(verify_token),
+    db: Session = Depends(get_db),
+    process_submission_sig: Signature = Depends(
+        get_process_submission_sig
+    )
+):
+    """
+    Submit several solutions for evaluation at once.
+
+    Args:
+        requests: Submission creation requests
+
+    Returns:
+        APIResponse: Created submissions data
+    """
+    if not requests:
+        raise HTTPException(
+            status_code=400,
+            detail="At least one submission is required"
+        )
+
+    try:
+        submissions = moe_service.create_submissions(
+            db,
+            [(r.problem_id, r.solution_latex) for r in requests]
         )
 
+        # Dispatch all processing tasks with a single group publish
+        group(
+            process_submission_sig.clone(
+                args=(
+                    submission.submission_id,
+                    submission.problem_id,
+                    submission.submission_latex
+                )
+            )
+            for submission in submissions
+        ).apply_async()
+
         logger.info(
-            f"Dispatched processing task for submission "
-            f"{submission.submission_id}"
+            "Dispatched processing tasks for %d submissions",
+            len(submissions)
         )
 
-        return APIResponse(
-            success=True,
-            data=SubmissionCreateData(
-                submission_id=submission.submission_id,
-                problem_id=submission.problem_id,
-                status=submission.status,
-                submitted_at=submission.submitted_at
-            ).model_dump()
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=SubmissionBatchCreateData(
+                    submissions=[
+                        SubmissionCreateData.model_validate(submission)
+                        for submission in submissions
+                    ]
+                )
+            )
         )
     except moe_service.ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Failed to create submission: {e}")
+        logger.error("Failed to create submission batch: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Internal server error"
@@ -193,7 +386,8 @@ async def create_submission(
 
 @router.get(
     "/moe/submissions/{submission_id}/status",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Submissions"]
 )
 async def get_submission_status(
@@ -222,22 +416,17 @@ async def get_submission_status(
                 detail=f"Submission {submission_id} not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=SubmissionStatusData(
-                submission_id=submission.submission_id,
-                problem_id=submission.problem_id,
-                status=submission.status,
-                submitted_at=submission.submitted_at,
-                updated_at=submission.updated_at,
-                progress=submission.progress
-            ).model_dump()
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=SubmissionStatusData.model_validate(submission)
+            )
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Failed to fetch status for {submission_id}: {e}"
+            "Failed to fetch status for %s: %s", submission_id, e
         )
         raise HTTPException(
             status_code=500,
@@ -247,7 +436,8 @@ async def get_submission_status(
 
 @router.get(
     "/moe/submissions/{submission_id}/result",
-    response_model=APIResponse,
+    response_model=None,
+    responses={200: {"model": APIResponse}},
     tags=["Submissions"]
 )
 async def get_submission_result(
@@ -265,7 +455,7 @@ async def get_submission_result(
         APIResponse: Submission result data
     """
     try:
-        submission = moe_service.get_submission_by_id(
+        submission, result = moe_service.get_submission_with_result(
             db,
             submission_id
         )
@@ -276,8 +466,6 @@ async def get_submission_result(
                 detail=f"Submission {submission_id} not found"
             )
 
-        result = moe_service.get_submission_result(db, submission_id)
-
         result_detail = None
         if result:
             result_detail = SubmissionResultDetail(
@@ -291,22 +479,24 @@ async def get_submission_result(
                 feedback=result.feedback or []
             )
 
-        return APIResponse(
-            success=True,
-            data=SubmissionResultData(
-                submission_id=submission.submission_id,
-                problem_id=submission.problem_id,
-                status=submission.status,
-                submitted_at=submission.submitted_at,
-                evaluated_at=submission.evaluated_at,
-                result=result_detail
-            ).model_dump()
+        return _json_response(
+            APIResponse(
+                success=True,
+                data=SubmissionResultData(
+                    submission_id=submission.submission_id,
+                    problem_id=submission.problem_id,
+                    status=submission.status,
+                    submitted_at=submission.submitted_at,
+                    evaluated_at=submission.evaluated_at,
+                    result=result_detail
+                )
+            )
         )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Failed to fetch result for {submission_id}: {e}"
+            "Failed to fetch result for %s: %s", submission_id, e
         )
         raise HTTPException(
             status_code=500,
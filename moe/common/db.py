@@ -18,16 +18,24 @@ def create_engine_from_url(
     pool_pre_ping: bool = True,
     pool_size: int = 5,
     max_overflow: int = 10,
+    pool_recycle: int = 1800,
+    query_cache_size: int = 1200,
     echo: bool = False
 ) -> Engine:
     """
     Create SQLAlchemy engine from database URL.
 
+    Behind the Supabase pooler, prefer pool_pre_ping=False and rely on
+    pool_recycle: pre-ping costs a SELECT 1 round trip per checkout.
+
     Args:
         database_url: PostgreSQL connection URL
         pool_pre_ping: Enable connection health checks
         pool_size: Number of connections to maintain
         max_overflow: Maximum overflow connections
+        pool_recycle: Seconds before a pooled connection is replaced
+            (-1 disables recycling)
+        query_cache_size: Size of the compiled SQL statement cache
         echo: Enable SQL query logging
 
     Returns:
@@ -38,16 +46,22 @@ def create_engine_from_url(
         pool_pre_ping=pool_pre_ping,
         pool_size=pool_size,
         max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        query_cache_size=query_cache_size,
         echo=echo
     )
 
 
-def create_session_factory(engine: Engine) -> sessionmaker[Session]:
+def create_session_factory(
+    engine: Engine,
+    expire_on_commit: bool = True
+) -> sessionmaker[Session]:
     """
     Create session factory from engine.
 
     Args:
         engine: SQLAlchemy engine instance
+        expire_on_commit: Expire loaded attributes after each commit
 
     Returns:
         sessionmaker: Session factory for creating database sessions
@@ -55,6 +69,7 @@ def create_session_factory(engine: Engine) -> sessionmaker[Session]:
     return sessionmaker(
         autocommit=False,
         autoflush=False,
+        expire_on_commit=expire_on_commit,
         bind=engine
     )
 
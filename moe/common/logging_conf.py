@@ -5,9 +5,89 @@ This module provides logging setup for both API and Worker services.
 """
 
 import logging
-from typing import Optional
+import logging.config
+from functools import lru_cache
+from typing import Any, Optional
+
+# Root logging layout; the level is filled in per service at setup time
+LOGGING_CONFIG: dict[str, Any] = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": (
+                "%(asctime)s - %(name)s - %(levelname)s - "
+                "%(message)s"
+            ),
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default",
+        },
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"],
+    },
+}
+
+# Guards against double registration when setup runs again (dev reload)
+_sentry_initialized = False
+
+
+def _init_sentry(**options: Any) -> bool:
+    """
+    Initialize Sentry at most once per process.
+
+    Args:
+        **options: Keyword arguments for sentry_sdk.init
+
+    Returns:
+        bool: True if Sentry was initialized by this call
+    """
+    global _sentry_initialized
+
+    if _sentry_initialized:
+        return False
+
+    # Imported lazily so services without Sentry skip the cost
+    import sentry_sdk
+
+    sentry_sdk.init(**options)
+    _sentry_initialized = True
+    return True
+
+
+@lru_cache(maxsize=1)
+def _fastapi_integrations() -> tuple[Any, ...]:
+    """Build the stateless FastAPI Sentry integrations once per process."""
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.starlette import StarletteIntegration
+
+    return (
+        StarletteIntegration(
+            transaction_style="endpoint"
+        ),
+        FastApiIntegration(
+            transaction_style="endpoint"
+        ),
+    )
+
 
-import sentry_sdk
+@lru_cache(maxsize=1)
+def _celery_integrations() -> tuple[Any, ...]:
+    """Build the stateless Celery Sentry integration once per process."""
+    from sentry_sdk.integrations.celery import CeleryIntegration
+
+    return (
+        CeleryIntegration(
+            monitor_beat_tasks=True,
+            propagate_traces=True,
+        ),
+    )
 
 
 def setup_logging(
@@ -29,19 +109,16 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         service_name: Name of the service for logging context
     """
-    # Configure Python logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=(
-            "%(asctime)s - %(name)s - %(levelname)s - "
-            "%(message)s"
-        ),
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    # Configure Python logging; dictConfig replaces root handlers, so
+    # repeated calls reconfigure instead of silently doing nothing
+    logging.config.dictConfig({
+        **LOGGING_CONFIG,
+        "root": {**LOGGING_CONFIG["root"], "level": log_level.upper()},
+    })
 
     # Initialize Sentry if DSN is provided
     if sentry_dsn:
-        sentry_sdk.init(
+        initialized = _init_sentry(
             dsn=sentry_dsn,
             environment=sentry_environment,
             traces_sample_rate=sentry_traces_sample_rate,
@@ -52,10 +129,11 @@ def setup_logging(
                 "profiles_sample_rate": 0.1,
             }
         )
-        logging.info(
-            f"Sentry initialized for {service_name} in "
-            f"{sentry_environment} environment"
-        )
+        if initialized:
+            logging.info(
+                f"Sentry initialized for {service_name} in "
+                f"{sentry_environment} environment"
+            )
     else:
         logging.info(
             f"Sentry disabled for {service_name} "
@@ -80,22 +158,12 @@ def setup_fastapi_logging(
         log_level: Logging level
     """
     if sentry_dsn:
-        from sentry_sdk.integrations.fastapi import FastApiIntegration
-        from sentry_sdk.integrations.starlette import StarletteIntegration
-
-        sentry_sdk.init(
+        _init_sentry(
             dsn=sentry_dsn,
             environment=sentry_environment,
             traces_sample_rate=sentry_traces_sample_rate,
             profiles_sample_rate=sentry_profiles_sample_rate,
-            integrations=[
-                StarletteIntegration(
-                    transaction_style="endpoint"
-                ),
-                FastApiIntegration(
-                    transaction_style="endpoint"
-                ),
-            ],
+            integrations=list(_fastapi_integrations()),
             attach_stacktrace=True,
             send_default_pii=False,
         )
@@ -125,19 +193,12 @@ def setup_celery_logging(
         log_level: Logging level
     """
     if sentry_dsn:
-        from sentry_sdk.integrations.celery import CeleryIntegration
-
-        sentry_sdk.init(
+        _init_sentry(
             dsn=sentry_dsn,
             environment=sentry_environment,
             traces_sample_rate=sentry_traces_sample_rate,
             profiles_sample_rate=sentry_profiles_sample_rate,
-            integrations=[
-                CeleryIntegration(
-                    monitor_beat_tasks=True,
-                    propagate_traces=True,
-                ),
-            ],
+            integrations=list(_celery_integrations()),
             attach_stacktrace=True,
             send_default_pii=False,
         )
@@ -2,10 +2,21 @@
 SQLAlchemy declarative base for all models.
 """
 
+from sqlalchemy import MetaData
 from sqlalchemy.orm import DeclarativeBase
 
+# Deterministic constraint names, so Alembic compares and emits the
+# same names every run instead of leaving them to the database
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
-    pass
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
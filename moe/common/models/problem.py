@@ -5,7 +5,7 @@ Problem model for storing math olympiad problems.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, FetchedValue, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -27,8 +27,7 @@ class Problem(Base):
 
     problem_id: Mapped[str] = mapped_column(
         String(50),
-        primary_key=True,
-        index=True
+        primary_key=True
     )
     statement_latex: Mapped[str] = mapped_column(Text, nullable=False)
     statement_lean: Mapped[str] = mapped_column(Text, nullable=False)
@@ -47,7 +46,8 @@ class Problem(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        # Maintained by the set_updated_at() trigger
+        server_onupdate=FetchedValue(),
         nullable=False
     )
 
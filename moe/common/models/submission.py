@@ -5,7 +5,15 @@ Submission model for storing user problem submissions.
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    FetchedValue,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -15,6 +23,15 @@ if TYPE_CHECKING:
     from .problem import Problem
     from .submission_result import SubmissionResult
 
+# Closed set of lifecycle states, stored as a native PostgreSQL enum
+SUBMISSION_STATUS = Enum(
+    "pending",
+    "processing",
+    "completed",
+    "failed",
+    name="submission_status"
+)
+
 
 class Submission(Base):
     """
@@ -23,12 +40,13 @@ class Submission(Base):
     Stores submission data, status, and progress information.
     """
 
+    # Rows are updated several times while in flight; the table is kept
+    # at fillfactor=70 (set by migration) so those updates stay HOT
     __tablename__ = "submissions"
 
     submission_id: Mapped[str] = mapped_column(
         String(50),
-        primary_key=True,
-        index=True
+        primary_key=True
     )
     problem_id: Mapped[str] = mapped_column(
         String(50),
@@ -41,7 +59,7 @@ class Submission(Base):
         nullable=False
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        SUBMISSION_STATUS,
         nullable=False,
         default="pending"
     )
@@ -59,7 +77,8 @@ class Submission(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        # Maintained by the set_updated_at() trigger
+        server_onupdate=FetchedValue(),
         nullable=False
     )
     evaluated_at: Mapped[Optional[datetime]] = mapped_column(
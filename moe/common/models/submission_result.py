@@ -6,13 +6,14 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     DateTime,
+    Enum,
     ForeignKey,
     Integer,
     String,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -21,6 +22,16 @@ from .base import Base
 if TYPE_CHECKING:
     from .submission import Submission
 
+# Closed value sets, stored as native PostgreSQL enums
+VERDICT = Enum("accepted", "rejected", name="submission_verdict")
+LEAN_STATUS = Enum(
+    "success",
+    "failed",
+    "error",
+    "guardrail_failed",
+    name="lean_status"
+)
+
 
 class SubmissionResult(Base):
     """
@@ -45,21 +56,24 @@ class SubmissionResult(Base):
         index=True
     )
 
-    verdict: Mapped[str] = mapped_column(String(20), nullable=False)
+    verdict: Mapped[str] = mapped_column(VERDICT, nullable=False)
     lean_is_valid: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False
     )
-    lean_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    lean_status: Mapped[str] = mapped_column(
+        LEAN_STATUS,
+        nullable=False
+    )
     lean_errors: Mapped[Optional[dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True
     )
     lean_remaining_goals: Mapped[Optional[dict[str, Any]]] = (
-        mapped_column(JSON, nullable=True)
+        mapped_column(JSONB, nullable=True)
     )
     feedback: Mapped[Optional[dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True
     )
 
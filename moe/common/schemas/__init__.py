@@ -5,15 +5,26 @@ Pydantic schemas for API request and response models.
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Response-only schemas are built once per request and never mutated;
+# from_attributes lets them validate straight from ORM objects
+_RESPONSE_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    from_attributes=True
+)
 
 
 # Base response wrapper
 class APIResponse(BaseModel):
     """Standard API response wrapper."""
 
+    model_config = _RESPONSE_CONFIG
+
     success: bool = Field(..., description="Operation success status")
-    data: Optional[dict[str, Any]] = Field(
+    data: Optional[Any] = Field(
         default=None,
         description="Response data"
     )
@@ -27,6 +38,8 @@ class APIResponse(BaseModel):
 class HealthData(BaseModel):
     """Health check response data."""
 
+    model_config = _RESPONSE_CONFIG
+
     status: str = Field(..., description="Service health status")
 
 
@@ -34,6 +47,8 @@ class HealthData(BaseModel):
 class ProblemData(BaseModel):
     """Problem data for API responses."""
 
+    model_config = _RESPONSE_CONFIG
+
     problem_id: str = Field(..., description="Unique problem identifier")
     statement_latex: str = Field(
         ...,
@@ -55,6 +70,8 @@ class SubmissionCreateRequest(BaseModel):
 class SubmissionCreateData(BaseModel):
     """Response data for submission creation."""
 
+    model_config = _RESPONSE_CONFIG
+
     submission_id: str = Field(
         ...,
         description="Unique submission identifier"
@@ -67,9 +84,22 @@ class SubmissionCreateData(BaseModel):
     submitted_at: datetime = Field(..., description="Submission timestamp")
 
 
+class SubmissionBatchCreateData(BaseModel):
+    """Response data for batch submission creation."""
+
+    model_config = _RESPONSE_CONFIG
+
+    submissions: list[SubmissionCreateData] = Field(
+        ...,
+        description="Created submissions, in request order"
+    )
+
+
 class SubmissionStatusData(BaseModel):
     """Response data for submission status check."""
 
+    model_config = _RESPONSE_CONFIG
+
     submission_id: str = Field(..., description="Submission identifier")
     problem_id: str = Field(..., description="Associated problem ID")
     status: str = Field(..., description="Current submission status")
@@ -82,6 +112,8 @@ class SubmissionStatusData(BaseModel):
 class LeanValidation(BaseModel):
     """Lean proof checker validation result."""
 
+    model_config = _RESPONSE_CONFIG
+
     is_valid: bool = Field(..., description="Validation result")
     status: str = Field(..., description="Validation status")
     errors: list[Any] = Field(
@@ -97,6 +129,8 @@ class LeanValidation(BaseModel):
 class SubmissionResultDetail(BaseModel):
     """Detailed submission result information."""
 
+    model_config = _RESPONSE_CONFIG
+
     verdict: str = Field(..., description="Final verdict (accepted/rejected)")
     lean_validation: LeanValidation = Field(
         ...,
@@ -111,6 +145,8 @@ class SubmissionResultDetail(BaseModel):
 class SubmissionResultData(BaseModel):
     """Response data for submission result."""
 
+    model_config = _RESPONSE_CONFIG
+
     submission_id: str = Field(..., description="Submission identifier")
     problem_id: str = Field(..., description="Associated problem ID")
     status: str = Field(..., description="Submission status")
@@ -18,30 +18,134 @@ Environment Variables:
     SUPABASE_SECRET_KEY - Supabase service role key (for data operations)
 """
 
+import asyncio
 import os
 import sys
 import re
+import csv
+import io
+import gzip
+import mmap
+import multiprocessing
+import pickle
+import shutil
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Any, Iterator, Optional, Tuple
 import json
 
 try:
-    from supabase import create_client, Client  # type: ignore
+    import httpx  # type: ignore
+    import orjson  # type: ignore
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
     import psycopg2  # type: ignore
     HAS_DEPENDENCIES = True
 except ImportError as e:
     HAS_DEPENDENCIES = False
-    create_client = None  # type: ignore
-    Client = None  # type: ignore
+    httpx = None  # type: ignore
+    orjson = None  # type: ignore
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
+    Retry = None  # type: ignore
     psycopg2 = None  # type: ignore
     print("ERROR: Required dependencies not installed.")
     print(f"Missing: {e}")
-    print("Please install: pip install supabase requests psycopg2-binary")
+    print("Please install: pip install requests httpx orjson psycopg2-binary")
     sys.exit(1)
 
 
+# Start of a problems INSERT statement and of whatever statement follows.
+# Byte patterns, so they run directly over the memory-mapped dump; the
+# generated dump always writes keywords in upper case.
+INSERT_PROBLEMS_RE = re.compile(
+    rb'INSERT INTO problems\s*\([^)]+\)\s*VALUES\s*'
+)
+NEXT_INSERT_RE = re.compile(rb'INSERT INTO')
+
+# Legacy lean_theorems dump: its VALUES list (rows split by TOKEN_RE)
+LEAN_THEOREMS_VALUES_RE = re.compile(
+    rb'INSERT INTO lean_theorems.*?VALUES\s*(.+);',
+    re.S | re.I
+)
+
+# Tokens of a VALUES list: quoted literals (with '' or backslash escapes),
+# parentheses, and runs of anything else. Matching them with one compiled
+# pattern keeps the scan inside the C regex engine. Literals are written
+# "unrolled" (plain-character runs between escapes) so SRE consumes them
+# a whole run at a time instead of trying an alternation per character.
+TOKEN_RE = re.compile(
+    rb"'[^'\\]*(?:(?:''|\\.)[^'\\]*)*'|\(|\)|[^'()]+",
+    re.S
+)
+
+# One field of a row tuple: a quoted literal or a bare value (NULL,
+# numbers, NOW()), followed by a separating comma or the end of the row
+FIELD_RE = re.compile(
+    r"\s*(?:'([^'\\]*(?:(?:''|\\.)[^'\\]*)*)'|([^,]*?))\s*(,|$)",
+    re.S
+)
+
+# Leading columns read from each dump row: the problems dump carries
+# trailing created_at/updated_at, which the seeders never use
+PROBLEMS_DUMP_FIELDS = 6
+LEAN_THEOREMS_DUMP_FIELDS = 5
+
+# Bump when parsing changes, so stale *.parsed.pkl caches are ignored
+PARSED_CACHE_VERSION = 1
+
+# Column order of the parsed problem rows. The parser yields plain tuples
+# in this order; dicts are only built where PostgREST needs JSON objects.
+PROBLEM_FIELDS = (
+    'problem_id',
+    'statement_latex',
+    'statement_lean',
+    'state_before_lean',
+    'state_after_lean',
+    'tactic_lean',
+)
+ProblemRow = Tuple[str, str, str, str, str, str]
+
+# Retry policy for PostgREST writes, shared by the requests session and
+# the async client: transient gateway errors back off 0.3s, 0.6s, 1.2s
+POST_RETRIES = 3
+POST_BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+
+class ProgressCounter:
+    """
+    Running count that prints at most one progress line per interval.
+    
+    Per-batch prints cost a write() each under Docker/CI log pipes;
+    throttling keeps output readable and cheap on large dumps.
+    """
+    
+    # Set by --quiet: counts are still kept, but no lines are printed
+    quiet = False
+    
+    def __init__(self, label: str, interval: float = 0.5):
+        self.label = label
+        self.interval = interval
+        self.count = 0
+        self._last_print = time.monotonic()
+    
+    def update(self, n: int = 1) -> None:
+        """Add n to the count, printing if the interval has elapsed."""
+        self.count += n
+        if self.quiet:
+            return
+        now = time.monotonic()
+        if now - self._last_print >= self.interval:
+            print(f"  {self.label} {self.count}...", flush=True)
+            self._last_print = now
+
+
 class SupabaseRESTMigrationManager:
     """Manages database migrations and seeding using hybrid approach."""
     
@@ -71,7 +175,13 @@ class SupabaseRESTMigrationManager:
         if not self.service_key:
             raise ValueError("SUPABASE_SECRET_KEY environment variable is required")
         
-        # Initialize Supabase client for data operations
+        # Shared keep-alive session for direct PostgREST calls
+        self._auth_headers = {
+            "apikey": self.service_key,
+            "Authorization": f"Bearer {self.service_key}"
+        }
+        self._http = self._create_http_session()
+        
         print(f"  Base URL: {self.base_url}")
         print(f"  REST URL: {self.rest_url}")
         
@@ -82,17 +192,34 @@ class SupabaseRESTMigrationManager:
             print(f"  Your key starts with: {self.service_key[:20]}...")
             print(f"  Make sure you're using the 'service_role' key, not 'anon' key")
             print(f"  REST API operations may fail")
+    
+    def _create_http_session(self) -> Any:
+        """
+        Create the pooled HTTP session used for PostgREST requests.
         
-        if not create_client:
-            raise ImportError("supabase library not available")
+        Connections are kept alive and reused across requests, and
+        transient gateway errors are retried with backoff.
         
-        try:
-            self.client = create_client(self.base_url, self.service_key)
-            print(f"✓ Supabase REST client initialized (for data operations)")
-        except Exception as e:
-            print(f"✗ Failed to initialize Supabase client: {e}")
-            print(f"  REST API operations will not work")
-            self.client = None
+        Returns:
+            requests.Session: Session carrying the service role headers
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=POST_RETRIES,
+                backoff_factor=POST_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                # urllib3 skips POST by default; the writes are safe to
+                # repeat under ignore/merge-duplicates resolution
+                allowed_methods=None
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._auth_headers)
+        return session
     
     def _fix_database_url(self, url: str) -> str:
         """
@@ -180,12 +307,8 @@ class SupabaseRESTMigrationManager:
             # Check if we can access the REST API
             if not requests:
                 raise ImportError("requests library not available")
-            headers = {
-                "apikey": self.service_key,
-                "Authorization": f"Bearer {self.service_key}"
-            }
             
-            response = requests.get(f"{self.rest_url}/", headers=headers)  # type: ignore
+            response = self._http.get(f"{self.rest_url}/")
             if response.status_code == 200:
                 print("✓ REST API accessible")
             else:
@@ -264,18 +387,23 @@ class SupabaseRESTMigrationManager:
             print("✓ Tables created successfully!")
             print()
             
-            # Verify tables exist
+            # Verify tables exist; to_regclass is a direct catalog lookup,
+            # unlike an information_schema scan
             print("Verifying tables...")
-            cursor.execute("""
-                SELECT table_name FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name IN ('problems', 'submissions', 'submission_results')
-                ORDER BY table_name
-            """)
-            
-            tables = cursor.fetchall()
+            table_names = ('problems', 'submissions', 'submission_results')
+            cursor.execute(
+                "SELECT " + ", ".join(
+                    f"to_regclass('public.{name}') IS NOT NULL"
+                    for name in table_names
+                )
+            )
+            
+            exists = cursor.fetchone()
+            tables = [
+                name for name, found in zip(table_names, exists) if found
+            ]
             if tables:
-                print(f"✓ Created tables: {[t[0] for t in tables]}")
+                print(f"✓ Created tables: {tables}")
             else:
                 print("⚠ No tables found (they might already exist)")
             
@@ -300,7 +428,8 @@ class SupabaseRESTMigrationManager:
             return False
     
     def seed_database_direct(self, sql_file: str = "wkbk_lean.sql",
-                            limit: Optional[int] = None) -> bool:
+                            limit: Optional[int] = None,
+                            batch_size: int = 1000) -> bool:
         """
         Seed database using direct PostgreSQL connection (DATABASE_URL).
         Fallback method when REST API is not available.
@@ -308,6 +437,7 @@ class SupabaseRESTMigrationManager:
         Args:
             sql_file: Path to SQL file (wkbk_lean.sql)
             limit: Optional limit on number of rows to insert (for testing)
+            batch_size: Rows per COPY batch. Default: 1000
             
         Returns:
             bool: True if successful
@@ -336,23 +466,14 @@ class SupabaseRESTMigrationManager:
         print()
         
         try:
-            # Read and parse SQL file
-            print("Reading SQL file...")
-            sql_content = sql_path.read_text(encoding='utf-8')
-            
+            # Stream problems from the SQL file; rows are parsed lazily
+            # as batches are pulled
             print("Parsing problems data...")
-            problems_data = self._parse_problems_sql(sql_content)
-            
-            if not problems_data:
-                print("✗ No data found in SQL file")
-                return False
-            
-            print(f"Parsed {len(problems_data)} problems from SQL")
-            print()
+            problems = self._iter_problems_sql(sql_path)
             
             # Apply limit if specified
             if limit and limit > 0:
-                problems_data = problems_data[:limit]
+                problems = islice(problems, limit)
                 print(f"⚠ LIMIT APPLIED: Only inserting first {limit} rows")
                 print()
             
@@ -365,43 +486,61 @@ class SupabaseRESTMigrationManager:
             
             # Insert data
             print(f"Inserting into problems table...")
-            print(f"  Total rows: {len(problems_data)}")
             print()
             
-            batch_size = 100
-            total_batches = (len(problems_data) + batch_size - 1) // batch_size
+            # Bulk load: COPY each batch into a session-local staging
+            # table, then move it across with ON CONFLICT semantics.
+            # Durability of individual commits doesn't matter for a
+            # re-runnable seed: a crash loses at most the last few
+            # batches, and rerunning re-inserts exactly those. So don't
+            # wait on WAL flushes, and give the INSERT ... SELECT room to
+            # hash/sort the staged batch in memory.
+            cursor.execute("SET synchronous_commit = OFF")
+            cursor.execute("SET work_mem = '64MB'")
+            cursor.execute(
+                "CREATE TEMP TABLE problems_staging "
+                "(LIKE problems INCLUDING DEFAULTS)"
+            )
             
-            insert_sql = """
-                INSERT INTO problems 
-                (problem_id, tactic_lean, state_after_lean, state_before_lean, 
-                 statement_latex, statement_lean)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (problem_id) DO NOTHING
-            """
+            # Commit every few batches rather than every batch; a failed
+            # group rolls back whole and is re-inserted on the next run
+            commit_every = 10
+            batch_num = 0
+            progress = ProgressCounter("Inserted rows:")
             
-            for i in range(0, len(problems_data), batch_size):
-                batch = problems_data[i:i+batch_size]
-                batch_num = i//batch_size + 1
+            # Parsed rows already come in PROBLEM_FIELDS order
+            columns = ", ".join(PROBLEM_FIELDS)
+            copy_sql = (
+                f"COPY problems_staging ({columns}) "
+                f"FROM STDIN WITH (FORMAT csv)"
+            )
+            insert_sql = (
+                f"INSERT INTO problems ({columns}) "
+                f"SELECT {columns} FROM problems_staging "
+                f"ON CONFLICT (problem_id) DO NOTHING"
+            )
+            
+            while True:
+                batch = list(islice(problems, batch_size))
+                if not batch:
+                    break
+                batch_num += 1
                 
                 try:
-                    # Prepare batch data
-                    batch_values = [
-                        (
-                            p['problem_id'],
-                            p['tactic_lean'],
-                            p['state_after_lean'],
-                            p['state_before_lean'],
-                            p['statement_latex'],
-                            p['statement_lean']
-                        )
-                        for p in batch
-                    ]
+                    # Serialize batch as CSV for COPY
+                    buf = io.StringIO()
+                    csv.writer(buf, quoting=csv.QUOTE_ALL).writerows(batch)
+                    buf.seek(0)
                     
-                    # Execute batch insert
-                    cursor.executemany(insert_sql, batch_values)
-                    conn.commit()
+                    # Stage with COPY, insert, then empty the staging
+                    # table for the next batch
+                    cursor.copy_expert(copy_sql, buf)
+                    cursor.execute(insert_sql)
+                    cursor.execute("TRUNCATE problems_staging")
+                    if batch_num % commit_every == 0:
+                        conn.commit()
                     
-                    print(f"  ✓ Batch {batch_num}/{total_batches} ({len(batch)} rows)")
+                    progress.update(len(batch))
                 except Exception as e:
                     print(f"  ✗ Error inserting batch {batch_num}: {e}")
                     conn.rollback()
@@ -409,11 +548,18 @@ class SupabaseRESTMigrationManager:
                     conn.close()
                     return False
             
+            # Commit the final partial group
+            conn.commit()
             cursor.close()
             conn.close()
             
+            if not progress.count:
+                print("✗ No data found in SQL file")
+                return False
+            
             print()
-            print(f"✓ Completed problems table: {len(problems_data)} rows")
+            print(f"✓ Completed problems table: {progress.count} rows "
+                  f"in {batch_num} batches")
             print()
             print("=" * 60)
             print("✓ Database seeding completed!")
@@ -434,7 +580,10 @@ class SupabaseRESTMigrationManager:
     def seed_database(self, sql_file: str = "wkbk_lean.sql",
                      limit: Optional[int] = None,
                      upsert: bool = False,
-                     force_clear: bool = False) -> bool:
+                     force_clear: bool = False,
+                     use_async: bool = True,
+                     batch_size: int = 100,
+                     concurrency: int = 16) -> bool:
         """
         Seed database using Supabase PostgREST API.
         This is the preferred method for seeding data.
@@ -444,6 +593,10 @@ class SupabaseRESTMigrationManager:
             limit: Optional limit on number of rows to insert (for testing)
             upsert: If True, use UPSERT mode (update existing, insert new). Default: False
             force_clear: If True, clear table before seeding. Default: False
+            use_async: If True, POST batches from an async HTTP/2 client;
+                otherwise from a thread pool. Default: True
+            batch_size: Rows per POST. Default: 100
+            concurrency: Maximum batches in flight at once. Default: 16
             
         Returns:
             bool: True if successful
@@ -459,38 +612,14 @@ class SupabaseRESTMigrationManager:
         elif upsert:
             print("🔄 MODE: UPSERT (Update existing, insert new)")
         else:
-            print("➕ MODE: INSERT (Fail on duplicates - default)")
+            print("➕ MODE: INSERT (Skip duplicates - default)")
         print()
         
-        # Check if Supabase client is initialized
-        if not self.client:
-            print("✗ Supabase client not initialized")
-            print("  Check your SUPABASE_SECRET_KEY (should be service_role key)")
+        # FORCE mode: the table is cleared before the first insert
+        if force_clear and not self.database_url:
+            print("✗ FORCE mode requires DATABASE_URL to be set")
             return False
         
-        # FORCE mode: Clear table first
-        if force_clear:
-            if not self.database_url:
-                print("✗ FORCE mode requires DATABASE_URL to be set")
-                return False
-            
-            try:
-                print("Clearing problems table...")
-                if not psycopg2:
-                    raise ImportError("psycopg2 not available")
-                conn = psycopg2.connect(self.database_url)
-                cur = conn.cursor()
-                cur.execute('DELETE FROM problems;')
-                conn.commit()
-                deleted_count = cur.rowcount
-                cur.close()
-                conn.close()
-                print(f"✓ Cleared {deleted_count} rows from problems table")
-                print()
-            except Exception as e:
-                print(f"✗ Failed to clear table: {e}")
-                return False
-        
         # Check if SQL file exists
         sql_path = Path(sql_file)
         if not sql_path.exists():
@@ -502,60 +631,102 @@ class SupabaseRESTMigrationManager:
         print()
         
         try:
-            # Read SQL file
-            print("Reading SQL file...")
-            sql_content = sql_path.read_text(encoding='utf-8')
-            
-            # Parse problems INSERT statements
+            # Stream problems INSERT statements; rows are parsed lazily
+            # as batches are pulled
             print("Parsing problems data...")
-            problems_data = self._parse_problems_sql(sql_content)
-            
-            if not problems_data:
-                print("✗ No data found in SQL file")
-                return False
-            
-            print(f"Parsed {len(problems_data)} problems from SQL")
-            print()
+            problems = self._iter_problems_sql(sql_path)
             
             # Apply limit if specified
             if limit and limit > 0:
-                problems_data = problems_data[:limit]
+                problems = islice(problems, limit)
                 print(f"⚠ LIMIT APPLIED: Only inserting first {limit} rows")
                 print()
             
             # Insert/Upsert data using PostgREST into problems table
             operation = "Upserting" if upsert else "Inserting"
             print(f"{operation} into problems table...")
-            print(f"  Total rows: {len(problems_data)}")
             print()
             
-            # Batch insert (PostgREST supports bulk inserts)
-            batch_size = 100
-            total_batches = (len(problems_data) + batch_size - 1) // batch_size
+            # Batch insert (PostgREST supports bulk inserts). Batches are
+            # POSTed concurrently, either from an async HTTP/2 client or
+            # from a thread pool over the shared keep-alive session; at
+            # most a bounded number of parsed batches is held in memory.
+            max_in_flight = max(1, concurrency)
+            max_workers = max(1, max_in_flight // 2)
+            batch_num = 0
+            progress = ProgressCounter(f"{operation} rows:")
             
-            for i in range(0, len(problems_data), batch_size):
-                batch = problems_data[i:i+batch_size]
-                batch_num = i//batch_size + 1
-                
+            if use_async:
+                # One HTTP/2 connection multiplexes the in-flight batches
+                # from the event loop
                 try:
-                    if upsert:
-                        # UPSERT mode: update if exists, insert if not
-                        response = self.client.table('problems').upsert(
-                            batch
-                        ).execute()
-                    else:
-                        # INSERT mode: fail on duplicate
-                        response = self.client.table('problems').insert(
-                            batch
-                        ).execute()
-                    print(f"  ✓ Batch {batch_num}/{total_batches} "
-                          f"({len(batch)} rows)")
+                    asyncio.run(self._seed_postgrest_async(
+                        problems, batch_size, upsert, force_clear, progress,
+                        max_in_flight
+                    ))
                 except Exception as e:
-                    print(f"  ✗ Error {operation.lower()} batch {batch_num}: {e}")
+                    # TaskGroup wraps the first failure in a group
+                    if isinstance(e, ExceptionGroup):
+                        e = e.exceptions[0]
+                    print(f"  ✗ Error {operation.lower()} problems: {e}")
                     return False
+            else:
+                with ThreadPoolExecutor(max_workers) as executor:
+                    pending = {}
+                    exhausted = False
+                
+                    # FORCE mode: clear the table while the first batch is
+                    # being parsed; nothing is POSTed until it finishes
+                    clear_future = None
+                    if force_clear:
+                        print("Clearing problems table...")
+                        clear_future = executor.submit(self._clear_problems_table)
+                
+                    while not exhausted or pending:
+                        # Top up the window from the parser
+                        while not exhausted and len(pending) < max_in_flight:
+                            batch = list(islice(problems, batch_size))
+                        
+                            if clear_future is not None:
+                                try:
+                                    deleted_count = clear_future.result()
+                                except Exception as e:
+                                    print(f"✗ Failed to clear table: {e}")
+                                    return False
+                                clear_future = None
+                                print(f"✓ Cleared {deleted_count} rows from problems table")
+                        
+                            if not batch:
+                                exhausted = True
+                                break
+                            batch_num += 1
+                            future = executor.submit(
+                                self._post_batch, batch, upsert
+                            )
+                            pending[future] = (batch_num, len(batch))
+                    
+                        if not pending:
+                            break
+                    
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            num, rows = pending.pop(future)
+                            try:
+                                future.result()
+                            except Exception as e:
+                                print(f"  ✗ Error {operation.lower()} batch {num}: {e}")
+                                # Stop on first failure; drop queued batches
+                                for other in pending:
+                                    other.cancel()
+                                return False
+                            progress.update(rows)
+            
+            if not progress.count:
+                print("✗ No data found in SQL file")
+                return False
             
             print()
-            print(f"✓ Completed problems table: {len(problems_data)} rows")
+            print(f"✓ Completed problems table: {progress.count} rows")
             print()
             print("=" * 60)
             print("✓ Database seeding completed!")
@@ -573,9 +744,193 @@ class SupabaseRESTMigrationManager:
             traceback.print_exc()
             return False
     
-    def _parse_problems_sql(self, sql_content: str) -> List[Dict[str, Any]]:
+    def _clear_problems_table(self) -> int:
+        """
+        Delete all rows from the problems table via DATABASE_URL.
+        
+        Returns:
+            int: Number of rows deleted
+            
+        Raises:
+            ImportError: If psycopg2 is not available
+        """
+        if not psycopg2:
+            raise ImportError("psycopg2 not available")
+        conn = psycopg2.connect(self.database_url)
+        try:
+            cur = conn.cursor()
+            # The table is about to be re-seeded anyway
+            cur.execute('SET LOCAL synchronous_commit = OFF;')
+            cur.execute('DELETE FROM problems;')
+            conn.commit()
+            deleted_count = cur.rowcount
+            cur.close()
+        finally:
+            conn.close()
+        return deleted_count
+    
+    def _post_batch(self, batch: List[ProblemRow],
+                    upsert: bool = False) -> None:
+        """
+        POST one batch of problems to the PostgREST problems endpoint.
+        
+        Args:
+            batch: Problem dictionaries to insert
+            upsert: If True, merge rows that already exist; otherwise
+                they are skipped
+            
+        Raises:
+            requests.HTTPError: If PostgREST rejects the batch
+        """
+        response = self._http.post(
+            f"{self.rest_url}/problems",
+            data=self._batch_json(batch),
+            headers={
+                "Content-Type": "application/json",
+                "Prefer": self._prefer_header(upsert)
+            }
+        )
+        response.raise_for_status()
+    
+    async def _seed_postgrest_async(self, problems: Iterator[ProblemRow],
+                                    batch_size: int, upsert: bool,
+                                    force_clear: bool,
+                                    progress: ProgressCounter,
+                                    concurrency: int = 16) -> None:
+        """
+        POST problems to PostgREST in concurrent batches over HTTP/2.
+        
+        Batches are pulled lazily from the parser. Each batch retries
+        transient failures with exponential backoff on its own; a batch
+        that still fails cancels the rest.
+        
+        Args:
+            problems: Problem rows to insert
+            batch_size: Rows per POST
+            upsert: If True, merge rows that already exist
+            force_clear: If True, clear the table before the first POST
+            progress: Counter updated as batches complete
+            concurrency: Maximum batches in flight at once
+            
+        Raises:
+            ExceptionGroup: Wrapping the first failed request or clear
+        """
+        sem = asyncio.Semaphore(concurrency)
+        url = f"{self.rest_url}/problems"
+        headers = {
+            **self._auth_headers,
+            "Content-Type": "application/json",
+            "Prefer": self._prefer_header(upsert)
+        }
+        
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32
+            ),
+            timeout=60,
+            headers=headers
+        ) as client:
+            async def post(batch: List[ProblemRow]) -> None:
+                try:
+                    body = self._batch_json(batch)
+                    for attempt in range(POST_RETRIES + 1):
+                        last_attempt = attempt == POST_RETRIES
+                        try:
+                            response = await client.post(url, content=body)
+                        except httpx.TransportError:
+                            if last_attempt:
+                                raise
+                        else:
+                            if (last_attempt or response.status_code
+                                    not in RETRY_STATUSES):
+                                response.raise_for_status()
+                                break
+                        await asyncio.sleep(POST_BACKOFF * 2 ** attempt)
+                finally:
+                    sem.release()
+                progress.update(len(batch))
+            
+            async with asyncio.TaskGroup() as tg:
+                # FORCE mode: clear the table while the first batch is
+                # being parsed; nothing is POSTed until it finishes
+                clear_task = None
+                if force_clear:
+                    print("Clearing problems table...")
+                    clear_task = tg.create_task(
+                        asyncio.to_thread(self._clear_problems_table)
+                    )
+                
+                while True:
+                    batch = list(islice(problems, batch_size))
+                    
+                    if clear_task is not None:
+                        deleted_count = await clear_task
+                        clear_task = None
+                        print(f"✓ Cleared {deleted_count} rows from problems table")
+                    
+                    if not batch:
+                        break
+                    await sem.acquire()
+                    tg.create_task(post(batch))
+    
+    def _batch_json(self, batch: List[ProblemRow]) -> bytes:
+        """
+        Encode a batch of problem rows as a PostgREST JSON array body.
+        
+        Args:
+            batch: Problem rows in PROBLEM_FIELDS order
+            
+        Returns:
+            bytes: JSON array of row objects
+        """
+        return orjson.dumps([dict(zip(PROBLEM_FIELDS, row)) for row in batch])
+    
+    def _prefer_header(self, upsert: bool) -> str:
         """
-        Parse problems table INSERT statements directly.
+        Build the PostgREST Prefer header for a problems insert.
+        
+        INSERT mode skips existing rows (ON CONFLICT DO NOTHING), so a
+        rerun only adds what is missing; UPSERT merges them. Either way
+        the inserted rows are not echoed back.
+        
+        Args:
+            upsert: If True, merge rows that already exist
+            
+        Returns:
+            str: Prefer header value
+        """
+        resolution = "merge-duplicates" if upsert else "ignore-duplicates"
+        return f"return=minimal,resolution={resolution}"
+    
+    @contextmanager
+    def _open_sql_dump(self, sql_path: Path) -> Iterator[Path]:
+        """
+        Provide an uncompressed, mappable path for a SQL dump.
+        
+        Plain dumps are used in place. A .gz dump is stream-decompressed
+        into a temporary file that is removed again on exit.
+        
+        Args:
+            sql_path: Path to the SQL file (.sql or .sql.gz)
+            
+        Yields:
+            Path: Path of the uncompressed SQL
+        """
+        if sql_path.suffix != '.gz':
+            yield sql_path
+            return
+        
+        with gzip.open(sql_path, 'rb') as src, \
+                tempfile.NamedTemporaryFile(suffix='.sql') as tmp:
+            shutil.copyfileobj(src, tmp, 1024 * 1024)
+            tmp.flush()
+            yield Path(tmp.name)
+    
+    def _iter_problems_sql(self, sql_path: Path) -> Iterator[ProblemRow]:
+        """
+        Stream problems from the INSERT statements of a SQL dump.
         
         The wkbk_lean.sql has format:
         INSERT INTO problems (problem_id, statement_latex, statement_lean, 
@@ -583,106 +938,242 @@ class SupabaseRESTMigrationManager:
                              created_at, updated_at)
         VALUES ('id', 'latex', 'lean', 'before', 'after', 'tactic', ..., ...),
         
+        The file is memory-mapped and scanned as bytes; only individual
+        row tuples are decoded, so memory use does not grow with the file.
+        Gzip-compressed dumps (.gz) are decompressed to a temporary file
+        first.
+        
         Args:
-            sql_content: SQL file content
+            sql_path: Path to the SQL file (.sql or .sql.gz)
+            
+        Yields:
+            tuple: Problem rows in PROBLEM_FIELDS order
+        """
+        # Reruns on an unchanged dump replay the previous parse
+        cache_path = sql_path.with_name(sql_path.name + '.parsed.pkl')
+        stat = sql_path.stat()
+        stamp = (PARSED_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._load_parsed_cache(cache_path, stamp)
+        if cached is not None:
+            print(f"Using parsed cache: {cache_path}")
+            yield from cached
+            return
+        
+        with self._open_sql_dump(sql_path) as plain_path:
+            yield from self._write_parsed_cache(
+                cache_path, stamp, self._iter_plain_problems_sql(plain_path)
+            )
+    
+    def _load_parsed_cache(
+        self, cache_path: Path, stamp: Tuple[int, int, int]
+    ) -> Optional[Iterator[ProblemRow]]:
+        """
+        Open a parsed-rows cache if it matches the current dump.
+        
+        Args:
+            cache_path: Path of the cache file
+            stamp: (cache version, mtime_ns, size) of the SQL dump
             
         Returns:
-            list: List of problem dictionaries ready for insertion
+            Iterator over the cached rows, or None if the cache is
+            missing, unreadable or stale
         """
-        problems_data = []
+        try:
+            f = open(cache_path, 'rb')
+        except OSError:
+            return None
         
-        # Find ALL INSERT statements for problems table (there may be multiple)
-        values_matches = re.finditer(
-            r'INSERT INTO problems\s*\([^)]+\)\s*VALUES\s*(.+?)(?=INSERT INTO|$)',
-            sql_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        try:
+            header = pickle.load(f)
+        except Exception:
+            header = None
+        if header != stamp:
+            f.close()
+            return None
+        
+        def rows() -> Iterator[ProblemRow]:
+            with f:
+                while True:
+                    try:
+                        chunk = pickle.load(f)
+                    except EOFError:
+                        return
+                    yield from chunk
+        
+        return rows()
+    
+    def _write_parsed_cache(
+        self, cache_path: Path, stamp: Tuple[int, int, int],
+        rows: Iterator[ProblemRow]
+    ) -> Iterator[ProblemRow]:
+        """
+        Pass rows through while recording them to a parsed-rows cache.
         
-        # Collect all INSERT statements
-        all_values_str = []
-        for match in values_matches:
-            all_values_str.append(match.group(1))
+        Rows are pickled in chunks as they stream by, so the cache costs
+        no extra memory. It is only published (renamed into place) once
+        the whole dump has been consumed; a run cut short by a limit or
+        an error leaves no partial cache behind. If the dump's directory
+        is read-only, rows pass through uncached.
         
-        if not all_values_str:
-            print("⚠ No INSERT INTO problems found, trying lean_theorems format...")
-            return self._parse_lean_theorems_to_problems(sql_content)
+        Args:
+            cache_path: Path of the cache file
+            stamp: (cache version, mtime_ns, size) of the SQL dump
+            rows: Freshly parsed problem rows
+            
+        Yields:
+            tuple: The same rows, unchanged
+        """
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            f = open(tmp_path, 'wb')
+        except OSError:
+            yield from rows
+            return
         
-        # Combine all VALUES sections
-        values_str = ' '.join(all_values_str)
+        completed = False
+        try:
+            with f:
+                pickle.dump(stamp, f, protocol=5)
+                while True:
+                    chunk = list(islice(rows, 1000))
+                    if not chunk:
+                        break
+                    pickle.dump(chunk, f, protocol=5)
+                    yield from chunk
+            completed = True
+        finally:
+            if completed:
+                os.replace(tmp_path, cache_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+    
+    def _iter_plain_problems_sql(self, sql_path: Path) -> Iterator[ProblemRow]:
+        """
+        Stream problems from an uncompressed SQL dump (see _iter_problems_sql).
         
-        # Parse each row - handle nested parentheses and quotes properly
-        rows = []
-        depth = 0
-        current_row = ""
-        in_quote = False
-        i = 0
-        
-        while i < len(values_str):
-            char = values_str[i]
-            
-            # Handle quotes
-            if char == "'" and (i == 0 or values_str[i-1] != '\\'):
-                in_quote = not in_quote
-                if depth > 0:
-                    current_row += char
-            # Handle parentheses only when not in quotes
-            elif not in_quote:
-                if char == '(':
-                    depth += 1
-                    if depth == 1:
-                        current_row = ""
-                    else:
-                        current_row += char
-                elif char == ')':
-                    depth -= 1
-                    if depth == 0:
-                        if current_row.strip():  # Only add non-empty rows
-                            rows.append(current_row)
-                        current_row = ""
-                    else:
-                        current_row += char
-                elif depth > 0:
-                    current_row += char
+        Args:
+            sql_path: Path to the uncompressed SQL file
+            
+        Yields:
+            tuple: Problem rows in PROBLEM_FIELDS order
+        """
+        if sql_path.stat().st_size == 0:
+            return
+        
+        with open(sql_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Find ALL INSERT statements for problems table (there may be
+            # multiple); each one's VALUES run up to the next INSERT
+            first_insert = INSERT_PROBLEMS_RE.search(data)
+            
+            if not first_insert:
+                print("⚠ No INSERT INTO problems found, trying lean_theorems format...")
+                yield from self._parse_lean_theorems_to_problems(data)
+                return
+            
+            # VALUES span of each statement, up to the next INSERT
+            spans = []
+            for insert in INSERT_PROBLEMS_RE.finditer(data, first_insert.start()):
+                next_insert = NEXT_INSERT_RE.search(data, insert.end())
+                end = next_insert.start() if next_insert else len(data)
+                spans.append((insert.end(), end))
+            
+            # Statements are independent, so parse them on all cores when
+            # there is more than one of each; results stay in file order
+            processes = min(os.cpu_count() or 1, len(spans))
+            if processes > 1:
+                parsed_rows = self._parse_spans_parallel(
+                    str(sql_path), spans, processes
+                )
             else:
-                # Inside quotes
-                if depth > 0:
-                    current_row += char
+                parsed_rows = (
+                    self._parse_sql_row(row, PROBLEMS_DUMP_FIELDS)
+                    for start, end in spans
+                    for row in self._iter_row_tuples(data, start, end)
+                )
             
-            i += 1
+            # Parsed row values: (problem_id, statement_latex,
+            # statement_lean, state_before_lean, state_after_lean,
+            # tactic_lean, created_at, updated_at)
+            for i, values in enumerate(parsed_rows):
+                if len(values) >= PROBLEMS_DUMP_FIELDS:
+                    yield (
+                        values[0] or f'wkbk_{i+1:05d}',
+                        values[1] or 'No statement',
+                        values[2] or 'No statement',
+                        values[3] or 'no state',
+                        values[4] or 'no goals',
+                        values[5] or ''
+                    )
+    
+    def _parse_spans_parallel(
+        self, sql_path: str, spans: List[Tuple[int, int]], processes: int
+    ) -> Iterator[List[Optional[str]]]:
+        """
+        Parse INSERT statement spans of a SQL dump in worker processes.
         
-        print(f"Found {len(rows)} problems to insert...")
+        Spans are dispatched a few per worker at a time, so at most one
+        window of parsed rows is held in memory however large the dump.
         
-        for i, row in enumerate(rows):
-            # Parse the row values (problem_id, statement_latex, statement_lean, 
-            # state_before_lean, state_after_lean, tactic_lean, created_at, updated_at)
-            values = self._parse_sql_row(row)
-            
-            if len(values) >= 6:
-                problem_id = values[0] or f'wkbk_{i+1:05d}'
-                statement_latex = values[1] or 'No statement'
-                statement_lean = values[2] or 'No statement'
-                state_before_lean = values[3] or 'no state'
-                state_after_lean = values[4] or 'no goals'
-                tactic_lean = values[5] or ''
-                
-                problems_data.append({
-                    'problem_id': problem_id,
-                    'statement_latex': statement_latex,
-                    'statement_lean': statement_lean,
-                    'state_before_lean': state_before_lean,
-                    'state_after_lean': state_after_lean,
-                    'tactic_lean': tactic_lean
-                })
-            
-            # Show progress
-            if (i + 1) % 1000 == 0:
-                print(f"  Processed {i + 1} problems...")
+        Args:
+            sql_path: Path to the SQL file (each worker maps it itself)
+            spans: (start, end) byte offsets of each VALUES list
+            processes: Number of worker processes
+            
+        Yields:
+            list: Parsed values of each row, in file order
+        """
+        tasks = ((sql_path, start, end) for start, end in spans)
+        # Parsing can start while FORCE mode's table clear runs on a
+        # thread; forkserver children never inherit that thread's locks
+        context = multiprocessing.get_context("forkserver")
+        with context.Pool(processes) as pool:
+            while True:
+                window = list(islice(tasks, processes * 4))
+                if not window:
+                    break
+                for span_rows in pool.map(_parse_insert_span, window):
+                    yield from span_rows
+    
+    @staticmethod
+    def _iter_row_tuples(data: Any, start: int = 0,
+                         end: Optional[int] = None) -> Iterator[str]:
+        """
+        Split a VALUES list into its top-level row tuples.
         
-        return problems_data
+        A single forward pass of TOKEN_RE, so the work is linear in the
+        input; parentheses inside quoted literals are ignored.
+        
+        Args:
+            data: SQL bytes (or a memory map over them)
+            start: Offset where the VALUES list begins
+            end: Offset where it ends (defaults to the end of data)
+            
+        Yields:
+            str: Decoded contents of each non-empty row tuple
+        """
+        if end is None:
+            end = len(data)
+        
+        depth = 0
+        row_start = start
+        for token in TOKEN_RE.finditer(data, start, end):
+            char = token.group()
+            if char == b'(':
+                depth += 1
+                if depth == 1:
+                    row_start = token.end()
+            elif char == b')' and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    row = data[row_start:token.start()].decode('utf-8')
+                    if row.strip():  # Only yield non-empty rows
+                        yield row
     
     def _parse_lean_theorems_to_problems(
-        self, sql_content: str
-    ) -> List[Dict[str, Any]]:
+        self, data: Any
+    ) -> List[ProblemRow]:
         """
         Parse lean_theorems INSERT statements and convert to problems format.
         
@@ -700,30 +1191,26 @@ class SupabaseRESTMigrationManager:
         - generate problem_id from hash
         
         Args:
-            sql_content: SQL file content
+            data: SQL file bytes (or a memory map over them)
             
         Returns:
-            list: List of problem dictionaries ready for insertion
+            list: Problem rows in PROBLEM_FIELDS order
         """
         import hashlib
         
         problems_data = []
+        progress = ProgressCounter("Processed theorems:")
         
         # Find the INSERT statement
-        values_match = re.search(
-            r'INSERT INTO lean_theorems.*?VALUES\s*(.+);',
-            sql_content, 
-            re.DOTALL | re.IGNORECASE
-        )
+        values_match = LEAN_THEOREMS_VALUES_RE.search(data)
         
         if not values_match:
             return []
         
-        values_str = values_match.group(1)
-        
-        # Parse each row tuple - handle nested parentheses
-        row_pattern = r'\(([^)]+(?:\([^)]*\)[^)]*)*)\)'
-        rows = re.findall(row_pattern, values_str)
+        # Parse each row tuple - handle nested parentheses and quotes
+        rows = list(self._iter_row_tuples(
+            data, values_match.start(1), values_match.end(1)
+        ))
         
         print(f"Found {len(rows)} lean theorems to convert...")
         
@@ -731,9 +1218,9 @@ class SupabaseRESTMigrationManager:
             # Parse the row values
             # Format: tactic, state_after, state_before, 
             # statement_latex, statement_lean
-            values = self._parse_sql_row(row)
+            values = self._parse_sql_row(row, LEAN_THEOREMS_DUMP_FIELDS)
             
-            if len(values) >= 5:
+            if len(values) >= LEAN_THEOREMS_DUMP_FIELDS:
                 tactic = values[0] or ''
                 state_after = values[1] or 'no goals'
                 state_before = values[2] or 'no state'
@@ -746,50 +1233,49 @@ class SupabaseRESTMigrationManager:
                 ).hexdigest()[:16]
                 problem_id = f"prob_{i+1:05d}_{content_hash}"
                 
-                problems_data.append({
-                    'problem_id': problem_id,
-                    'statement_latex': statement_latex,
-                    'statement_lean': statement_lean,
-                    'state_before_lean': state_before,
-                    'state_after_lean': state_after,
-                    'tactic_lean': tactic
-                })
-            
-            # Show progress
-            if (i + 1) % 1000 == 0:
-                print(f"  Processed {i + 1} theorems...")
+                problems_data.append((
+                    problem_id,
+                    statement_latex,
+                    statement_lean,
+                    state_before,
+                    state_after,
+                    tactic
+                ))
+            
+            progress.update()
         
         return problems_data
     
-    def _parse_sql_row(self, row: str) -> List[str]:
+    @staticmethod
+    def _parse_sql_row(row: str,
+                       max_fields: Optional[int] = None) -> List[str]:
         """
         Parse a single SQL row tuple into values.
         
         Args:
             row: Row string (inside parentheses)
+            max_fields: Stop after this many leading fields; callers
+                that only read fixed positions skip the trailing ones
             
         Returns:
             list: List of values
         """
         values = []
-        current = ""
-        in_quote = False
-        
-        for char in row + ',':
-            if char == "'" and (not current or current[-1] != '\\'):
-                in_quote = not in_quote
-                current += char
-            elif char == ',' and not in_quote:
-                value = current.strip().strip("'")
-                # Handle escaped quotes
-                value = value.replace("''", "'")
-                # Handle NULL
-                if value.upper() == 'NULL':
-                    value = None
-                values.append(value)
-                current = ""
+        pos = 0
+        
+        while len(values) != max_fields:
+            match = FIELD_RE.match(row, pos)
+            quoted, bare, separator = match.groups()
+            if quoted is not None:
+                value = quoted.replace("''", "'")
+            elif bare.upper() == 'NULL':
+                value = None
             else:
-                current += char
+                value = bare.strip("'").replace("''", "'")
+            values.append(value)
+            if not separator:
+                break
+            pos = match.end()
         
         return values
 
@@ -849,6 +1335,29 @@ class SupabaseRESTMigrationManager:
         return True
 
 
+def _parse_insert_span(task: Tuple[str, int, int]) -> List[List[Optional[str]]]:
+    """
+    Parse the rows of one INSERT statement (multiprocessing worker).
+    
+    Args:
+        task: (sql_path, start, end) of the statement's VALUES list
+        
+    Returns:
+        list: Parsed values of each row, in order
+    """
+    sql_path, start, end = task
+    with open(sql_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return [
+            SupabaseRESTMigrationManager._parse_sql_row(
+                row, PROBLEMS_DUMP_FIELDS
+            )
+            for row in SupabaseRESTMigrationManager._iter_row_tuples(
+                data, start, end
+            )
+        ]
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
@@ -861,6 +1370,9 @@ def main():
         print("  python manage_migration_rest.py seed-direct [sql_file] [limit] # Seed via DATABASE_URL")
         print("  python manage_migration_rest.py all [sql_file]               # Run all")
         print()
+        print("Flags:")
+        print("  --quiet - Suppress per-batch progress lines")
+        print()
         print("Environment Variables:")
         print("  DATABASE_URL - PostgreSQL connection (for schema migrations and direct seeding)")
         print("  SUPABASE_URL - Supabase REST API URL (optional, for REST API seeding)")
@@ -872,6 +1384,13 @@ def main():
         print("  python manage_migration_rest.py seed wkbk_lean.sql 100         # Seed via REST API")
         sys.exit(1)
     
+    # Progress lines flush themselves; let everything else block-buffer
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
+    if "--quiet" in sys.argv:
+        sys.argv.remove("--quiet")
+        ProgressCounter.quiet = True
+    
     command = sys.argv[1].lower()
     
     try:
@@ -24,7 +24,7 @@ from pathlib import Path
 # Add current directory to path to import manage_migration_rest
 sys.path.insert(0, str(Path(__file__).parent))
 
-from manage_migration_rest import SupabaseRESTMigrationManager
+from manage_migration_rest import ProgressCounter, SupabaseRESTMigrationManager
 
 
 def print_usage():
@@ -40,13 +40,17 @@ def print_usage():
     print("  migrate         Run database schema migrations via DATABASE_URL")
     print("  seed <file>     Seed database from SQL file via PostgREST API")
     print("                  Optional [limit] parameter to limit number of rows")
-    print("                  Optional flags: --upsert, --force")
+    print("                  Optional flags: --upsert, --force, --batch-size N,")
+    print("                  --concurrency N")
     print("  test            Test both DATABASE_URL and REST API connections")
     print()
     print("Seed Modes:")
-    print("  Default         INSERT only (fails on duplicates)")
+    print("  Default         INSERT only (skips existing rows)")
     print("  --upsert        UPSERT mode (update existing, insert new)")
     print("  --force         FORCE mode (clear table before seeding)")
+    print("  --batch-size N  Rows per POST (default: 100)")
+    print("  --concurrency N Batches in flight at once (default: 16)")
+    print("  --quiet         Suppress per-batch progress lines")
     print()
     print("Environment Variables Required:")
     print("  DATABASE_URL          PostgreSQL connection string (for schema migrations)")
@@ -68,6 +72,9 @@ def main():
         print_usage()
         sys.exit(1)
     
+    # Progress lines flush themselves; let everything else block-buffer
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     command = sys.argv[1].lower()
     
     # Validate command
@@ -112,19 +119,35 @@ def main():
             limit = None
             upsert = False
             force_clear = False
+            batch_size = 100
+            concurrency = 16
             
-            for i in range(3, len(sys.argv)):
-                arg = sys.argv[i]
+            args = iter(sys.argv[3:])
+            for arg in args:
                 if arg == '--upsert':
                     upsert = True
                 elif arg == '--force':
                     force_clear = True
+                elif arg == '--batch-size':
+                    value = next(args, '')
+                    if not value.isdigit() or int(value) == 0:
+                        print("Error: --batch-size requires a positive number")
+                        sys.exit(1)
+                    batch_size = int(value)
+                elif arg == '--concurrency':
+                    value = next(args, '')
+                    if not value.isdigit() or int(value) == 0:
+                        print("Error: --concurrency requires a positive number")
+                        sys.exit(1)
+                    concurrency = int(value)
+                elif arg == '--quiet':
+                    ProgressCounter.quiet = True
                 elif arg.isdigit():
                     limit = int(arg)
                 else:
                     print(f"Error: Unknown argument '{arg}'")
                     print()
-                    print("Valid arguments: <limit_number>, --upsert, --force")
+                    print("Valid arguments: <limit_number>, --upsert, --force, --batch-size N, --concurrency N, --quiet")
                     sys.exit(1)
             
             # Validate: can't use both --upsert and --force
@@ -148,7 +171,9 @@ def main():
                 sql_file=sql_file,
                 limit=limit,
                 upsert=upsert,
-                force_clear=force_clear
+                force_clear=force_clear,
+                batch_size=batch_size,
+                concurrency=concurrency
             )
             sys.exit(0 if success else 1)
     
@@ -8,6 +8,15 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 
+# lean_theorems is left over from old migrations
+RESET_TABLES = (
+    "submission_results",
+    "submissions",
+    "problems",
+    "lean_theorems",
+    "alembic_version",
+)
+
 def get_database_url():
     """Get database URL from environment."""
     database_url = os.getenv("DATABASE_URL")
@@ -24,47 +33,15 @@ def reset_database():
     print("WARNING: This will drop ALL tables and delete ALL data!")
     print(f"Database: {database_url.split('@')[1] if '@' in database_url else database_url}")
     
-    with engine.connect() as conn:
-        # Drop tables in correct order (respect foreign keys)
-        print("\n1. Dropping tables...")
-        
-        # Drop submission_results first (has FK to submissions)
-        try:
-            conn.execute(text("DROP TABLE IF EXISTS submission_results CASCADE"))
-            print("   ✓ Dropped submission_results")
-        except Exception as e:
-            print(f"   - submission_results: {e}")
-        
-        # Drop submissions (has FK to problems)
-        try:
-            conn.execute(text("DROP TABLE IF EXISTS submissions CASCADE"))
-            print("   ✓ Dropped submissions")
-        except Exception as e:
-            print(f"   - submissions: {e}")
-        
-        # Drop problems
-        try:
-            conn.execute(text("DROP TABLE IF EXISTS problems CASCADE"))
-            print("   ✓ Dropped problems")
-        except Exception as e:
-            print(f"   - problems: {e}")
-        
-        # Drop lean_theorems (if exists from old migrations)
-        try:
-            conn.execute(text("DROP TABLE IF EXISTS lean_theorems CASCADE"))
-            print("   ✓ Dropped lean_theorems")
-        except Exception as e:
-            print(f"   - lean_theorems: {e}")
-        
-        # Clear alembic version history
-        print("\n2. Clearing alembic version history...")
-        try:
-            conn.execute(text("DROP TABLE IF EXISTS alembic_version CASCADE"))
-            print("   ✓ Cleared alembic_version")
-        except Exception as e:
-            print(f"   - alembic_version: {e}")
-        
-        conn.commit()
+    # One DROP for everything, in one transaction: CASCADE takes care of
+    # FK order, and a failure rolls the whole reset back
+    print("\nDropping tables and alembic version history...")
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"DROP TABLE IF EXISTS {', '.join(RESET_TABLES)} CASCADE"
+        ))
+    for table in RESET_TABLES:
+        print(f"   ✓ Dropped {table}")
     
     print("\n✓ Database reset complete!")
     print("\nNext steps:")
@@ -0,0 +1,73 @@
+"""status_enums
+
+Revision ID: 2b087bd57636
+Revises: 70a04245574e
+Create Date: 2026-10-15 11:20:37.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '2b087bd57636'
+down_revision: Union[str, Sequence[str], None] = '70a04245574e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+submission_status = postgresql.ENUM(
+    'pending', 'processing', 'completed', 'failed',
+    name='submission_status'
+)
+submission_verdict = postgresql.ENUM(
+    'accepted', 'rejected', name='submission_verdict'
+)
+lean_status = postgresql.ENUM(
+    'success', 'failed', 'error', 'guardrail_failed', name='lean_status'
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    submission_status.create(op.get_bind(), checkfirst=True)
+    submission_verdict.create(op.get_bind(), checkfirst=True)
+    lean_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column('submissions', 'status',
+               existing_type=sa.String(length=20),
+               type_=submission_status,
+               existing_nullable=False,
+               postgresql_using='status::submission_status')
+    op.alter_column('submission_results', 'verdict',
+               existing_type=sa.String(length=20),
+               type_=submission_verdict,
+               existing_nullable=False,
+               postgresql_using='verdict::submission_verdict')
+    op.alter_column('submission_results', 'lean_status',
+               existing_type=sa.String(length=20),
+               type_=lean_status,
+               existing_nullable=False,
+               postgresql_using='lean_status::lean_status')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('submission_results', 'lean_status',
+               existing_type=lean_status,
+               type_=sa.String(length=20),
+               existing_nullable=False,
+               postgresql_using='lean_status::text')
+    op.alter_column('submission_results', 'verdict',
+               existing_type=submission_verdict,
+               type_=sa.String(length=20),
+               existing_nullable=False,
+               postgresql_using='verdict::text')
+    op.alter_column('submissions', 'status',
+               existing_type=submission_status,
+               type_=sa.String(length=20),
+               existing_nullable=False,
+               postgresql_using='status::text')
+    lean_status.drop(op.get_bind(), checkfirst=True)
+    submission_verdict.drop(op.get_bind(), checkfirst=True)
+    submission_status.drop(op.get_bind(), checkfirst=True)
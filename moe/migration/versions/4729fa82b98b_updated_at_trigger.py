@@ -0,0 +1,47 @@
+"""updated_at_trigger
+
+Revision ID: 4729fa82b98b
+Revises: 3e41f61c35af
+Create Date: 2026-10-15 12:31:54.118702
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4729fa82b98b'
+down_revision: Union[str, Sequence[str], None] = '3e41f61c35af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose updated_at column is maintained by the trigger
+TABLES = ('problems', 'submissions')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(
+            f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}"
+        )
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,47 @@
+"""constraint_naming_convention
+
+Revision ID: de4e1a39c2e6
+Revises: 4729fa82b98b
+Create Date: 2026-10-15 13:21:48.905512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de4e1a39c2e6'
+down_revision: Union[str, Sequence[str], None] = '4729fa82b98b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, PostgreSQL default name, Base.metadata naming convention name)
+RENAMES = [
+    ('problems', 'problems_pkey', 'pk_problems'),
+    ('submissions', 'submissions_pkey', 'pk_submissions'),
+    ('submission_results', 'submission_results_pkey',
+     'pk_submission_results'),
+    ('submissions', 'submissions_problem_id_fkey',
+     'fk_submissions_problem_id_problems'),
+    ('submission_results', 'submission_results_submission_id_fkey',
+     'fk_submission_results_submission_id_submissions'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, old_name, new_name in RENAMES:
+        op.execute(
+            f'ALTER TABLE {table} RENAME CONSTRAINT {old_name} '
+            f'TO {new_name}'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, old_name, new_name in RENAMES:
+        op.execute(
+            f'ALTER TABLE {table} RENAME CONSTRAINT {new_name} '
+            f'TO {old_name}'
+        )
@@ -5,24 +5,80 @@ This module contains pure business logic with NO framework dependencies.
 Can be used by both API and Worker services.
 """
 
-import json
+import asyncio
+import bisect
+import hashlib
 import logging
+import os
 import random
+import secrets
+import threading
 import time
-import uuid
-from datetime import datetime
-from typing import Any, Optional
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterator, Mapping, Optional
 
 import httpx
+import orjson
+from sqlalchemy import and_, func, or_, update
 from sqlalchemy.orm import Session
 
 from common.models import Problem, Submission, SubmissionResult
 
 logger = logging.getLogger(__name__)
 
-# Cache the count for 5 minutes to avoid the HEAD request every time
-_count_cache = {"count": 0, "timestamp": 0}
+# Cache the problem_id key range for 5 minutes; random picks sample it.
+# The API also shares it through Redis so workers don't each refetch it.
+_key_range_cache: dict[str, Any] = {"range": None, "timestamp": 0}
 _CACHE_TTL = 300  # 5 minutes
+KEY_RANGE_CACHE_KEY = "moe:problems:key_range"
+
+# Single-flight guards so one caller per process refreshes a stale range
+_key_range_refresh_lock = threading.Lock()
+_key_range_refresh: Optional[threading.Event] = None
+_key_range_inflight: dict[str, asyncio.Future] = {}
+
+# Lowest and highest problem_id, each a single primary-key index probe
+_KEY_RANGE_PARAMS = (
+    {"select": "problem_id", "order": "problem_id.asc", "limit": "1"},
+    {"select": "problem_id", "order": "problem_id.desc", "limit": "1"},
+)
+_FIRST_PROBLEM_PARAMS = {"order": "problem_id.asc", "limit": "1"}
+
+# Digit sets random pivots are built from, narrowest first; each is in
+# ascending byte order so pivots sort like the ids they sample
+_PIVOT_ALPHABETS = (
+    "0123456789",
+    "0123456789abcdef",
+    "-0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz",
+)
+
+# Redis response cache for problem lookups
+RANDOM_PROBLEM_CACHE_TTL = 5  # seconds per rotating bucket
+RANDOM_PROBLEM_CACHE_SHARDS = 8  # distinct random problems per bucket
+PROBLEM_CACHE_TTL = 3600  # problems are immutable once seeded
+
+# Process-wide keep-alive client for the sync Supabase helpers. Created
+# lazily so forked workers never inherit a parent's open sockets.
+_sync_client: Optional[httpx.Client] = None
+_sync_client_lock = threading.Lock()
+
+# Progress ticks within one status are coalesced to at most one commit
+# per interval; status changes and terminal states always commit
+PROGRESS_FLUSH_INTERVAL = 1.0  # seconds
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+_pending_progress: dict[str, tuple[str, int]] = {}
+_last_progress_flush: dict[str, tuple[str, float]] = {}
+_progress_lock = threading.Lock()
+
+# A worker may claim a submission that is pending or failed, or one left
+# "processing" longer than the Celery hard time limit: no live task can
+# run that long, so its previous worker died
+CLAIMABLE_STATUSES = ("pending", "failed")
+TASK_TIME_LIMIT = 3600  # seconds; Celery task_time_limit
+PROCESSING_STALE_AFTER = timedelta(seconds=TASK_TIME_LIMIT)
 
 
 class ProblemNotFoundError(Exception):
@@ -45,17 +101,377 @@ class ValidationError(Exception):
 
 def generate_problem_id() -> str:
     """Generate unique problem ID."""
-    return f"moe-{uuid.uuid4().hex[:8]}"
+    return f"moe-{secrets.token_urlsafe(6)}"
 
 
 def generate_submission_id() -> str:
     """Generate unique submission ID."""
-    return f"sub-{uuid.uuid4().hex[:8]}"
+    return f"sub-{secrets.token_urlsafe(6)}"
+
+
+def random_problem_cache_key() -> str:
+    """
+    Build the Redis key for a random-problem cache slot.
+
+    Keys rotate every RANDOM_PROBLEM_CACHE_TTL seconds and are spread
+    over RANDOM_PROBLEM_CACHE_SHARDS slots so callers still see a mix
+    of problems within one window.
+
+    Returns:
+        str: Redis cache key
+    """
+    bucket = int(time.time()) // RANDOM_PROBLEM_CACHE_TTL
+    shard = random.randrange(RANDOM_PROBLEM_CACHE_SHARDS)
+    return f"moe:random:{bucket}:{shard}"
+
+
+def problem_cache_key(problem_id: str) -> str:
+    """Build the Redis key for a cached problem by ID."""
+    return f"moe:problem:{problem_id}"
+
+
+def problem_etag(problem: dict[str, Any]) -> str:
+    """
+    Build a strong HTTP ETag for a problem payload.
+
+    Args:
+        problem: Problem data dictionary
+
+    Returns:
+        str: Quoted ETag value
+    """
+    digest = hashlib.blake2b(
+        problem["problem_id"].encode() + problem["statement_latex"].encode(),
+        digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+async def get_cached_problem(
+    redis_client: Any,
+    key: str
+) -> Optional[dict[str, Any]]:
+    """
+    Read a cached problem from Redis.
+
+    Cache errors are logged and treated as a miss so callers fall
+    back to Supabase.
+
+    Args:
+        redis_client: Async Redis client (decode_responses=True)
+        key: Cache key
+
+    Returns:
+        Problem data dictionary or None on miss/error
+    """
+    try:
+        cached = await redis_client.get(key)
+    except Exception as e:
+        logger.warning(f"Problem cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(cached) if cached else None
+
+
+async def cache_problem(
+    redis_client: Any,
+    key: str,
+    problem: dict[str, Any],
+    ttl: int
+) -> None:
+    """
+    Store a problem in Redis with an expiry.
+
+    Args:
+        redis_client: Async Redis client
+        key: Cache key
+        problem: Problem data dictionary
+        ttl: Time to live in seconds
+    """
+    try:
+        await redis_client.setex(key, ttl, orjson.dumps(problem))
+    except Exception as e:
+        logger.warning(f"Problem cache write failed for {key}: {e}")
+
+
+async def coalesce(
+    inflight: dict[str, asyncio.Future],
+    key: str,
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Share one in-flight fetch between concurrent callers of the same key.
+
+    The first caller runs fetch(); callers arriving before it finishes
+    await the same future instead of issuing their own request.
+
+    Args:
+        inflight: Per-process map of key to pending future
+        key: Coalescing key (e.g. the problem cache key)
+        fetch: Zero-argument coroutine factory performing the lookup
+
+    Returns:
+        Result of fetch()
+    """
+    pending = inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await fetch()
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a fetch with no followers doesn't log a warning
+        future.exception()
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight.pop(key, None)
+
+
+def create_http_client(http2: bool = True) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client for Supabase REST calls.
+
+    Services should create one client at startup and pass it to the
+    Supabase helpers so connections are kept alive between requests.
+
+    Args:
+        http2: Enable HTTP/2 (requires the httpx[http2] extra)
+
+    Returns:
+        httpx.AsyncClient: Configured HTTP client
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20
+        ),
+        timeout=30.0,
+        http2=http2
+    )
+
+
+@lru_cache(maxsize=4)
+def _supabase_headers(supabase_secret_key: str) -> Mapping[str, str]:
+    """
+    Build the auth headers for Supabase REST calls.
+
+    Memoized per key and read-only, since every call shares the result.
+    """
+    return MappingProxyType({
+        "apikey": supabase_secret_key,
+        "Authorization": f"Bearer {supabase_secret_key}",
+        "Content-Type": "application/json"
+    })
+
+
+def _rows(response: httpx.Response) -> list[dict[str, Any]]:
+    """Raise on an error status, then decode a PostgREST row list."""
+    response.raise_for_status()
+    return response.json()
+
+
+def _store_key_range(
+    lowest: list[dict[str, Any]],
+    highest: list[dict[str, Any]]
+) -> Optional[tuple[str, str]]:
+    """Cache the problem_id range (None when the table is empty)."""
+    key_range = None
+    if lowest and highest:
+        key_range = (lowest[0]["problem_id"], highest[0]["problem_id"])
+
+    return _remember_key_range(key_range)
+
+
+def _remember_key_range(
+    key_range: Optional[tuple[str, str]]
+) -> Optional[tuple[str, str]]:
+    """Store a problem_id range in the in-process cache."""
+    _key_range_cache["range"] = key_range
+    _key_range_cache["timestamp"] = time.time()
+    return key_range
+
+
+async def _load_shared_key_range(
+    redis_client: Any
+) -> Optional[list[str]]:
+    """
+    Read the problem_id range cached in Redis by any process.
+
+    Args:
+        redis_client: Async Redis client
+
+    Returns:
+        [low, high], [] for an empty table, or None on miss/error
+    """
+    try:
+        cached = await redis_client.get(KEY_RANGE_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Key range cache read failed: {e}")
+        return None
+
+    return orjson.loads(cached) if cached else None
+
+
+async def _save_shared_key_range(
+    redis_client: Any,
+    key_range: Optional[tuple[str, str]]
+) -> None:
+    """Share a freshly fetched problem_id range through Redis."""
+    try:
+        await redis_client.setex(
+            KEY_RANGE_CACHE_KEY,
+            _CACHE_TTL,
+            orjson.dumps(list(key_range or ()))
+        )
+    except Exception as e:
+        logger.warning(f"Key range cache write failed: {e}")
+
+
+def _key_range_stale() -> bool:
+    """Check whether the cached problem_id range needs a refresh."""
+    return time.time() - _key_range_cache["timestamp"] > _CACHE_TTL
+
+
+def _refresh_key_range_once(
+    fetch: Callable[[], Optional[tuple[str, str]]]
+) -> Optional[tuple[str, str]]:
+    """
+    Refresh the key range from one thread while the others wait.
+
+    The first thread to find the range stale runs fetch(); threads
+    arriving meanwhile wait for it (up to 5s) and reuse its result,
+    fetching themselves only if it failed or timed out.
+
+    Args:
+        fetch: Fetches and caches the range
+
+    Returns:
+        The refreshed problem_id range (None if the table is empty)
+    """
+    global _key_range_refresh
+
+    with _key_range_refresh_lock:
+        event = _key_range_refresh
+        leader = event is None
+        if leader:
+            event = _key_range_refresh = threading.Event()
+
+    if not leader:
+        event.wait(timeout=5)
+        if not _key_range_stale():
+            return _key_range_cache["range"]
+        return fetch()
+
+    try:
+        return fetch()
+    finally:
+        with _key_range_refresh_lock:
+            _key_range_refresh = None
+        event.set()
+
+
+def _random_key_between(low: str, high: str) -> str:
+    """
+    Pick a random pivot key between two problem_ids.
+
+    The part after the shared prefix is read as a fixed-width number
+    over the narrowest alphabet covering both keys, so sequential ids
+    (wkbk_00001...) are sampled uniformly. Mixed id schemes fall back to
+    the widest alphabet, where ids are sparse and the pick is only
+    approximately uniform.
+
+    Args:
+        low: Smallest problem_id
+        high: Largest problem_id
+
+    Returns:
+        str: Pivot key, between low and high in byte order
+    """
+    prefix = os.path.commonprefix([low, high])
+    low_tail, high_tail = low[len(prefix):], high[len(prefix):]
+    alphabet = next(
+        (
+            chars for chars in _PIVOT_ALPHABETS
+            if set(low_tail + high_tail) <= set(chars)
+        ),
+        _PIVOT_ALPHABETS[-1]
+    )
+    base = len(alphabet)
+    width = max(len(low_tail), len(high_tail))
+
+    def to_int(tail: str) -> int:
+        value = 0
+        for char in tail.ljust(width, alphabet[0]):
+            digit = bisect.bisect_left(alphabet, char)
+            value = value * base + min(digit, base - 1)
+        return value
+
+    pivot = random.randint(to_int(low_tail), to_int(high_tail))
+    chars = []
+    for _ in range(width):
+        pivot, digit = divmod(pivot, base)
+        chars.append(alphabet[digit])
+    return prefix + "".join(reversed(chars))
+
+
+def _random_pick_params(key_range: tuple[str, str]) -> dict[str, str]:
+    """Build the first-row-at-or-after-a-random-pivot query."""
+    return {
+        "problem_id": f"gte.{_random_key_between(*key_range)}",
+        "order": "problem_id.asc",
+        "limit": "1"
+    }
+
+
+def _get_sync_client() -> httpx.Client:
+    """Return the process-wide sync client, creating it on first use."""
+    global _sync_client
+
+    if _sync_client is None:
+        with _sync_client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=64,
+                        max_keepalive_connections=32
+                    ),
+                    timeout=10.0,
+                    http2=True
+                )
+    return _sync_client
+
+
+def close_supabase_client() -> None:
+    """Close the process-wide sync client, if one was created."""
+    global _sync_client
+
+    with _sync_client_lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+@contextmanager
+def _supabase_client(
+    client: Optional[httpx.Client]
+) -> Iterator[httpx.Client]:
+    """Yield the given client, or the pooled process-wide one."""
+    yield client if client is not None else _get_sync_client()
 
 
 def get_random_problem_from_supabase(
     supabase_url: str,
-    supabase_secret_key: str
+    supabase_secret_key: str,
+    client: Optional[httpx.Client] = None
 ) -> Optional[dict[str, Any]]:
     """
     Fetch a random problem from Supabase.
@@ -63,6 +479,7 @@ def get_random_problem_from_supabase(
     Args:
         supabase_url: Supabase REST API URL
         supabase_secret_key: Supabase service role secret key
+        client: Shared HTTP client (the pooled one is used if None)
 
     Returns:
         Problem data dictionary or None if no problems exist
@@ -70,56 +487,44 @@ def get_random_problem_from_supabase(
     Raises:
         httpx.HTTPError: If API request fails
     """
-    headers = {
-        "apikey": supabase_secret_key,
-        "Authorization": f"Bearer {supabase_secret_key}",
-        "Content-Type": "application/json"
-    }
-
-    with httpx.Client() as client:
-        # Use cached count if available and fresh
-        now = time.time()
-        if now - _count_cache["timestamp"] > _CACHE_TTL:
-            # Refresh count
-            count_response = client.head(
-                f"{supabase_url}/problems",
-                headers={**headers, "Prefer": "count=exact"}
+    headers = _supabase_headers(supabase_secret_key)
+    url = f"{supabase_url}/problems"
+
+    with _supabase_client(client) as client:
+        key_range = _key_range_cache["range"]
+        if _key_range_stale():
+            key_range = _refresh_key_range_once(
+                lambda: _store_key_range(*(
+                    _rows(client.get(url, headers=headers, params=params))
+                    for params in _KEY_RANGE_PARAMS
+                ))
             )
-            count_response.raise_for_status()
-            
-            content_range = count_response.headers.get("Content-Range", "")
-            if not content_range or "/" not in content_range:
-                return None
-            
-            _count_cache["count"] = int(content_range.split("/")[1])
-            _count_cache["timestamp"] = now
-        
-        total_count = _count_cache["count"]
-        
-        if total_count == 0:
+
+        if key_range is None:
             return None
-        
-        # Fetch random row
-        random_offset = random.randint(0, total_count - 1)
-        
-        response = client.get(
-            f"{supabase_url}/problems",
-            headers={**headers, "Prefer": "count=none"},
-            params={
-                "limit": "1",
-                "offset": str(random_offset)
-            }
-        )
-        response.raise_for_status()
-        problems = response.json()
-        
+
+        # Indexed range probe instead of OFFSET, which scans and discards
+        problems = _rows(client.get(
+            url,
+            headers=headers,
+            params=_random_pick_params(key_range)
+        ))
+        if not problems:
+            # Rows above the pivot were deleted since the range was cached
+            problems = _rows(client.get(
+                url,
+                headers=headers,
+                params=_FIRST_PROBLEM_PARAMS
+            ))
+
         return problems[0] if problems else None
 
 
 def get_problem_by_id_from_supabase(
     problem_id: str,
     supabase_url: str,
-    supabase_secret_key: str
+    supabase_secret_key: str,
+    client: Optional[httpx.Client] = None
 ) -> Optional[dict[str, Any]]:
     """
     Fetch a specific problem from Supabase.
@@ -128,6 +533,7 @@ def get_problem_by_id_from_supabase(
         problem_id: Problem identifier
         supabase_url: Supabase REST API URL
         supabase_secret_key: Supabase service role secret key
+        client: Shared HTTP client (the pooled one is used if None)
 
     Returns:
         Problem data dictionary or None if not found
@@ -135,13 +541,9 @@ def get_problem_by_id_from_supabase(
     Raises:
         httpx.HTTPError: If API request fails
     """
-    headers = {
-        "apikey": supabase_secret_key,
-        "Authorization": f"Bearer {supabase_secret_key}",
-        "Content-Type": "application/json"
-    }
+    headers = _supabase_headers(supabase_secret_key)
 
-    with httpx.Client() as client:
+    with _supabase_client(client) as client:
         response = client.get(
             f"{supabase_url}/problems",
             headers=headers,
@@ -156,6 +558,160 @@ def get_problem_by_id_from_supabase(
         return problems[0]
 
 
+async def aget_random_problem_from_supabase(
+    client: httpx.AsyncClient,
+    supabase_url: str,
+    supabase_secret_key: str,
+    redis_client: Any = None
+) -> Optional[dict[str, Any]]:
+    """
+    Fetch a random problem from Supabase without blocking the event loop.
+
+    Args:
+        client: Shared async HTTP client
+        supabase_url: Supabase REST API URL
+        supabase_secret_key: Supabase service role secret key
+        redis_client: Async Redis client used to share the cached key
+            range across processes (in-process only if None)
+
+    Returns:
+        Problem data dictionary or None if no problems exist
+
+    Raises:
+        httpx.HTTPError: If API request fails
+    """
+    headers = _supabase_headers(supabase_secret_key)
+    url = f"{supabase_url}/problems"
+
+    async def refresh_key_range() -> Optional[tuple[str, str]]:
+        shared = None
+        if redis_client is not None:
+            shared = await _load_shared_key_range(redis_client)
+
+        if shared is not None:
+            return _remember_key_range(tuple(shared) or None)
+
+        responses = await asyncio.gather(*(
+            client.get(url, headers=headers, params=params)
+            for params in _KEY_RANGE_PARAMS
+        ))
+        key_range = _store_key_range(*map(_rows, responses))
+        if redis_client is not None:
+            await _save_shared_key_range(redis_client, key_range)
+        return key_range
+
+    key_range = _key_range_cache["range"]
+    if _key_range_stale():
+        # Concurrent requests after expiry share a single refresh
+        key_range = await coalesce(
+            _key_range_inflight,
+            KEY_RANGE_CACHE_KEY,
+            refresh_key_range
+        )
+
+    if key_range is None:
+        return None
+
+    # Indexed range probe instead of OFFSET, which scans and discards
+    problems = _rows(await client.get(
+        url,
+        headers=headers,
+        params=_random_pick_params(key_range)
+    ))
+    if not problems:
+        # Rows above the pivot were deleted since the range was cached
+        problems = _rows(await client.get(
+            url,
+            headers=headers,
+            params=_FIRST_PROBLEM_PARAMS
+        ))
+
+    return problems[0] if problems else None
+
+
+async def aget_random_problems_from_supabase(
+    client: httpx.AsyncClient,
+    supabase_url: str,
+    supabase_secret_key: str,
+    count: int,
+    redis_client: Any = None
+) -> list[dict[str, Any]]:
+    """
+    Fetch several random problems with overlapping round trips.
+
+    Picks are independent, so the same problem may appear more than
+    once.
+
+    Args:
+        client: Shared async HTTP client
+        supabase_url: Supabase REST API URL
+        supabase_secret_key: Supabase service role secret key
+        count: Number of problems to fetch
+        redis_client: Async Redis client sharing the cached key range
+
+    Returns:
+        List of problem data dictionaries (empty if no problems exist)
+
+    Raises:
+        httpx.HTTPError: If API request fails
+    """
+    if count <= 0:
+        return []
+
+    # The first pick refreshes the cached key range; the rest reuse it
+    first = await aget_random_problem_from_supabase(
+        client,
+        supabase_url,
+        supabase_secret_key,
+        redis_client
+    )
+    if first is None:
+        return []
+
+    rest = await asyncio.gather(*(
+        aget_random_problem_from_supabase(
+            client,
+            supabase_url,
+            supabase_secret_key,
+            redis_client
+        )
+        for _ in range(count - 1)
+    ))
+    return [first, *(problem for problem in rest if problem is not None)]
+
+
+async def aget_problem_by_id_from_supabase(
+    client: httpx.AsyncClient,
+    problem_id: str,
+    supabase_url: str,
+    supabase_secret_key: str
+) -> Optional[dict[str, Any]]:
+    """
+    Fetch a specific problem from Supabase without blocking the event loop.
+
+    Args:
+        client: Shared async HTTP client
+        problem_id: Problem identifier
+        supabase_url: Supabase REST API URL
+        supabase_secret_key: Supabase service role secret key
+
+    Returns:
+        Problem data dictionary or None if not found
+
+    Raises:
+        httpx.HTTPError: If API request fails
+    """
+    response = await client.get(
+        f"{supabase_url}/problems",
+        headers=_supabase_headers(supabase_secret_key),
+        params={"problem_id": f"eq.{problem_id}"}
+    )
+    response.raise_for_status()
+    problems = response.json()
+
+    return problems[0] if problems else None
+
+
 def create_submission(
     db: Session,
     problem_id: str,
@@ -201,6 +757,63 @@ def create_submission(
     return submission
 
 
+def create_submissions(
+    db: Session,
+    items: list[tuple[str, str]]
+) -> list[Submission]:
+    """
+    Create several submission records in one transaction.
+
+    Args:
+        db: Database session
+        items: (problem_id, solution_latex) pairs
+
+    Returns:
+        Created submission instances, in input order
+
+    Raises:
+        ValidationError: If any problem_id is invalid
+    """
+    problem_ids = {problem_id for problem_id, _ in items}
+    found = {
+        row.problem_id
+        for row in db.query(Problem.problem_id).filter(
+            Problem.problem_id.in_(problem_ids)
+        )
+    }
+    missing = sorted(problem_ids - found)
+    if missing:
+        raise ValidationError(
+            f"Problems not found: {', '.join(missing)}"
+        )
+
+    submissions = [
+        Submission(
+            submission_id=generate_submission_id(),
+            problem_id=problem_id,
+            submission_latex=solution_latex,
+            status="pending",
+            progress=0
+        )
+        for problem_id, solution_latex in items
+    ]
+
+    db.bulk_save_objects(submissions)
+    db.commit()
+
+    # Reload in one query to pick up server-side timestamps
+    submission_ids = [s.submission_id for s in submissions]
+    by_id = {
+        s.submission_id: s
+        for s in db.query(Submission).filter(
+            Submission.submission_id.in_(submission_ids)
+        )
+    }
+
+    logger.info(f"Created {len(submission_ids)} submissions in batch")
+    return [by_id[submission_id] for submission_id in submission_ids]
+
+
 def get_submission_by_id(
     db: Session,
     submission_id: str
@@ -220,6 +833,59 @@ def get_submission_by_id(
     ).first()
 
 
+def claim_submission(db: Session, submission_id: str) -> bool:
+    """
+    Atomically mark a submission as processing if no one else owns it.
+
+    The conditional UPDATE is the check and the claim in one statement,
+    so a duplicate delivery of the same task cannot run the pipeline
+    twice: the second UPDATE waits on the row lock, then matches nothing.
+
+    Args:
+        db: Database session
+        submission_id: Submission identifier
+
+    Returns:
+        bool: True if this caller now owns the submission, False if it is
+        completed or being processed by a live worker
+
+    Raises:
+        SubmissionNotFoundError: If submission doesn't exist
+    """
+    result = db.execute(
+        update(Submission)
+        .where(
+            Submission.submission_id == submission_id,
+            or_(
+                Submission.status.in_(CLAIMABLE_STATUSES),
+                and_(
+                    Submission.status == "processing",
+                    Submission.updated_at
+                    < func.now() - PROCESSING_STALE_AFTER
+                )
+            )
+        )
+        .values(status="processing", progress=0)
+    )
+    db.commit()
+
+    if result.rowcount == 1:
+        with _progress_lock:
+            _pending_progress.pop(submission_id, None)
+            _last_progress_flush[submission_id] = (
+                "processing",
+                time.monotonic()
+            )
+        logger.info(f"Claimed submission {submission_id}")
+        return True
+
+    if get_submission_by_id(db, submission_id) is None:
+        raise SubmissionNotFoundError(
+            f"Submission {submission_id} not found"
+        )
+    return False
+
+
 def update_submission_status(
     db: Session,
     submission_id: str,
@@ -229,6 +895,11 @@ def update_submission_status(
     """
     Update submission status and progress.
 
+    Repeated progress updates for an unchanged, non-terminal status are
+    buffered if the last commit for the submission is younger than
+    PROGRESS_FLUSH_INTERVAL; the next commit (or flush_progress) writes
+    the latest buffered value.
+
     Args:
         db: Database session
         submission_id: Submission identifier
@@ -238,26 +909,89 @@ def update_submission_status(
     Raises:
         SubmissionNotFoundError: If submission doesn't exist
     """
-    submission = get_submission_by_id(db, submission_id)
+    now = time.monotonic()
+
+    with _progress_lock:
+        last = _last_progress_flush.get(submission_id)
+        if (
+            status not in TERMINAL_STATUSES
+            and last is not None
+            and last[0] == status
+            and now - last[1] < PROGRESS_FLUSH_INTERVAL
+        ):
+            _pending_progress[submission_id] = (status, progress)
+            return
+
+        _pending_progress.pop(submission_id, None)
+        if status in TERMINAL_STATUSES:
+            _last_progress_flush.pop(submission_id, None)
+        else:
+            _last_progress_flush[submission_id] = (status, now)
+
+    _write_submission_status(db, submission_id, status, progress)
+    db.commit()
+    logger.info(
+        f"Updated submission {submission_id}: "
+        f"{status} ({progress}%)"
+    )
 
-    if not submission:
-        raise SubmissionNotFoundError(
-            f"Submission {submission_id} not found"
-        )
 
-    submission.status = status
-    submission.progress = progress
-    submission.updated_at = datetime.utcnow()
+def flush_progress(db: Session) -> int:
+    """
+    Commit all buffered progress updates in one transaction.
 
-    if status == "completed":
-        submission.evaluated_at = datetime.utcnow()
+    Args:
+        db: Database session
 
+    Returns:
+        int: Number of submissions written
+    """
+    now = time.monotonic()
+
+    with _progress_lock:
+        pending = list(_pending_progress.items())
+        _pending_progress.clear()
+        for submission_id, (status, _) in pending:
+            _last_progress_flush[submission_id] = (status, now)
+
+    if not pending:
+        return 0
+
+    for submission_id, (status, progress) in pending:
+        try:
+            _write_submission_status(db, submission_id, status, progress)
+        except SubmissionNotFoundError:
+            logger.warning(
+                f"Dropped progress for missing submission {submission_id}"
+            )
     db.commit()
-    logger.info(
-        f"Updated submission {submission_id}: "
-        f"{status} ({progress}%)"
+    return len(pending)
+
+
+def _write_submission_status(
+    db: Session,
+    submission_id: str,
+    status: str,
+    progress: int
+) -> None:
+    """Write a status/progress change in one UPDATE (no commit)."""
+    values: dict[str, Any] = {"status": status, "progress": progress}
+    if status == "completed":
+        values["evaluated_at"] = func.now()
+
+    # Single UPDATE instead of SELECT-then-flush; updated_at is left to
+    # the set_updated_at() trigger
+    result = db.execute(
+        update(Submission)
+        .where(Submission.submission_id == submission_id)
+        .values(**values)
     )
 
+    if result.rowcount == 0:
+        raise SubmissionNotFoundError(
+            f"Submission {submission_id} not found"
+        )
+
 
 def create_submission_result(
     db: Session,
@@ -316,6 +1050,64 @@ def create_submission_result(
     return result
 
 
+def complete_submission(
+    db: Session,
+    submission_id: str,
+    verdict: str,
+    lean_is_valid: bool,
+    lean_status: str,
+    lean_errors: Optional[list[Any]],
+    lean_remaining_goals: Optional[list[Any]],
+    feedback: Optional[list[str]]
+) -> SubmissionResult:
+    """
+    Store the result and mark the submission completed in one commit.
+
+    Pollers never see a completed submission without its result, and
+    the final bookkeeping costs one transaction instead of two.
+
+    Args:
+        db: Database session
+        submission_id: Submission identifier
+        verdict: Final verdict
+        lean_is_valid: Lean validation result
+        lean_status: Lean validation status
+        lean_errors: Validation errors
+        lean_remaining_goals: Remaining proof goals
+        feedback: Human-readable feedback
+
+    Returns:
+        Created submission result instance
+
+    Raises:
+        SubmissionNotFoundError: If submission doesn't exist
+    """
+    with _progress_lock:
+        _pending_progress.pop(submission_id, None)
+        _last_progress_flush.pop(submission_id, None)
+
+    # The UPDATE doubles as the existence check
+    _write_submission_status(db, submission_id, "completed", 100)
+
+    result = SubmissionResult(
+        submission_id=submission_id,
+        verdict=verdict,
+        lean_is_valid=lean_is_valid,
+        lean_status=lean_status,
+        lean_errors=lean_errors,
+        lean_remaining_goals=lean_remaining_goals,
+        feedback=feedback
+    )
+
+    db.add(result)
+    db.commit()
+
+    logger.info(
+        f"Completed submission {submission_id}: {verdict}"
+    )
+    return result
+
+
 def get_submission_result(
     db: Session,
     submission_id: str
@@ -333,3 +1125,29 @@ def get_submission_result(
     return db.query(SubmissionResult).filter(
         SubmissionResult.submission_id == submission_id
     ).first()
+
+
+def get_submission_with_result(
+    db: Session,
+    submission_id: str
+) -> tuple[Optional[Submission], Optional[SubmissionResult]]:
+    """
+    Retrieve a submission and its result in a single query.
+
+    Args:
+        db: Database session
+        submission_id: Submission identifier
+
+    Returns:
+        Tuple of (Submission or None, SubmissionResult or None)
+    """
+    row = db.query(Submission, SubmissionResult).outerjoin(
+        SubmissionResult,
+        SubmissionResult.submission_id == Submission.submission_id
+    ).filter(
+        Submission.submission_id == submission_id
+    ).first()
+
+    if row is None:
+        return None, None
+    return row[0], row[1]
@@ -7,9 +7,12 @@ This module initializes Celery with all necessary configurations.
 import logging
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 
 from common.config import get_settings
 from common.logging_conf import setup_celery_logging
+from modules import moe_service
+from worker import lean_mcp_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +43,27 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
-    task_time_limit=3600,
+    task_time_limit=moe_service.TASK_TIME_LIMIT,
     task_soft_time_limit=3000,
+    # Tasks run for minutes (LLM calls, Lean validation), so prefetching
+    # more than one would park work behind a busy child while others idle
     worker_prefetch_multiplier=1,
-    worker_max_tasks_per_child=100,
+    # Recycle children rarely so their warm state (event loop, MCP
+    # session, HTTP pools, caches) is reused; bound leaks by RSS instead
+    worker_max_tasks_per_child=1000,
+    worker_max_memory_per_child=500_000,  # KiB
+    broker_pool_limit=64,
+    redis_socket_keepalive=True,
 )
 
+
+@worker_process_shutdown.connect
+def _close_http_clients(**kwargs) -> None:
+    """Release pooled connections when a worker child exits."""
+    moe_service.close_supabase_client()
+    lean_mcp_client.close_event_loop()
+
+
 logger.info("Celery app initialized successfully")
 
 
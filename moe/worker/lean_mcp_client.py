@@ -6,16 +6,202 @@ for validating Lean code via the Lean LSP MCP server.
 """
 
 import asyncio
+import hashlib
+import inspect
 import json
 import logging
+import threading
+from collections import OrderedDict
 from contextlib import AsyncExitStack
-from typing import Any
+from typing import Any, Optional
 
+import httpx
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
 
+# One event loop per thread, reused across validations
+_thread_state = threading.local()
+
+# Validation is a pure function of the code, so verdicts are cached:
+# in-process for hot keys, and in Redis (when given) across workers.
+# Bump the version when validation semantics change.
+VALIDATION_CACHE_VERSION = 1
+VALIDATION_CACHE_TTL = 86400  # seconds
+VALIDATION_CACHE_SIZE = 512
+_validation_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _http2_client_factory(
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[httpx.Timeout] = None,
+    auth: Optional[httpx.Auth] = None
+) -> httpx.AsyncClient:
+    """
+    Build the MCP transport's HTTP client with HTTP/2 enabled.
+    
+    Over TLS, concurrent requests on the session multiplex over one
+    connection; plain http:// URLs negotiate HTTP/1.1 as before.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(
+            30.0,
+            read=300.0
+        ),
+        auth=auth,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=1,
+            keepalive_expiry=600
+        )
+    )
+
+
+# Older mcp releases build their own client and take no factory
+_TRANSPORT_OPTIONS: dict[str, Any] = (
+    {"httpx_client_factory": _http2_client_factory}
+    if "httpx_client_factory"
+    in inspect.signature(streamablehttp_client).parameters
+    else {}
+)
+
+
+class _MCPSessionHolder:
+    """
+    One long-lived, initialized MCP session per worker process.
+    
+    The transport and session contexts are entered and exited by a
+    dedicated owner task, since anyio cancel scopes must be closed by
+    the task that opened them. The session is bound to the event loop
+    it was opened on; a call from a different loop reconnects.
+    """
+    
+    def __init__(self) -> None:
+        self._session: Optional[ClientSession] = None
+        self._url: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._owner: Optional[asyncio.Task] = None
+        self._release: Optional[asyncio.Event] = None
+    
+    async def get_session(self, mcp_url: str) -> ClientSession:
+        """
+        Return the open session, connecting on first use.
+        
+        Args:
+            mcp_url: Base URL of the MCP server
+            
+        Returns:
+            ClientSession: Initialized MCP session
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A previous loop is gone along with its tasks; start over
+            self._reset()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            if (
+                self._session is not None
+                and self._url == mcp_url
+                and not self._owner.done()
+            ):
+                return self._session
+            
+            await self._close_owner()
+            ready = loop.create_future()
+            self._release = asyncio.Event()
+            self._owner = loop.create_task(self._hold(mcp_url, ready))
+            self._session = await ready
+            self._url = mcp_url
+            return self._session
+    
+    async def close(self) -> None:
+        """Close the session, if one is open on the running loop."""
+        if self._loop is not asyncio.get_running_loop():
+            self._reset()
+            return
+        async with self._lock:
+            await self._close_owner()
+    
+    async def _hold(self, mcp_url: str, ready: asyncio.Future) -> None:
+        """Owner task: open the session, then keep it until released."""
+        # The streamable HTTP endpoint for FastMCP is at /mcp
+        mcp_endpoint = f"{mcp_url}/mcp"
+        try:
+            async with AsyncExitStack() as stack:
+                logger.debug(f"Connecting to MCP server at {mcp_endpoint}")
+                read_stream, write_stream, _ = await stack.enter_async_context(
+                    streamablehttp_client(mcp_endpoint, **_TRANSPORT_OPTIONS)
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                
+                logger.debug("Initializing MCP session")
+                await session.initialize()
+                logger.debug("MCP session initialized successfully")
+                
+                ready.set_result(session)
+                await self._release.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            raise
+    
+    async def _close_owner(self) -> None:
+        """Release the owner task and wait for its contexts to exit."""
+        owner, self._owner = self._owner, None
+        self._session = None
+        if owner is None:
+            return
+        self._release.set()
+        try:
+            await owner
+        except Exception as e:
+            logger.debug(f"MCP session closed with error: {e}")
+    
+    def _reset(self) -> None:
+        """Forget state belonging to another (closed) event loop."""
+        self._session = None
+        self._url = None
+        self._owner = None
+        self._release = None
+
+
+_SESSIONS = _MCPSessionHolder()
+
+
+async def close_mcp_session() -> None:
+    """Close the shared MCP session (for worker shutdown)."""
+    await _SESSIONS.close()
+
+
+async def _call_lean_run_code(mcp_url: str, lean_code: str) -> Any:
+    """
+    Call lean_run_code on the shared session.
+    
+    A failure on a reused session is taken as the server having
+    expired it: the session is reopened and the call retried once.
+    """
+    for attempt in range(2):
+        session = await _SESSIONS.get_session(mcp_url)
+        try:
+            logger.debug("Calling lean_run_code tool")
+            return await session.call_tool(
+                "lean_run_code",
+                arguments={"code": lean_code}
+            )
+        except Exception as e:
+            if attempt:
+                raise
+            logger.warning(f"MCP session failed ({e}); reconnecting")
+            await _SESSIONS.close()
+
 
 async def validate_lean_code_async(mcp_url: str, lean_code: str) -> dict[str, Any]:
     """
@@ -32,99 +218,70 @@ async def validate_lean_code_async(mcp_url: str, lean_code: str) -> dict[str, An
             - errors: list
             - remaining_goals: list
     """
-    # The streamable HTTP endpoint for FastMCP is at /mcp
-    mcp_endpoint = f"{mcp_url}/mcp"
-    
     try:
-        async with AsyncExitStack() as stack:
-            # Connect to the streamable HTTP endpoint
-            logger.debug(f"Connecting to MCP server at {mcp_endpoint}")
-            read_stream, write_stream, get_session_id = await stack.enter_async_context(
-                streamablehttp_client(mcp_endpoint)
-            )
-            
-            # Create MCP session
-            session = await stack.enter_async_context(
-                ClientSession(read_stream, write_stream)
-            )
-            
-            # Initialize the connection
-            logger.debug("Initializing MCP session")
-            await session.initialize()
-            logger.debug("MCP session initialized successfully")
-            
-            # Call the lean_run_code tool
-            logger.debug("Calling lean_run_code tool")
-            result = await session.call_tool(
-                "lean_run_code",
-                arguments={"code": lean_code}
-            )
-            
-            logger.debug(f"MCP tool result: {result}")
-            
-            # Parse the result
-            # The result should have a 'content' field with a list of content items
-            if hasattr(result, 'content') and result.content:
-                # Get the first text content item
-                for item in result.content:
-                    if hasattr(item, 'type') and item.type == 'text':
-                        # Parse the JSON result
-                        run_result = json.loads(item.text)
-                        
-                        success = run_result.get("success", False)
-                        diagnostics = run_result.get("diagnostics", [])
-                        
-                        # Filter errors from diagnostics
-                        errors = [
-                            {
-                                "message": diag.get("message", ""),
+        result = await _call_lean_run_code(mcp_url, lean_code)
+        logger.debug(f"MCP tool result: {result}")
+        
+        # Parse the result
+        # The result should have a 'content' field with a list of content items
+        if hasattr(result, 'content') and result.content:
+            # Get the first text content item
+            for item in result.content:
+                if hasattr(item, 'type') and item.type == 'text':
+                    # Parse the JSON result
+                    run_result = json.loads(item.text)
+                    
+                    success = run_result.get("success", False)
+                    diagnostics = run_result.get("diagnostics", [])
+                    
+                    # Collect errors and remaining goals in one pass
+                    errors = []
+                    remaining_goals = []
+                    for diag in diagnostics:
+                        msg = diag.get("message", "")
+                        if diag.get("severity") == "error":
+                            errors.append({
+                                "message": msg,
                                 "line": diag.get("line"),
                                 "column": diag.get("column"),
-                                "severity": diag.get("severity", "error")
-                            }
-                            for diag in diagnostics
-                            if diag.get("severity") == "error"
-                        ]
-                        
-                        # Get remaining goals if any
-                        remaining_goals = []
-                        for diag in diagnostics:
-                            msg = diag.get("message", "")
-                            if "unsolved goals" in msg.lower() or "goals remaining" in msg.lower():
-                                remaining_goals.append(msg)
-                        
-                        is_valid = success and len(errors) == 0
-                        status = "success" if is_valid else "failed"
-                        
-                        logger.info(
-                            f"Validation result: is_valid={is_valid}, "
-                            f"errors={len(errors)}, remaining_goals={len(remaining_goals)}"
-                        )
-                        
-                        return {
-                            "is_valid": is_valid,
-                            "status": status,
-                            "errors": errors,
-                            "remaining_goals": remaining_goals
-                        }
-                
-                # If we get here, no text content was found
-                logger.error("No text content in MCP result")
-                return {
-                    "is_valid": False,
-                    "status": "error",
-                    "errors": [{"message": "Invalid response format from MCP server"}],
-                    "remaining_goals": []
-                }
-            else:
-                logger.error("Invalid MCP result structure")
-                return {
-                    "is_valid": False,
-                    "status": "error",
-                    "errors": [{"message": "Invalid response structure from MCP server"}],
-                    "remaining_goals": []
-                }
-                
+                                "severity": "error"
+                            })
+                        msg_lower = msg.lower()
+                        if "unsolved goals" in msg_lower or "goals remaining" in msg_lower:
+                            remaining_goals.append(msg)
+                    
+                    is_valid = success and len(errors) == 0
+                    status = "success" if is_valid else "failed"
+                    
+                    logger.info(
+                        f"Validation result: is_valid={is_valid}, "
+                        f"errors={len(errors)}, remaining_goals={len(remaining_goals)}"
+                    )
+                    
+                    return {
+                        "is_valid": is_valid,
+                        "status": status,
+                        "errors": errors,
+                        "remaining_goals": remaining_goals
+                    }
+            
+            # If we get here, no text content was found
+            logger.error("No text content in MCP result")
+            return {
+                "is_valid": False,
+                "status": "error",
+                "errors": [{"message": "Invalid response format from MCP server"}],
+                "remaining_goals": []
+            }
+        else:
+            logger.error("Invalid MCP result structure")
+            return {
+                "is_valid": False,
+                "status": "error",
+                "errors": [{"message": "Invalid response structure from MCP server"}],
+                "remaining_goals": []
+            }
+
     except Exception as e:
         logger.error(f"Error validating Lean code via MCP: {e}", exc_info=True)
         return {
@@ -135,39 +292,89 @@ async def validate_lean_code_async(mcp_url: str, lean_code: str) -> dict[str, An
         }
 
 
-def validate_lean_code(mcp_url: str, lean_code: str) -> dict[str, Any]:
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's validation event loop, creating it once."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def close_event_loop() -> None:
+    """Close the MCP session and this thread's loop (worker shutdown)."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(close_mcp_session())
+    finally:
+        loop.close()
+        _thread_state.loop = None
+
+
+def _validation_cache_key(lean_code: str) -> str:
+    """Build the cache key for a Lean snippet's validation result."""
+    digest = hashlib.sha256(lean_code.encode()).hexdigest()
+    return f"moe:lean:v{VALIDATION_CACHE_VERSION}:{digest}"
+
+
+def _remember_validation(key: str, payload: str) -> None:
+    """Store a serialized result in the in-process LRU."""
+    _validation_cache[key] = payload
+    _validation_cache.move_to_end(key)
+    if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+
+
+def validate_lean_code(
+    mcp_url: str,
+    lean_code: str,
+    redis_client: Any = None
+) -> dict[str, Any]:
     """
     Synchronous wrapper for validate_lean_code_async.
     
-    This function creates an event loop and runs the async validation.
+    Runs the validation on a per-thread event loop that is kept open
+    between calls, so the loop and the MCP session on it are reused.
     Safe to call from synchronous contexts like Celery tasks.
     
+    Verdicts are cached by SHA-256 of the code. Results with status
+    "error" (transport or server trouble) are never cached.
+    
     Args:
         mcp_url: Base URL of the MCP server
         lean_code: Lean code to validate
+        redis_client: Sync Redis client for a cache shared across
+            workers (in-process only if None)
         
     Returns:
         dict: Validation result
     """
-    try:
-        # Try to get the current event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If we're already in an async context, create a new loop
-            # This can happen in some Celery configurations
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(validate_lean_code_async(mcp_url, lean_code))
-            finally:
-                loop.close()
-        else:
-            return loop.run_until_complete(validate_lean_code_async(mcp_url, lean_code))
-    except RuntimeError:
-        # No event loop exists, create one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    key = _validation_cache_key(lean_code)
+    
+    payload = _validation_cache.get(key)
+    if payload is None and redis_client is not None:
+        try:
+            payload = redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Validation cache read failed: {e}")
+    if payload is not None:
+        logger.debug(f"Validation cache hit for {key}")
+        _remember_validation(key, payload)
+        return json.loads(payload)
+    
+    result = _get_loop().run_until_complete(
+        validate_lean_code_async(mcp_url, lean_code)
+    )
+    if result["status"] == "error":
+        return result
+    
+    payload = json.dumps(result)
+    _remember_validation(key, payload)
+    if redis_client is not None:
         try:
-            return loop.run_until_complete(validate_lean_code_async(mcp_url, lean_code))
-        finally:
-            loop.close()
+            redis_client.setex(key, VALIDATION_CACHE_TTL, payload)
+        except Exception as e:
+            logger.warning(f"Validation cache write failed: {e}")
+    return result
@@ -8,13 +8,68 @@ Prompts are cached in memory and refreshed every hour.
 import logging
 import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from langfuse import Langfuse
 
 logger = logging.getLogger(__name__)
 
+# Prompts the worker pipeline needs
+PROMPT_NAMES: tuple[str, ...] = (
+    "guardrail_check",
+    "latex_to_lean",
+    "feedback_generation",
+)
+
+# Retry schedule for a single prompt fetch: FETCH_TRIES attempts with
+# FETCH_BACKOFF, 2 * FETCH_BACKOFF, ... seconds between them
+FETCH_TRIES = 3
+FETCH_BACKOFF = 0.5
+
+
+def fetch_prompt_with_retry(
+    langfuse: Langfuse,
+    prompt_name: str,
+    tries: int = FETCH_TRIES,
+    backoff: float = FETCH_BACKOFF
+) -> Any:
+    """
+    Fetch one prompt from Langfuse, retrying transient failures.
+
+    Client errors (4xx, e.g. a missing prompt) are raised immediately;
+    anything else is retried with exponential backoff.
+
+    Args:
+        langfuse: Langfuse client
+        prompt_name: Name of the prompt
+        tries: Total number of attempts
+        backoff: Delay before the first retry, doubled after each one
+
+    Returns:
+        Any: Langfuse prompt object
+
+    Raises:
+        Exception: The last error once all attempts have failed
+    """
+    for attempt in range(tries):
+        try:
+            return langfuse.get_prompt(prompt_name)
+        except Exception as e:
+            status_code = getattr(e, "status_code", None)
+            is_client_error = (
+                isinstance(status_code, int) and 400 <= status_code < 500
+            )
+            if is_client_error or attempt == tries - 1:
+                raise
+            delay = backoff * 2 ** attempt
+            logger.warning(
+                f"Fetching prompt {prompt_name} failed ({e}), "
+                f"retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
 
 class PromptManager:
     """
@@ -23,8 +78,9 @@ class PromptManager:
     Features:
     - Fetches prompts from Langfuse on first use
     - Caches prompts in memory
-    - Automatically refreshes cache every hour
-    - Thread-safe access to cached prompts
+    - Refreshes a stale cache (older than an hour) on the next read
+    - Thread-safe access to cached prompts: writers build a new dict
+      and rebind self._cache in one assignment, so reads take no lock
     """
     
     REFRESH_INTERVAL = 3600  # 1 hour in seconds
@@ -50,55 +106,18 @@ class PromptManager:
         )
         
         self._cache: dict[str, Any] = {}
-        self._last_refresh: Optional[datetime] = None
+        # Monotonic stamp drives staleness; the ISO string is display only
+        self._last_refresh_mono: Optional[float] = None
+        self._last_refresh_iso: Optional[str] = None
+        # Guards the cache swap only; readers use the current dict as is
         self._lock = threading.Lock()
-        self._refresh_thread: Optional[threading.Thread] = None
-        self._stop_refresh = threading.Event()
+        # Single-flight state for filling an empty cache
+        self._fetch_guard = threading.Lock()
+        self._fetching = False
+        self._fetch_done = threading.Event()
         
         logger.info("PromptManager initialized")
     
-    def start_auto_refresh(self) -> None:
-        """
-        Start background thread for automatic prompt refresh.
-        """
-        if self._refresh_thread and self._refresh_thread.is_alive():
-            logger.warning("Auto-refresh already running")
-            return
-        
-        self._stop_refresh.clear()
-        self._refresh_thread = threading.Thread(
-            target=self._auto_refresh_loop,
-            daemon=True
-        )
-        self._refresh_thread.start()
-        logger.info("Started auto-refresh thread")
-    
-    def stop_auto_refresh(self) -> None:
-        """
-        Stop background auto-refresh thread.
-        """
-        if self._refresh_thread and self._refresh_thread.is_alive():
-            self._stop_refresh.set()
-            self._refresh_thread.join(timeout=5)
-            logger.info("Stopped auto-refresh thread")
-    
-    def _auto_refresh_loop(self) -> None:
-        """
-        Background loop that refreshes prompts periodically.
-        """
-        while not self._stop_refresh.is_set():
-            try:
-                # Check if refresh is needed
-                if self._should_refresh():
-                    logger.info("Auto-refreshing prompts...")
-                    self._fetch_all_prompts()
-                    logger.info("Auto-refresh completed")
-            except Exception as e:
-                logger.error(f"Error in auto-refresh: {e}")
-            
-            # Wait for refresh interval or stop signal
-            self._stop_refresh.wait(timeout=self.REFRESH_INTERVAL)
-    
     def _should_refresh(self) -> bool:
         """
         Check if cache should be refreshed.
@@ -109,54 +128,82 @@ class PromptManager:
         if not self._cache:
             return True
         
-        if self._last_refresh is None:
+        last_refresh = self._last_refresh_mono
+        if last_refresh is None:
             return True
         
-        elapsed = datetime.utcnow() - self._last_refresh
-        return elapsed > timedelta(seconds=self.REFRESH_INTERVAL)
+        return time.monotonic() - last_refresh > self.REFRESH_INTERVAL
     
     def _fetch_all_prompts(self) -> None:
         """
         Fetch all required prompts from Langfuse.
         
-        Required prompts:
-        - guardrail_check
-        - latex_to_lean
-        - feedback_generation
+        The required prompts are listed in PROMPT_NAMES.
         """
-        prompt_names = [
-            "guardrail_check",
-            "latex_to_lean",
-            "feedback_generation"
-        ]
+        # The fetches are independent, so issue them concurrently and
+        # without the lock; it is only needed for the swap below
+        old_cache = self._cache
+        new_cache = {}
         
-        with self._lock:
-            new_cache = {}
-            
-            for prompt_name in prompt_names:
-                try:
-                    prompt = self.langfuse.get_prompt(prompt_name)
-                    new_cache[prompt_name] = prompt
-                    logger.debug(f"Fetched prompt: {prompt_name}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch prompt {prompt_name}: {e}"
+        with ThreadPoolExecutor(max_workers=len(PROMPT_NAMES)) as executor:
+            futures = {
+                prompt_name: executor.submit(
+                    fetch_prompt_with_retry,
+                    self.langfuse,
+                    prompt_name
+                )
+                for prompt_name in PROMPT_NAMES
+            }
+        
+        for prompt_name, future in futures.items():
+            try:
+                new_cache[prompt_name] = future.result()
+                logger.debug(f"Fetched prompt: {prompt_name}")
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch prompt {prompt_name}: {e}"
+                )
+                # Keep old version if fetch fails
+                if prompt_name in old_cache:
+                    new_cache[prompt_name] = old_cache[prompt_name]
+                    logger.info(
+                        f"Using cached version of {prompt_name}"
                     )
-                    # Keep old version if fetch fails
-                    if prompt_name in self._cache:
-                        new_cache[prompt_name] = self._cache[prompt_name]
-                        logger.info(
-                            f"Using cached version of {prompt_name}"
-                        )
-            
-            # Update cache
+        
+        with self._lock:
+            # Publish with a single rebind; never mutate the live dict
             self._cache = new_cache
-            self._last_refresh = datetime.utcnow()
+            self._last_refresh_mono = time.monotonic()
+            self._last_refresh_iso = datetime.now(timezone.utc).isoformat()
             
             logger.info(
                 f"Prompt cache updated: {len(self._cache)} prompts"
             )
     
+    def _load_once(self) -> None:
+        """
+        Fill an empty cache, fetching from at most one thread.
+        
+        The first caller fetches; callers arriving meanwhile wait for
+        it (up to 30s) instead of issuing their own Langfuse requests.
+        """
+        with self._fetch_guard:
+            leader = not self._fetching
+            if leader:
+                self._fetching = True
+                self._fetch_done.clear()
+        
+        if not leader:
+            self._fetch_done.wait(timeout=30)
+            return
+        
+        try:
+            self._fetch_all_prompts()
+        finally:
+            with self._fetch_guard:
+                self._fetching = False
+            self._fetch_done.set()
+    
     def get_prompt(self, prompt_name: str) -> Any:
         """
         Get a prompt from cache.
@@ -170,19 +217,20 @@ class PromptManager:
         Raises:
             ValueError: If prompt not found
         """
-        # Ensure cache is populated
-        if not self._cache:
-            logger.info("Cache empty, fetching prompts...")
-            self._fetch_all_prompts()
+        # Ensure cache is populated and current
+        if self._should_refresh():
+            logger.info("Prompt cache empty or stale, fetching prompts...")
+            self._load_once()
         
-        with self._lock:
-            if prompt_name not in self._cache:
-                raise ValueError(
-                    f"Prompt '{prompt_name}' not found in cache. "
-                    f"Available: {list(self._cache.keys())}"
-                )
-            
-            return self._cache[prompt_name]
+        cache = self._cache
+        prompt = cache.get(prompt_name)
+        if prompt is None:
+            raise ValueError(
+                f"Prompt '{prompt_name}' not found in cache. "
+                f"Available: {list(cache.keys())}"
+            )
+        
+        return prompt
     
     def get_prompt_template(self, prompt_name: str) -> str:
         """
@@ -229,15 +277,13 @@ class PromptManager:
         Returns:
             dict: Cache information
         """
-        with self._lock:
-            return {
-                "cached_prompts": list(self._cache.keys()),
-                "prompt_count": len(self._cache),
-                "last_refresh": self._last_refresh.isoformat() if (
-                    self._last_refresh
-                ) else None,
-                "refresh_interval_seconds": self.REFRESH_INTERVAL
-            }
+        cache = self._cache
+        return {
+            "cached_prompts": list(cache.keys()),
+            "prompt_count": len(cache),
+            "last_refresh": self._last_refresh_iso,
+            "refresh_interval_seconds": self.REFRESH_INTERVAL
+        }
 
 
 # Global prompt manager instance
@@ -248,8 +294,7 @@ _manager_lock = threading.Lock()
 def init_prompt_manager(
     langfuse_secret_key: str,
     langfuse_public_key: str,
-    langfuse_base_url: str,
-    auto_refresh: bool = True
+    langfuse_base_url: str
 ) -> PromptManager:
     """
     Initialize global prompt manager.
@@ -258,7 +303,6 @@ def init_prompt_manager(
         langfuse_secret_key: Langfuse secret key
         langfuse_public_key: Langfuse public key
         langfuse_base_url: Langfuse base URL
-        auto_refresh: Start auto-refresh thread
     
     Returns:
         PromptManager: Initialized prompt manager
@@ -273,9 +317,6 @@ def init_prompt_manager(
                 langfuse_base_url
             )
             
-            if auto_refresh:
-                _prompt_manager.start_auto_refresh()
-            
             logger.info("Global PromptManager initialized")
         
         return _prompt_manager
@@ -4,14 +4,19 @@ Celery tasks for submission processing.
 This module handles the end-to-end submission evaluation workflow.
 """
 
-import json
 import logging
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
+import redis
+from celery.signals import worker_process_shutdown
 from langchain.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from langfuse import Langfuse
+from sqlalchemy.orm import Session, sessionmaker
 
 from common.config import get_settings
 from common.db import create_engine_from_url, create_session_factory
@@ -21,13 +26,109 @@ from worker.lean_mcp_client import validate_lean_code
 
 logger = logging.getLogger(__name__)
 
+# Runs the problem fetch and LaTeX-to-Lean conversion alongside the
+# guardrail call. Threads start lazily, so each forked child gets its own.
+_CONVERSION_POOL = ThreadPoolExecutor(
+    max_workers=2,
+    thread_name_prefix="latex-to-lean"
+)
+
+# Submissions failing these cheap checks are rejected without an LLM call.
+# Deliberately loose: any digit, operator, $ or LaTeX command counts.
+GUARDRAIL_MIN_LENGTH = 20
+_MATH_HINT = re.compile(r"[0-9$=+\-*/^<>]|\\[a-zA-Z]+")
+
+# Lean errors quoted in the feedback prompt, and the fields kept per error
+FEEDBACK_MAX_ERRORS = 3
+_FEEDBACK_ERROR_FIELDS = ("message", "line", "column")
+
+# Prompt/completion text recorded on Langfuse generations is clipped to
+# this many characters to keep ingestion payloads small
+TRACE_MAX_CHARS = 4096
+
+# Static templates, parsed once at import rather than per submission
+_GUARDRAIL_PROMPT = PromptTemplate(
+    input_variables=["solution"],
+    template="""
+You are a strict validator. Analyze if the text is a mathematical proof or solution.
+
+CRITICAL: Your response MUST be EXACTLY one of these formats:
+- "VALID" (if it contains mathematical reasoning/proof)
+- "INVALID: <brief reason>" (if it does not)
+
+DO NOT include any explanation, analysis, or additional text.
+DO NOT write multiple sentences.
+Return ONLY the format above.
+
+Text to analyze:
+{solution}
+
+Your response (VALID or INVALID: reason):"""
+)
+
+_LATEX_TO_LEAN_PROMPT = PromptTemplate(
+    input_variables=["problem", "solution"],
+    template="""
+Convert the following mathematical proof from LaTeX to Lean 4.
+
+Problem Statement:
+{problem}
+
+Proof in LaTeX:
+{solution}
+
+Generate ONLY the Lean 4 code, no explanations:"""
+)
+
+_FEEDBACK_PROMPT = PromptTemplate(
+    input_variables=[
+        "solution",
+        "validation_status",
+        "errors"
+    ],
+    template="""
+Provide constructive feedback for this mathematical proof.
+
+Proof:
+{solution}
+
+Lean Validation: {validation_status}
+Errors: {errors}
+
+Provide feedback in 2-3 clear sentences focusing on:
+- Strengths of the proof
+- Areas for improvement
+
+Feedback:"""
+)
+
+
+@lru_cache(maxsize=1)
+def get_redis_client(redis_url: str) -> redis.Redis:
+    """Create the worker process's sync Redis client once."""
+    return redis.Redis.from_url(redis_url, decode_responses=True)
+
 
 def get_llm_client(settings):
+    """Get the worker process's LLM client, creating it on first use."""
+    return _create_llm_client(
+        settings.math_model_name,
+        settings.openrouter_base_url,
+        settings.openrouter_api_key
+    )
+
+
+@lru_cache(maxsize=1)
+def _create_llm_client(
+    model_name: str,
+    api_base: str,
+    api_key: str
+) -> ChatOpenAI:
     """Create and configure LLM client."""
     return ChatOpenAI(
-        model_name=settings.math_model_name,
-        openai_api_base=settings.openrouter_base_url,
-        openai_api_key=settings.openrouter_api_key,
+        model_name=model_name,
+        openai_api_base=api_base,
+        openai_api_key=api_key,
         temperature=0.0,
         request_timeout=120,  # 2 minutes timeout
         max_retries=2  # Retry up to 2 times on failure
@@ -35,12 +136,65 @@ def get_llm_client(settings):
 
 
 def get_langfuse_client(settings):
+    """Get the worker process's Langfuse client, creating it on first use."""
+    return _create_langfuse_client(
+        settings.langfuse_secret_key,
+        settings.langfuse_public_key,
+        settings.langfuse_base_url
+    )
+
+
+@lru_cache(maxsize=1)
+def _create_langfuse_client(
+    secret_key: str,
+    public_key: str,
+    host: str
+) -> Langfuse:
     """Create and configure Langfuse client."""
     return Langfuse(
-        secret_key=settings.langfuse_secret_key,
-        public_key=settings.langfuse_public_key,
-        host=settings.langfuse_base_url
+        secret_key=secret_key,
+        public_key=public_key,
+        host=host,
+        # Two consumer threads drain the event queue off the task thread
+        threads=2
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_factory(db_url: str) -> sessionmaker[Session]:
+    """
+    Create the worker process's engine and session factory once.
+
+    Built on first use, which happens after the prefork fork, so every
+    child owns its own pool. A child runs one task at a time, so a
+    small pool is enough.
+
+    Args:
+        db_url: Database connection URL
+
+    Returns:
+        sessionmaker: Session factory bound to the process's engine
+    """
+    engine = create_engine_from_url(
+        db_url,
+        pool_size=2,
+        max_overflow=2
     )
+    return create_session_factory(engine)
+
+
+@worker_process_shutdown.connect
+def _dispose_engine(**kwargs) -> None:
+    """Close pooled database connections before a worker child exits."""
+    if get_session_factory.cache_info().currsize:
+        get_session_factory(get_settings().db_url).kw["bind"].dispose()
+
+
+@worker_process_shutdown.connect
+def _flush_langfuse(**kwargs) -> None:
+    """Send buffered Langfuse events before a worker child exits."""
+    if _create_langfuse_client.cache_info().currsize:
+        get_langfuse_client(get_settings()).flush()
 
 
 @celery_app.task(name="worker.tasks.process_submission")
@@ -67,20 +221,33 @@ def process_submission(
         4. Feedback generation (100% progress)
     """
     settings = get_settings()
-    engine = create_engine_from_url(settings.db_url)
-    session_factory = create_session_factory(engine)
-    db = session_factory()
+    db = get_session_factory(settings.db_url)()
 
     try:
+        # Duplicate deliveries and retries of finished work stop here,
+        # before any LLM call
+        if not moe_service.claim_submission(db, submission_id):
+            logger.info(
+                f"Skipping submission {submission_id}: already "
+                f"completed or being processed"
+            )
+            return {"status": "skipped"}
+
         logger.info(f"Processing submission {submission_id}")
 
-        # Update status to processing
-        moe_service.update_submission_status(
-            db,
-            submission_id,
-            "processing",
-            0
+        # Step 2 does not depend on step 1's verdict, so start it now
+        # and discard its result if the guardrail rejects
+        logger.info(
+            f"Step 2: Converting LaTeX to Lean for {submission_id}"
         )
+        conversion = None
+        if _prescreen_solution(solution_latex) is None:
+            conversion = _CONVERSION_POOL.submit(
+                _fetch_and_convert,
+                problem_id,
+                solution_latex,
+                settings
+            )
 
         # Step 1: Guardrail check (Progress: 25%)
         logger.info(f"Step 1: Guardrail check for {submission_id}")
@@ -90,17 +257,13 @@ def process_submission(
         )
 
         if not is_valid_math:
+            if conversion is not None:
+                conversion.cancel()
             logger.warning(
                 f"Guardrail rejected submission {submission_id}: "
                 f"{reason}"
             )
-            moe_service.update_submission_status(
-                db,
-                submission_id,
-                "completed",
-                100
-            )
-            moe_service.create_submission_result(
+            moe_service.complete_submission(
                 db,
                 submission_id,
                 verdict="rejected",
@@ -123,24 +286,7 @@ def process_submission(
         )
 
         # Step 2: Convert LaTeX to Lean (Progress: 50%)
-        logger.info(
-            f"Step 2: Converting LaTeX to Lean for {submission_id}"
-        )
-
-        problem_data = moe_service.get_problem_by_id_from_supabase(
-            problem_id,
-            settings.supabase_url,
-            settings.supabase_secret_key
-        )
-
-        if not problem_data:
-            raise ValueError(f"Problem {problem_id} not found")
-
-        lean_code = convert_latex_to_lean(
-            solution_latex,
-            problem_data,
-            settings
-        )
+        lean_code = conversion.result()
 
         moe_service.update_submission_status(
             db,
@@ -153,6 +299,8 @@ def process_submission(
         logger.info(
             f"Step 3: Validating Lean code for {submission_id}"
         )
+        # Don't leave a buffered tick hidden behind the long calls below
+        moe_service.flush_progress(db)
         validation_result = validate_with_lean_lsp(lean_code)
 
         moe_service.update_submission_status(
@@ -164,6 +312,7 @@ def process_submission(
 
         # Step 4: Generate feedback (Progress: 100%)
         logger.info(f"Step 4: Generating feedback for {submission_id}")
+        moe_service.flush_progress(db)
         feedback = generate_feedback(
             solution_latex,
             lean_code,
@@ -176,8 +325,8 @@ def process_submission(
             validation_result["is_valid"]
         ) else "rejected"
 
-        # Create result
-        moe_service.create_submission_result(
+        # Store the result and mark completed in one transaction
+        moe_service.complete_submission(
             db,
             submission_id,
             verdict=verdict,
@@ -191,14 +340,6 @@ def process_submission(
             feedback=feedback
         )
 
-        # Update submission to completed
-        moe_service.update_submission_status(
-            db,
-            submission_id,
-            "completed",
-            100
-        )
-
         logger.info(
             f"Completed processing submission {submission_id}: "
             f"{verdict}"
@@ -219,7 +360,65 @@ def process_submission(
         raise
     finally:
         db.close()
-        engine.dispose()
+
+
+def _fetch_and_convert(
+    problem_id: str,
+    solution_latex: str,
+    settings
+) -> str:
+    """
+    Fetch the problem and convert the LaTeX solution to Lean code.
+
+    Args:
+        problem_id: Problem identifier
+        solution_latex: Solution in LaTeX
+        settings: Application settings
+
+    Returns:
+        str: Lean code
+
+    Raises:
+        ValueError: If the problem does not exist
+    """
+    problem_data = moe_service.get_problem_by_id_from_supabase(
+        problem_id,
+        settings.supabase_url,
+        settings.supabase_secret_key
+    )
+
+    if not problem_data:
+        raise ValueError(f"Problem {problem_id} not found")
+
+    return convert_latex_to_lean(
+        solution_latex,
+        problem_data,
+        settings
+    )
+
+
+def _clip_for_trace(text: str) -> str:
+    """Clip text recorded on a Langfuse generation to TRACE_MAX_CHARS."""
+    if len(text) <= TRACE_MAX_CHARS:
+        return text
+    return text[:TRACE_MAX_CHARS] + "...[truncated]"
+
+
+def _prescreen_solution(solution_latex: str) -> Optional[str]:
+    """
+    Reject obviously non-mathematical text without calling the LLM.
+
+    Args:
+        solution_latex: Solution text
+
+    Returns:
+        Optional[str]: Rejection reason, or None if the LLM should decide
+    """
+    if len(solution_latex.strip()) < GUARDRAIL_MIN_LENGTH:
+        return "Submission is too short to be a proof"
+    if _MATH_HINT.search(solution_latex) is None:
+        return "Submission does not contain mathematical notation"
+    return None
 
 
 def guardrail_check(
@@ -236,30 +435,15 @@ def guardrail_check(
     Returns:
         tuple: (is_valid, rejection_reason)
     """
+    reason = _prescreen_solution(solution_latex)
+    if reason is not None:
+        return False, reason
+
     llm = get_llm_client(settings)
     langfuse = get_langfuse_client(settings)
 
-    prompt_template = PromptTemplate(
-        input_variables=["solution"],
-        template="""
-You are a strict validator. Analyze if the text is a mathematical proof or solution.
-
-CRITICAL: Your response MUST be EXACTLY one of these formats:
-- "VALID" (if it contains mathematical reasoning/proof)
-- "INVALID: <brief reason>" (if it does not)
-
-DO NOT include any explanation, analysis, or additional text.
-DO NOT write multiple sentences.
-Return ONLY the format above.
-
-Text to analyze:
-{solution}
-
-Your response (VALID or INVALID: reason):"""
-    )
-
     trace = langfuse.trace(name="guardrail_check")
-    prompt = prompt_template.format(solution=solution_latex)
+    prompt = _GUARDRAIL_PROMPT.format(solution=solution_latex)
 
     try:
         response = llm.invoke(prompt)
@@ -267,8 +451,8 @@ Your response (VALID or INVALID: reason):"""
 
         trace.generation(
             name="guardrail",
-            input=prompt,
-            output=result,
+            input=_clip_for_trace(prompt),
+            output=_clip_for_trace(result),
             model=settings.math_model_name
         )
 
@@ -306,22 +490,8 @@ def convert_latex_to_lean(
     llm = get_llm_client(settings)
     langfuse = get_langfuse_client(settings)
 
-    prompt_template = PromptTemplate(
-        input_variables=["problem", "solution"],
-        template="""
-Convert the following mathematical proof from LaTeX to Lean 4.
-
-Problem Statement:
-{problem}
-
-Proof in LaTeX:
-{solution}
-
-Generate ONLY the Lean 4 code, no explanations:"""
-    )
-
     trace = langfuse.trace(name="latex_to_lean")
-    prompt = prompt_template.format(
+    prompt = _LATEX_TO_LEAN_PROMPT.format(
         problem=problem_data.get("statement_latex", ""),
         solution=solution_latex
     )
@@ -332,8 +502,8 @@ Generate ONLY the Lean 4 code, no explanations:"""
 
         trace.generation(
             name="conversion",
-            input=prompt,
-            output=lean_code,
+            input=_clip_for_trace(prompt),
+            output=_clip_for_trace(lean_code),
             model=settings.math_model_name
         )
 
@@ -377,7 +547,11 @@ def validate_with_lean_lsp(lean_code: str) -> dict[str, Any]:
     
     try:
         # Use the MCP SDK to validate the Lean code
-        result = validate_lean_code(mcp_url, lean_code)
+        result = validate_lean_code(
+            mcp_url,
+            lean_code,
+            redis_client=get_redis_client(settings.redis_url)
+        )
         
         logger.info(
             f"Validation result: is_valid={result['is_valid']}, "
@@ -397,6 +571,34 @@ def validate_with_lean_lsp(lean_code: str) -> dict[str, Any]:
         }
 
 
+def _format_errors_for_prompt(errors: list[Any]) -> str:
+    """
+    Render Lean errors compactly for the feedback prompt.
+
+    Only the first FEEDBACK_MAX_ERRORS errors are kept, each reduced to
+    its message and position, to keep prompt tokens bounded.
+
+    Args:
+        errors: Validation errors from validate_with_lean_lsp
+
+    Returns:
+        str: Compact JSON array
+    """
+    if not errors:
+        return "[]"
+
+    trimmed = [
+        {
+            key: error[key]
+            for key in _FEEDBACK_ERROR_FIELDS
+            if error.get(key) is not None
+        } if isinstance(error, dict) else error
+        for error in errors[:FEEDBACK_MAX_ERRORS]
+    ]
+    # orjson output is already compact
+    return orjson.dumps(trimmed).decode()
+
+
 def generate_feedback(
     solution_latex: str,
     lean_code: str,
@@ -422,33 +624,13 @@ def generate_feedback(
         "passed" if validation_result["is_valid"] else "failed"
     )
 
-    prompt_template = PromptTemplate(
-        input_variables=[
-            "solution",
-            "validation_status",
-            "errors"
-        ],
-        template="""
-Provide constructive feedback for this mathematical proof.
-
-Proof:
-{solution}
-
-Lean Validation: {validation_status}
-Errors: {errors}
-
-Provide feedback in 2-3 clear sentences focusing on:
-- Strengths of the proof
-- Areas for improvement
-
-Feedback:"""
-    )
-
     trace = langfuse.trace(name="feedback_generation")
-    prompt = prompt_template.format(
+    prompt = _FEEDBACK_PROMPT.format(
         solution=solution_latex,
         validation_status=validation_status,
-        errors=json.dumps(validation_result.get("errors", []))
+        errors=_format_errors_for_prompt(
+            validation_result.get("errors", [])
+        )
     )
 
     try:
@@ -457,8 +639,8 @@ Feedback:"""
 
         trace.generation(
             name="feedback",
-            input=prompt,
-            output=feedback_text,
+            input=_clip_for_trace(prompt),
+            output=_clip_for_trace(feedback_text),
             model=settings.math_model_name
         )
 
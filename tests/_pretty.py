@@ -0,0 +1,48 @@
+"""
+Colored console output shared by the connection test scripts.
+
+Output is block-buffered and written when the script exits; set
+VERBOSE_STREAM=1 to see each line as it is printed.
+"""
+
+import os
+import sys
+
+# ANSI color codes
+GREEN = '\033[92m'
+RED = '\033[91m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+RESET = '\033[0m'
+
+# Line prefixes, built once instead of on every call
+_SUCCESS_PREFIX = f"{GREEN}✓ "
+_ERROR_PREFIX = f"{RED}✗ "
+_INFO_PREFIX = f"{BLUE}ℹ "
+_WARNING_PREFIX = f"{YELLOW}⚠ "
+_SUFFIX = f"{RESET}\n"
+
+# A terminal stdout is line-buffered, costing one write per line; the
+# scripts print a few dozen lines, so let them batch instead
+if os.getenv("VERBOSE_STREAM") != "1":
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+
+def print_success(message: str) -> None:
+    """Print success message."""
+    sys.stdout.write(_SUCCESS_PREFIX + message + _SUFFIX)
+
+
+def print_error(message: str) -> None:
+    """Print error message."""
+    sys.stdout.write(_ERROR_PREFIX + message + _SUFFIX)
+
+
+def print_info(message: str) -> None:
+    """Print info message."""
+    sys.stdout.write(_INFO_PREFIX + message + _SUFFIX)
+
+
+def print_warning(message: str) -> None:
+    """Print warning message."""
+    sys.stdout.write(_WARNING_PREFIX + message + _SUFFIX)
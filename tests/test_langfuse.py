@@ -13,32 +13,20 @@ import sys
 import time
 from langfuse import Langfuse
 
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+# Make the moe package importable regardless of the working directory
+MOE_ROOT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "moe"
+)
+sys.path.insert(0, MOE_ROOT)
 
-
-def print_success(message: str) -> None:
-    """Print success message."""
-    print(f"{GREEN}✓ {message}{RESET}")
-
-
-def print_error(message: str) -> None:
-    """Print error message."""
-    print(f"{RED}✗ {message}{RESET}")
-
-
-def print_info(message: str) -> None:
-    """Print info message."""
-    print(f"{BLUE}ℹ {message}{RESET}")
-
-
-def print_warning(message: str) -> None:
-    """Print warning message."""
-    print(f"{YELLOW}⚠ {message}{RESET}")
+from _pretty import (
+    BLUE,
+    RESET,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+)
 
 
 def test_langfuse_connection(
@@ -118,8 +106,14 @@ def test_langfuse_connection(
     
     for prompt_name in required_prompts:
         try:
+            # Imported here so a missing worker dependency fails only the
+            # tests that need it
+            from worker.prompts.prompt_manager import (
+                fetch_prompt_with_retry
+            )
+
             print_info(f"Fetching prompt: {prompt_name}")
-            prompt = langfuse.get_prompt(prompt_name)
+            prompt = fetch_prompt_with_retry(langfuse, prompt_name)
             
             if prompt:
                 print_success(f"  ✓ Found prompt: {prompt_name}")
@@ -158,11 +152,15 @@ def test_langfuse_connection(
         print(f"\n{BLUE}Test 4: Test Prompt Compilation{RESET}")
         
         try:
+            from worker.prompts.prompt_manager import (
+                fetch_prompt_with_retry
+            )
+
             # Test with first available prompt
             test_prompt_name = prompts_found[0]
             print_info(f"Testing compilation with: {test_prompt_name}")
             
-            prompt = langfuse.get_prompt(test_prompt_name)
+            prompt = fetch_prompt_with_retry(langfuse, test_prompt_name)
             
             if test_prompt_name == "guardrail_check":
                 compiled = prompt.compile(
@@ -199,7 +197,6 @@ def test_langfuse_connection(
     print(f"\n{BLUE}Test 5: Test PromptManager Module{RESET}")
     try:
         # Import from moe worker
-        sys.path.insert(0, "/home/hobiron/Me/moe/moe")
         from worker.prompts.prompt_manager import (
             init_prompt_manager,
             get_prompt_manager
@@ -210,12 +207,21 @@ def test_langfuse_connection(
         manager = init_prompt_manager(
             secret_key,
             public_key,
-            base_url,
-            auto_refresh=False
+            base_url
         )
         
         print_success("PromptManager initialized")
         
+        # The cache fills on first read, so fetch before inspecting it
+        if prompts_found:
+            test_prompt = prompts_found[0]
+            print_info(f"Testing get_prompt for: {test_prompt}")
+            
+            prompt = manager.get_prompt(test_prompt)
+            print_success(f"Retrieved prompt: {test_prompt}")
+        else:
+            print_warning("No prompts available, skipping get_prompt")
+        
         # Get cache info
         cache_info = manager.get_cache_info()
         print_info(
@@ -225,14 +231,6 @@ def test_langfuse_connection(
             f"Prompt names: {', '.join(cache_info['cached_prompts'])}"
         )
         
-        # Test getting a prompt
-        if cache_info['cached_prompts']:
-            test_prompt = cache_info['cached_prompts'][0]
-            print_info(f"Testing get_prompt for: {test_prompt}")
-            
-            prompt = manager.get_prompt(test_prompt)
-            print_success(f"Retrieved prompt: {test_prompt}")
-        
         print_success("PromptManager tests passed")
         
     except Exception as e:
@@ -9,37 +9,100 @@ import asyncio
 import json
 import os
 import sys
-from typing import Optional
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
+from typing import Any, Optional
 from contextlib import AsyncExitStack
 
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+# uvloop comes with uvicorn[standard]; without it the default loop is used
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
+from _pretty import (
+    BLUE,
+    RESET,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+)
 
-def print_success(message: str) -> None:
-    """Print success message."""
-    print(f"{GREEN}✓ {message}{RESET}")
+# Turns line breaks and tabs into spaces for one-line previews
+_FLATTEN = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
 
 
-def print_error(message: str) -> None:
-    """Print error message."""
-    print(f"{RED}✗ {message}{RESET}")
+def _content_text(content: Any) -> str:
+    """Return the text of an MCP content item, or its string form."""
+    return getattr(content, "text", None) or str(content)
 
 
-def print_info(message: str) -> None:
-    """Print info message."""
-    print(f"{BLUE}ℹ {message}{RESET}")
+# Simple Lean file content for testing
+TEST_LEAN_CODE = """theorem test_theorem : 2 + 2 = 4 := by
+  sorry
+"""
 
+# Tool tests: (tool name, intro message, call arguments)
+TOOL_TESTS = (
+    (
+        "lean_goal",
+        "Testing lean_goal with sample theorem...",
+        {
+            "file_path": "/tmp/test_goal.lean",
+            "file_contents": TEST_LEAN_CODE,
+            "line": 2
+        }
+    ),
+    (
+        "lean_diagnostic_messages",
+        "Testing lean_diagnostic_messages...",
+        {
+            "file_path": "/tmp/test_diagnostic.lean",
+            "file_contents": TEST_LEAN_CODE
+        }
+    ),
+)
 
-def print_warning(message: str) -> None:
-    """Print warning message."""
-    print(f"{YELLOW}⚠ {message}{RESET}")
+
+def _report_tool_result(tool_name: str, intro: str, result: Any) -> bool:
+    """
+    Print the outcome of one tool call.
+    
+    Args:
+        tool_name: Name of the MCP tool
+        intro: Message printed before the outcome
+        result: CallToolResult, or the exception the call raised
+    
+    Returns:
+        bool: False if the call itself failed
+    """
+    try:
+        print_info(intro)
+        
+        if isinstance(result, Exception):
+            raise result
+        
+        if result.isError:
+            # Expected error when no Lean project is configured
+            print_warning(
+                f"{tool_name} returned an error (expected without Lean project)"
+            )
+            if result.content:
+                error_text = _content_text(result.content[0])
+                print_info(f"Error: {error_text[:150]}...")
+        else:
+            print_success(f"{tool_name} tool responded successfully")
+            if result.content:
+                content_text = _content_text(result.content[0])
+                print_info(f"Response length: {len(content_text)} chars")
+                # Show first 200 chars of response
+                if content_text:
+                    preview = content_text[:200].translate(_FLATTEN)
+                    print_info(f"Response preview: {preview}...")
+    except Exception as e:
+        print_error(f"Failed to test {tool_name}: {e}")
+        return False
+    
+    return True
 
 
 async def test_lean_lsp_connection(
@@ -56,6 +119,10 @@ async def test_lean_lsp_connection(
     Returns:
         bool: True if all tests pass
     """
+    # Imported here so loading this module does not pull in the SDK
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+    
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{BLUE}Testing Lean LSP MCP Connection (StreamableHTTP){RESET}")
     print(f"{BLUE}{'='*60}{RESET}\n")
@@ -95,27 +162,42 @@ async def test_lean_lsp_connection(
             if session_id:
                 print_info(f"Session ID: {session_id[:20]}...")
             
+            # Tests 2-4 are independent requests; send them concurrently
+            # over the session (responses are matched by JSON-RPC id) and
+            # report the results in order
+            print_info("Sending tool requests concurrently...")
+            tools_result, *tool_results = await asyncio.gather(
+                session.list_tools(),
+                *(
+                    session.call_tool(tool_name, arguments=arguments)
+                    for tool_name, _, arguments in TOOL_TESTS
+                ),
+                return_exceptions=True
+            )
+            
             # Test 2: List Available Tools
             print(f"\n{BLUE}Test 2: List Available Tools{RESET}")
             try:
-                tools_result = await session.list_tools()
+                if isinstance(tools_result, Exception):
+                    raise tools_result
                 tools = tools_result.tools
                 
                 print_success(f"Found {len(tools)} tools")
                 
                 # Check for required tools
-                required_tools = ["lean_goal", "lean_diagnostic_messages"]
-                tool_names = [t.name for t in tools]
+                required_tools = [name for name, _, _ in TOOL_TESTS]
+                required_set = set(required_tools)
+                missing = required_set - {t.name for t in tools}
                 
                 for required_tool in required_tools:
-                    if required_tool in tool_names:
-                        print_success(f"  ✓ {required_tool} available")
-                    else:
+                    if required_tool in missing:
                         print_error(f"  ✗ {required_tool} not found")
                         all_tests_passed = False
+                    else:
+                        print_success(f"  ✓ {required_tool} available")
                 
                 # Show some other available tools
-                other_tools = [t.name for t in tools[:5] if t.name not in required_tools]
+                other_tools = [t.name for t in tools[:5] if t.name not in required_set]
                 if other_tools:
                     print_info(f"Other tools: {', '.join(other_tools)}...")
                     
@@ -123,79 +205,14 @@ async def test_lean_lsp_connection(
                 print_error(f"Failed to list tools: {e}")
                 all_tests_passed = False
             
-            # Test 3: Test lean_goal tool
-            print(f"\n{BLUE}Test 3: Test lean_goal Tool{RESET}")
-            try:
-                # Create a simple Lean file content for testing
-                test_lean_code = """theorem test_theorem : 2 + 2 = 4 := by
-  sorry
-"""
-                
-                print_info("Testing lean_goal with sample theorem...")
-                
-                result = await session.call_tool(
-                    "lean_goal",
-                    arguments={
-                        "file_path": "/tmp/test_goal.lean",
-                        "file_contents": test_lean_code,
-                        "line": 2
-                    }
-                )
-                
-                if result.isError:
-                    # Expected error when no Lean project is configured
-                    print_warning(
-                        f"lean_goal returned an error (expected without Lean project)"
-                    )
-                    if result.content:
-                        error_text = result.content[0].text if hasattr(result.content[0], 'text') else str(result.content[0])
-                        print_info(f"Error: {error_text[:150]}...")
-                else:
-                    print_success("lean_goal tool responded successfully")
-                    if result.content:
-                        content_text = result.content[0].text if hasattr(result.content[0], 'text') else str(result.content[0])
-                        print_info(f"Response length: {len(content_text)} chars")
-                        # Show first 200 chars of response
-                        if content_text:
-                            preview = content_text[:200].replace('\n', ' ')
-                            print_info(f"Response preview: {preview}...")
-            except Exception as e:
-                print_error(f"Failed to test lean_goal: {e}")
-                all_tests_passed = False
-            
-            # Test 4: Test lean_diagnostic_messages tool
-            print(f"\n{BLUE}Test 4: Test lean_diagnostic_messages Tool{RESET}")
-            try:
-                print_info("Testing lean_diagnostic_messages...")
-                
-                result = await session.call_tool(
-                    "lean_diagnostic_messages",
-                    arguments={
-                        "file_path": "/tmp/test_diagnostic.lean",
-                        "file_contents": test_lean_code
-                    }
-                )
-                
-                if result.isError:
-                    # Expected error when no Lean project is configured
-                    print_warning(
-                        f"lean_diagnostic_messages returned an error (expected without Lean project)"
-                    )
-                    if result.content:
-                        error_text = result.content[0].text if hasattr(result.content[0], 'text') else str(result.content[0])
-                        print_info(f"Error: {error_text[:150]}...")
-                else:
-                    print_success("lean_diagnostic_messages tool responded successfully")
-                    if result.content:
-                        content_text = result.content[0].text if hasattr(result.content[0], 'text') else str(result.content[0])
-                        print_info(f"Response length: {len(content_text)} chars")
-                        # Show first 200 chars of response
-                        if content_text:
-                            preview = content_text[:200].replace('\n', ' ')
-                            print_info(f"Response preview: {preview}...")
-            except Exception as e:
-                print_error(f"Failed to test lean_diagnostic_messages: {e}")
-                all_tests_passed = False
+            # Tests 3-4: one per tool in TOOL_TESTS
+            for test_number, ((tool_name, intro, _), result) in enumerate(
+                zip(TOOL_TESTS, tool_results),
+                start=3
+            ):
+                print(f"\n{BLUE}Test {test_number}: Test {tool_name} Tool{RESET}")
+                if not _report_tool_result(tool_name, intro, result):
+                    all_tests_passed = False
                 
     except Exception as e:
         print_error(f"Failed to connect to MCP server: {e}")
@@ -204,8 +221,14 @@ async def test_lean_lsp_connection(
             "--transport streamable-http"
         )
         print_info("Server should be accessible at: " + mcp_url)
+        # Only the innermost frame; the full anyio/httpx stack is noise
         import traceback
-        traceback.print_exc()
+        frames = traceback.extract_tb(e.__traceback__)
+        if frames:
+            last = frames[-1]
+            print_info(
+                f"{type(e).__name__} at {last.filename}:{last.lineno}"
+            )
         return False
     
     # Summary
@@ -231,4 +254,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
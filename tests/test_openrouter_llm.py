@@ -5,39 +5,77 @@ This script tests the connection to OpenRouter API and verifies
 that the LLM model responds correctly.
 """
 
+import asyncio
+import importlib.util
 import os
+import re
 import sys
-from openai import OpenAI
+from typing import Any
 
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+import httpx
 
+from _pretty import (
+    BLUE,
+    RESET,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+)
 
-def print_success(message: str) -> None:
-    """Print success message."""
-    print(f"{GREEN}✓ {message}{RESET}")
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to 1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
+# Config shapes checked before any request is made
+_API_KEY_RE = re.compile(r"^sk-or-v\d+-[A-Za-z0-9]{32,}$")
+_BASE_URL_RE = re.compile(r"^https?://[^\s/]+(/\S*)?$")
 
-def print_error(message: str) -> None:
-    """Print error message."""
-    print(f"{RED}✗ {message}{RESET}")
-
-
-def print_info(message: str) -> None:
-    """Print info message."""
-    print(f"{BLUE}ℹ {message}{RESET}")
+# Static request parameters for Tests 2-4, built once at import; only
+# the model is filled in per run
+SIMPLE_REQUEST: dict[str, Any] = {
+    "messages": [
+        {
+            "role": "user",
+            "content": "What is 2 + 2? Answer with just the number."
+        }
+    ],
+    "temperature": 0.0,
+    "max_tokens": 10
+}
 
+MATH_PROOF_REQUEST: dict[str, Any] = {
+    "messages": [
+        {
+            "role": "user",
+            "content": (
+                "Is this a valid mathematical proof attempt? "
+                "Answer with just VALID or INVALID.\n\n"
+                "Proof: By induction, base case n=1: 1 = 1. "
+                "Assume true for n. For n+1: (n+1) = (n+1). QED."
+            )
+        }
+    ],
+    "temperature": 0.0,
+    "max_tokens": 50
+}
 
-def print_warning(message: str) -> None:
-    """Print warning message."""
-    print(f"{YELLOW}⚠ {message}{RESET}")
+LATEX_CONVERSION_REQUEST: dict[str, Any] = {
+    "messages": [
+        {
+            "role": "user",
+            "content": (
+                "Convert this simple math statement to Lean 4 code. "
+                "Statement: For all natural numbers n, n + 0 = n. "
+                "Provide just the theorem statement."
+            )
+        }
+    ],
+    "temperature": 0.1,
+    "max_tokens": 100
+}
 
 
-def test_openrouter_connection(
+async def test_openrouter_connection(
     api_key: str,
     base_url: str,
     model_name: str
@@ -61,36 +99,83 @@ def test_openrouter_connection(
     print_info(f"Model: {model_name}")
     print_info(f"API Key: {api_key[:10]}..." if api_key else "No API key")
     
+    # One keep-alive pool for all completions; over HTTP/2 the
+    # concurrent requests multiplex over a single connection
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=4,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0)
+    ) as http_client:
+        return await _run_completion_tests(
+            http_client,
+            api_key,
+            base_url,
+            model_name
+        )
+
+
+async def _run_completion_tests(
+    http_client: httpx.AsyncClient,
+    api_key: str,
+    base_url: str,
+    model_name: str
+) -> bool:
+    """
+    Run the OpenRouter tests over a shared HTTP client.
+    
+    Tests 2-4 are independent, so their requests are sent concurrently;
+    results are then checked and reported in order.
+    
+    Args:
+        http_client: Pooled HTTP client for the OpenAI SDK
+        api_key: OpenRouter API key
+        base_url: OpenRouter base URL
+        model_name: Model name to use
+    
+    Returns:
+        bool: True if all tests pass
+    """
+    # Imported here so loading this module does not pull in the SDK
+    from openai import AsyncOpenAI
+    
     all_tests_passed = True
     
     # Test 1: Initialize Client
     print(f"\n{BLUE}Test 1: Initialize OpenRouter Client{RESET}")
     try:
-        client = OpenAI(
+        client = AsyncOpenAI(
             base_url=base_url,
-            api_key=api_key
+            api_key=api_key,
+            http_client=http_client
         )
         print_success("OpenRouter client initialized")
     except Exception as e:
         print_error(f"Failed to initialize client: {e}")
         return False
     
+    print_info("Sending test prompts concurrently...")
+    simple_result, math_result, latex_result = await asyncio.gather(
+        *(
+            client.chat.completions.create(model=model_name, **request)
+            for request in (
+                SIMPLE_REQUEST,
+                MATH_PROOF_REQUEST,
+                LATEX_CONVERSION_REQUEST
+            )
+        ),
+        return_exceptions=True
+    )
+    
     # Test 2: Simple Completion
     print(f"\n{BLUE}Test 2: Simple Completion Test{RESET}")
     try:
-        print_info("Sending test prompt...")
-        
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=[
-                {
-                    "role": "user",
-                    "content": "What is 2 + 2? Answer with just the number."
-                }
-            ],
-            temperature=0.0,
-            max_tokens=10
-        )
+        if isinstance(simple_result, Exception):
+            raise simple_result
+        response = simple_result
         
         answer = response.choices[0].message.content.strip()
         print_success(f"Received response: '{answer}'")
@@ -118,26 +203,10 @@ def test_openrouter_connection(
     # Test 3: Math-related Prompt
     print(f"\n{BLUE}Test 3: Math Proof Validation{RESET}")
     try:
-        print_info("Testing mathematical reasoning...")
-        
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        "Is this a valid mathematical proof attempt? "
-                        "Answer with just VALID or INVALID.\n\n"
-                        "Proof: By induction, base case n=1: 1 = 1. "
-                        "Assume true for n. For n+1: (n+1) = (n+1). QED."
-                    )
-                }
-            ],
-            temperature=0.0,
-            max_tokens=50
-        )
+        if isinstance(math_result, Exception):
+            raise math_result
         
-        answer = response.choices[0].message.content.strip()
+        answer = math_result.choices[0].message.content.strip()
         print_success(f"Model response: '{answer}'")
         
         if "VALID" in answer.upper() or "INVALID" in answer.upper():
@@ -156,25 +225,10 @@ def test_openrouter_connection(
     # Test 4: LaTeX Conversion (simplified)
     print(f"\n{BLUE}Test 4: LaTeX to Lean Conversion Capability{RESET}")
     try:
-        print_info("Testing conversion capability...")
+        if isinstance(latex_result, Exception):
+            raise latex_result
         
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=[
-                {
-                    "role": "user",
-                    "content": (
-                        "Convert this simple math statement to Lean 4 code. "
-                        "Statement: For all natural numbers n, n + 0 = n. "
-                        "Provide just the theorem statement."
-                    )
-                }
-            ],
-            temperature=0.1,
-            max_tokens=100
-        )
-        
-        answer = response.choices[0].message.content.strip()
+        answer = latex_result.choices[0].message.content.strip()
         print_success("Model responded with conversion attempt")
         print_info(f"Response preview: {answer[:100]}...")
         
@@ -217,7 +271,18 @@ def main():
         )
         sys.exit(1)
     
-    success = test_openrouter_connection(api_key, base_url, model_name)
+    # Malformed values would only surface as auth errors or timeouts
+    if not _API_KEY_RE.match(api_key):
+        print_error("OPENROUTER_API_KEY is malformed")
+        print_info("Expected an OpenRouter key of the form sk-or-v1-...")
+        sys.exit(2)
+    if not _BASE_URL_RE.match(base_url):
+        print_error(f"OPENROUTER_BASE_URL is not an http(s) URL: {base_url}")
+        sys.exit(2)
+    
+    success = asyncio.run(
+        test_openrouter_connection(api_key, base_url, model_name)
+    )
     
     sys.exit(0 if success else 1)
 
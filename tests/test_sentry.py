@@ -9,37 +9,28 @@ This script tests:
 """
 
 import os
+import re
 import sys
-import time
-import sentry_sdk
-from sentry_sdk.integrations.logging import LoggingIntegration
+from typing import Any, Optional
 
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+from _pretty import (
+    BLUE,
+    RESET,
+    print_error,
+    print_info,
+    print_success,
+    print_warning,
+)
 
+# Sentry DSN shape: scheme://<public key>@<host>[/<path>]/<project id>
+_DSN_RE = re.compile(r"^https?://[^\s@/]+@[^\s/]+(/\S*)?/\d+$")
 
-def print_success(message: str) -> None:
-    """Print success message."""
-    print(f"{GREEN}✓ {message}{RESET}")
+# Name of the transaction created by Test 4
+TEST_TRANSACTION_NAME = "connection_test"
 
-
-def print_error(message: str) -> None:
-    """Print error message."""
-    print(f"{RED}✗ {message}{RESET}")
-
-
-def print_info(message: str) -> None:
-    """Print info message."""
-    print(f"{BLUE}ℹ {message}{RESET}")
-
-
-def print_warning(message: str) -> None:
-    """Print warning message."""
-    print(f"{YELLOW}⚠ {message}{RESET}")
+# DSN the SDK was initialized with in this process; repeated runs with
+# the same DSN reuse the client, its transport and worker thread
+_sentry_dsn: Optional[str] = None
 
 
 def test_sentry_connection(
@@ -58,6 +49,12 @@ def test_sentry_connection(
     Returns:
         bool: True if all tests pass
     """
+    global _sentry_dsn
+    
+    # Imported here so loading this module does not pull in the SDK
+    import sentry_sdk
+    from sentry_sdk.integrations.logging import LoggingIntegration
+    
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{BLUE}Testing Sentry.io Connection{RESET}")
     print(f"{BLUE}{'='*60}{RESET}\n")
@@ -66,29 +63,61 @@ def test_sentry_connection(
     print_info(f"Environment: {environment}")
     print_info(f"Traces Sample Rate: {traces_sample_rate}")
     
-    all_tests_passed = True
+    def traces_sampler(sampling_context: dict[str, Any]) -> float:
+        # Always keep the test's own transaction so Test 4 is
+        # deterministic; anything else follows the configured rate
+        transaction_context = sampling_context.get(
+            "transaction_context", {}
+        )
+        if transaction_context.get("name") == TEST_TRANSACTION_NAME:
+            return 1.0
+        return traces_sample_rate
     
     # Test 1: Initialize Sentry
     print(f"\n{BLUE}Test 1: Initialize Sentry SDK{RESET}")
     try:
-        sentry_sdk.init(
-            dsn=dsn,
-            environment=environment,
-            traces_sample_rate=traces_sample_rate,
-            attach_stacktrace=True,
-            send_default_pii=False,
-            integrations=[
-                LoggingIntegration(
-                    level=None,
-                    event_level=None
-                )
-            ]
-        )
-        print_success("Sentry SDK initialized")
+        client = sentry_sdk.Hub.current.client
+        if _sentry_dsn == dsn and client is not None:
+            # Per-run settings are read from the options at event time
+            client.options["environment"] = environment
+            client.options["traces_sampler"] = traces_sampler
+            print_success("Reusing initialized Sentry SDK")
+        else:
+            sentry_sdk.init(
+                dsn=dsn,
+                environment=environment,
+                traces_sampler=traces_sampler,
+                attach_stacktrace=True,
+                send_default_pii=False,
+                # Bound the exit-time drain if anything is still queued
+                shutdown_timeout=2,
+                integrations=[
+                    LoggingIntegration(
+                        level=None,
+                        event_level=None
+                    )
+                ]
+            )
+            _sentry_dsn = dsn
+            print_success("Sentry SDK initialized")
     except Exception as e:
         print_error(f"Failed to initialize Sentry: {e}")
         return False
     
+    return _run_capture_tests()
+
+
+def _run_capture_tests() -> bool:
+    """
+    Run the capture tests against the initialized SDK.
+    
+    Returns:
+        bool: True if all tests pass
+    """
+    import sentry_sdk
+    
+    all_tests_passed = True
+    
     # Test 2: Capture Test Message
     print(f"\n{BLUE}Test 2: Capture Test Message{RESET}")
     try:
@@ -132,14 +161,14 @@ def test_sentry_connection(
         
         with sentry_sdk.start_transaction(
             op="test",
-            name="connection_test"
+            name=TEST_TRANSACTION_NAME
         ) as transaction:
-            # Simulate some work
+            # The span only needs to exist, not to take time
             with sentry_sdk.start_span(
                 op="test.operation",
                 description="test operation"
             ):
-                time.sleep(0.1)
+                pass
             
             print_success(
                 f"Transaction created: {transaction.name}"
@@ -156,25 +185,24 @@ def test_sentry_connection(
     try:
         print_info("Setting user context and capturing message...")
         
-        sentry_sdk.set_user({
-            "id": "test-user-123",
-            "username": "test_user",
-            "email": "test@example.com"
-        })
-        
-        sentry_sdk.set_tag("test_type", "connection_test")
-        sentry_sdk.set_tag("service", "moe")
-        
-        event_id = sentry_sdk.capture_message(
-            "MOE Test with Context",
-            level="info"
-        )
+        # A pushed scope is configured in one place and discarded on
+        # exit, so no explicit cleanup is needed
+        with sentry_sdk.push_scope() as scope:
+            scope.user = {
+                "id": "test-user-123",
+                "username": "test_user",
+                "email": "test@example.com"
+            }
+            scope.set_tag("test_type", "connection_test")
+            scope.set_tag("service", "moe")
+            
+            event_id = sentry_sdk.capture_message(
+                "MOE Test with Context",
+                level="info"
+            )
         
         print_success(f"Message with context captured: {event_id}")
         
-        # Clear context
-        sentry_sdk.set_user(None)
-        
     except Exception as e:
         print_error(f"Failed context test: {e}")
         all_tests_passed = False
@@ -184,28 +212,22 @@ def test_sentry_connection(
     try:
         print_info("Adding breadcrumbs...")
         
-        sentry_sdk.add_breadcrumb(
-            category="test",
-            message="Step 1: Initialize test",
-            level="info"
-        )
-        
-        sentry_sdk.add_breadcrumb(
-            category="test",
-            message="Step 2: Execute test logic",
-            level="info"
-        )
-        
-        sentry_sdk.add_breadcrumb(
-            category="test",
-            message="Step 3: Complete test",
-            level="info"
-        )
-        
-        event_id = sentry_sdk.capture_message(
-            "MOE Test with Breadcrumbs",
-            level="info"
-        )
+        with sentry_sdk.push_scope() as scope:
+            for step in (
+                "Step 1: Initialize test",
+                "Step 2: Execute test logic",
+                "Step 3: Complete test",
+            ):
+                scope.add_breadcrumb(
+                    category="test",
+                    message=step,
+                    level="info"
+                )
+            
+            event_id = sentry_sdk.capture_message(
+                "MOE Test with Breadcrumbs",
+                level="info"
+            )
         
         print_success(f"Breadcrumbs captured with event: {event_id}")
         print_info(
@@ -216,10 +238,11 @@ def test_sentry_connection(
         print_error(f"Failed breadcrumb test: {e}")
         all_tests_passed = False
     
-    # Flush to ensure all events are sent
+    # Tests 2-6 only enqueue events; the background transport sends them
+    # over its keep-alive pool, so a single flush drains everything
     print(f"\n{BLUE}Flushing events to Sentry...{RESET}")
     try:
-        sentry_sdk.flush(timeout=5.0)
+        sentry_sdk.flush(timeout=2.0)
         print_success("Events flushed successfully")
         print_info(
             "Please check your Sentry dashboard to verify all events"
@@ -263,6 +286,14 @@ def main():
         )
         sys.exit(1)
     
+    # A malformed DSN would only surface as a transport timeout
+    if not _DSN_RE.match(dsn):
+        print_error("SENTRY_DSN is malformed")
+        print_info(
+            "Expected https://<key>@<host>/<project id>"
+        )
+        sys.exit(2)
+    
     success = test_sentry_connection(dsn, environment, traces_sample_rate)
     
     sys.exit(0 if success else 1)